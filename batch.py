@@ -0,0 +1,373 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from bestiary import find_bestiary_files, load_bestiary_file
+from converter import convert, load_template
+from copies import resolve_copies
+from failures import REPORT_NAME, FailureReport, describe_failure
+from journal import JOURNAL_NAME, Journal, input_hash
+from merge import merge_with_file
+from outputs import FSYNC_MODES, OutputWriter
+from pipeline import StageCache, StageError
+from spells import load_spell_index
+from store import DEFAULT_DATABASE, BestiaryStore
+
+DEFAULT_OUTPUT = "output"
+# Threads that write output files
+WRITERS = 4
+# Stage results each worker keeps warm
+WORKER_CACHE_SIZE = 20000
+# Seconds between progress reports
+PROGRESS_INTERVAL = 5
+
+_cache = None
+# Why init_worker failed, reported for every monster the worker is given
+_initError = None
+
+
+# region WORKERS
+def init_worker():
+    """
+    Loads the template and spell catalog once per worker process and gives it a stage cache
+    """
+    global _cache, _initError
+    try:
+        load_template()
+        load_spell_index()
+    except Exception as error:
+        # Raising would break the pool, and every monster would only be reported as BrokenProcessPool
+        _initError = error
+    _cache = StageCache(limit=WORKER_CACHE_SIZE)
+
+
+def convert_monster(monster: dict, options: dict, mergePath: str = None) -> tuple:
+    """
+    Converts a statblock in a worker process. Returns the character as .gcs text and None, or None and the Failure if
+    the statblock can't be converted. With a mergePath, the conversion is merged into the character sheet already
+    there (see merge.py) and the text is None if the file doesn't need to change
+    """
+    try:
+        if _initError is not None:
+            raise StageError("init", _initError) from _initError
+        character = convert(monster, options, _cache)
+    except Exception as error:
+        return None, describe_failure(monster, error)
+    if mergePath is not None and os.path.exists(mergePath):
+        try:
+            character, stats = merge_with_file(mergePath, character)
+        except Exception as error:
+            return None, describe_failure(monster, error, "merge")
+        if character is None:
+            return None, None
+    return json.dumps(character, indent=4), None
+
+
+# endregion
+
+
+# region FILES
+def read_bestiary(path: str, databasePath: str = None, onError=None) -> list:
+    """
+    Loads the statblocks of a bestiary file with their _copy expanded, using the database for bases in other files.
+    Statblocks whose _copy can't be expanded are passed to onError(monster, error), see resolve_copies
+    """
+    monsters = [monster for monster in load_bestiary_file(path) if "name" in monster]
+    if databasePath is not None and os.path.exists(databasePath):
+        with BestiaryStore(databasePath) as store:
+            return resolve_copies(monsters, store.get, onError)
+    return resolve_copies(monsters, onError=onError)
+
+
+def read_jobs(path: str, databasePath: str, options: dict) -> tuple:
+    """
+    Loads the statblocks of a bestiary file with the hash that identifies their conversion in the journal. Returns
+    them and the Failures of the statblocks that couldn't be expanded
+    """
+    failures = []
+    monsters = read_bestiary(
+        path,
+        databasePath,
+        lambda monster, error: failures.append(
+            describe_failure(monster, error, "copy")
+        ),
+    )
+    return [(monster, input_hash(monster, options)) for monster in monsters], failures
+
+
+# endregion
+
+
+class BatchStats:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.lastProgress = self.started
+        self.files = 0
+        self.converted = 0
+        self.skipped = 0
+        self.unchanged = 0
+        self.failures = FailureReport()
+
+    def report(self) -> str:
+        elapsed = time.perf_counter() - self.started
+        rate = self.converted / elapsed if elapsed > 0 else 0
+        return (
+            "Converted "
+            + str(self.converted)
+            + " monsters from "
+            + str(self.files)
+            + " files in "
+            + str(round(elapsed, 2))
+            + "s ("
+            + str(round(rate, 1))
+            + "/s), "
+            + str(self.skipped)
+            + " already done, "
+            + str(self.unchanged)
+            + " unchanged, "
+            + str(len(self.failures))
+            + " failed"
+        )
+
+    def progress(self):
+        """
+        Prints the throughput so far every PROGRESS_INTERVAL seconds
+        """
+        now = time.perf_counter()
+        if now - self.lastProgress >= PROGRESS_INTERVAL:
+            self.lastProgress = now
+            print(self.report())
+
+
+async def read_inputs(
+    paths,
+    databasePath: str,
+    options: dict,
+    journal: Journal,
+    writer: OutputWriter,
+    convertQueue: asyncio.Queue,
+    stats: BatchStats,
+    workers: int,
+):
+    for path in find_bestiary_files(paths):
+        try:
+            jobs, failures = await asyncio.to_thread(
+                read_jobs, path, databasePath, options
+            )
+        except Exception as error:
+            # An unreadable file only loses its own monsters
+            stats.failures.add(describe_failure({"name": path}, error, "read"))
+            continue
+        stats.files += 1
+        for failure in failures:
+            stats.failures.add(failure)
+        for monster, inputHash in jobs:
+            donePath = journal.done(inputHash)
+            if donePath is not None:
+                writer.claim(donePath)
+                stats.skipped += 1
+                continue
+            # Paths are given out in input order, so collision suffixes are the same in every run
+            outputPath = writer.reserve(monster["name"], monster.get("source", ""))
+            # Waits while the converters are behind, so only a bounded number of statblocks are held
+            await convertQueue.put((monster, inputHash, outputPath))
+    for _ in range(workers):
+        await convertQueue.put(None)
+
+
+async def convert_outputs(
+    pool,
+    options: dict,
+    merge: bool,
+    convertQueue: asyncio.Queue,
+    writeQueue: asyncio.Queue,
+    stats: BatchStats,
+):
+    loop = asyncio.get_running_loop()
+    while True:
+        job = await convertQueue.get()
+        if job is None:
+            return
+        monster, inputHash, outputPath = job
+        try:
+            text, failure = await loop.run_in_executor(
+                pool, convert_monster, monster, options, outputPath if merge else None
+            )
+        except Exception as error:
+            # The worker itself failed, e.g. it ran out of memory
+            text, failure = None, describe_failure(monster, error, "worker")
+        if failure is not None:
+            stats.failures.add(failure)
+            continue
+        await writeQueue.put((monster, inputHash, outputPath, text))
+
+
+def write_output(
+    writer: OutputWriter, journal: Journal, inputHash: str, outputPath: str, text: str
+):
+    # Merges that change nothing leave the file as it is
+    if text is not None:
+        writer.write_to(outputPath, text)
+    # Only recorded once the file is complete, so an interrupted write is redone
+    journal.record(inputHash, outputPath)
+
+
+async def write_outputs(
+    writer: OutputWriter, journal: Journal, writeQueue: asyncio.Queue, stats: BatchStats
+):
+    while True:
+        item = await writeQueue.get()
+        if item is None:
+            return
+        monster, inputHash, outputPath, text = item
+        try:
+            await asyncio.to_thread(
+                write_output, writer, journal, inputHash, outputPath, text
+            )
+        except Exception as error:
+            # e.g. a directory in the way or no permission, it isn't journaled and is retried by the next run
+            stats.failures.add(describe_failure(monster, error, "write"))
+            continue
+        if text is None:
+            stats.unchanged += 1
+        else:
+            stats.converted += 1
+        stats.progress()
+
+
+async def run_batch(
+    paths,
+    outputDir: str = DEFAULT_OUTPUT,
+    options: dict = None,
+    workers: int = None,
+    databasePath: str = DEFAULT_DATABASE,
+    fsync: str = "batch",
+    restart: bool = False,
+    reportPath: str = None,
+    merge: bool = False,
+) -> BatchStats:
+    """
+    Converts every statblock in a list of bestiary files and directories to .gcs files in outputDir. Files are read
+    and written on threads while conversions run on a process pool, with bounded queues between the steps.
+    Conversions finished by an earlier, interrupted run (see journal.py) are skipped unless restart is set. Statblocks
+    that fail to convert don't stop the run, they are written to a report grouped by cause (see failures.py). With
+    merge, existing .gcs files are updated instead of replaced, keeping the changes made to them by hand
+    """
+    workers = workers or os.cpu_count() or 1
+    options = options or {}
+    writer = OutputWriter(outputDir, fsync)
+    # Merging is for re-running a finished batch with a newer converter, so nothing counts as done
+    journal = Journal(os.path.join(outputDir, JOURNAL_NAME), restart or merge)
+    stats = BatchStats()
+    convertQueue = asyncio.Queue(maxsize=workers * 2)
+    writeQueue = asyncio.Queue(maxsize=WRITERS * 2)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+            # If a writer dies, the group cancels the readers and converters instead of leaving them waiting on a
+            # full queue
+            async with asyncio.TaskGroup() as group:
+                for _ in range(WRITERS):
+                    group.create_task(write_outputs(writer, journal, writeQueue, stats))
+                await asyncio.gather(
+                    read_inputs(
+                        paths,
+                        databasePath,
+                        options,
+                        journal,
+                        writer,
+                        convertQueue,
+                        stats,
+                        workers,
+                    ),
+                    *[
+                        convert_outputs(
+                            pool, options, merge, convertQueue, writeQueue, stats
+                        )
+                        for _ in range(workers)
+                    ],
+                )
+                for _ in range(WRITERS):
+                    await writeQueue.put(None)
+    except ExceptionGroup as error:
+        raise error.exceptions[0]
+    finally:
+        # What was finished is kept, so the next run resumes from there
+        await asyncio.to_thread(writer.close)
+        journal.close(fsync != "none")
+        if stats.failures:
+            stats.failures.write(reportPath or os.path.join(outputDir, REPORT_NAME))
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Converts every statblock in 5etools bestiary files to .gcs files"
+    )
+    parser.add_argument(
+        "paths", nargs="+", help="Bestiary files or directories of them"
+    )
+    parser.add_argument(
+        "--output", default=DEFAULT_OUTPUT, help="Directory to write the .gcs files to"
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Worker processes (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--db", default=DEFAULT_DATABASE, help="Database to look up _copy bases in"
+    )
+    parser.add_argument(
+        "--combat-reflexes",
+        action="store_true",
+        help="The monsters are battle-hardened and get Combat Reflexes",
+    )
+    parser.add_argument(
+        "--fsync",
+        choices=FSYNC_MODES,
+        default="batch",
+        help="Flush each file to disk as it is written, all of them at the end of the run (default) or not at all",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Convert everything again instead of resuming from the journal of an earlier run",
+    )
+    parser.add_argument(
+        "--report",
+        help="Where to write the report of failed conversions (default: "
+        + REPORT_NAME
+        + " in the output directory)",
+    )
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="Update existing .gcs files instead of replacing them, keeping the changes made to them by hand",
+    )
+    args = parser.parse_args(argv)
+    stats = asyncio.run(
+        run_batch(
+            args.paths,
+            args.output,
+            {"combatReflexes": args.combat_reflexes},
+            args.workers,
+            args.db,
+            args.fsync,
+            args.restart,
+            args.report,
+            args.merge,
+        )
+    )
+    print(stats.report())
+    if stats.failures:
+        print(
+            "Most frequent failures, see "
+            + (args.report or os.path.join(args.output, REPORT_NAME))
+            + ":"
+        )
+        print(stats.failures.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+import json
+import os
+from array import array
+from itertools import compress
+
+from crtable import lookup_cr, parse_cr_value
+
+ABILITIES = ["str", "dex", "con", "int", "wis", "cha"]
+
+
+# region LOADING
+def load_bestiary_file(path: str) -> list:
+    """
+    Loads the statblocks from a file. Accepts 5etools bestiary files ({"monster": [...]}), lists of statblocks and single statblocks
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if type(data) == list:
+        return data
+    if "monster" in data:
+        return data["monster"]
+    return [data]
+
+
+def find_bestiary_files(paths) -> list:
+    """
+    Expands a list of files and directories into the json files they contain
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                for name in sorted(names):
+                    if name.endswith(".json"):
+                        files.append(os.path.join(root, name))
+        else:
+            files.append(path)
+    return files
+
+
+def load_bestiaries(paths) -> list:
+    """
+    Loads every statblock from a list of files and directories
+    """
+    monsters = []
+    for path in find_bestiary_files(paths):
+        monsters.extend(load_bestiary_file(path))
+    return monsters
+
+
+def monster_type(monster: dict) -> str:
+    """
+    Returns the creature type of a statblock in lower case. Types with a choice ("undead or fiend") use the first option
+    """
+    creatureType = monster.get("type", "")
+    if type(creatureType) == dict:
+        creatureType = creatureType.get("type", "")
+    if type(creatureType) == dict:
+        creatureType = creatureType.get("choose", [""])[0]
+    return creatureType.lower()
+
+
+# endregion
+
+
+# region INDEX
+class BestiaryIndex:
+    """
+    Columnar index over loaded statblocks for selecting monsters before conversion.
+
+    Challenge ratings and ability scores are stored one byte per row so that range filters are a single
+    bytes.translate over the column. Sources, types, sizes, flags and action names are stored as posting
+    lists of rows. Every filter produces a mask with one byte per row, and masks are combined with a
+    single integer AND.
+    """
+
+    def __init__(self, monsters=()):
+        self.monsters = []
+        self.names = []
+        self.sourceNames = []
+        self.sources = array("H")
+        # Distinct challenge ratings, the cr column stores positions in this list
+        self.crValues = []
+        self._crCodes = {}
+        self.crs = bytearray()
+        self.abilities = {ability: bytearray() for ability in ABILITIES}
+        self._sourceCodes = {}
+        self._postings = {}
+        for monster in monsters:
+            self.add(monster)
+
+    def __len__(self):
+        return len(self.monsters)
+
+    def _post(self, column: str, value: str, row: int):
+        key = (column, value)
+        if key not in self._postings:
+            self._postings[key] = array("I")
+        self._postings[key].append(row)
+
+    def add(self, monster: dict) -> int:
+        """
+        Adds a statblock to the index and returns its row
+        """
+        row = len(self.monsters)
+        self.monsters.append(monster)
+        self.names.append(monster.get("name", ""))
+
+        source = monster.get("source", "")
+        if source not in self._sourceCodes:
+            self._sourceCodes[source] = len(self.sourceNames)
+            self.sourceNames.append(source)
+        self.sources.append(self._sourceCodes[source])
+        self._post("source", source.lower(), row)
+
+        crValue = lookup_cr(monster.get("cr"))["value"]
+        if crValue not in self._crCodes:
+            if len(self.crValues) == 256:
+                raise ValueError("Too many distinct challenge ratings to index")
+            self._crCodes[crValue] = len(self.crValues)
+            self.crValues.append(crValue)
+        self.crs.append(self._crCodes[crValue])
+
+        for ability in ABILITIES:
+            score = monster.get(ability, 10)
+            if type(score) != int:
+                # Some statblocks have special scores like {"special": "..."}
+                score = 0
+            self.abilities[ability].append(min(max(score, 0), 255))
+
+        self._post("type", monster_type(monster), row)
+        for size in monster.get("size", []):
+            self._post("size", size, row)
+        if "spellcasting" in monster:
+            self._post("has", "spellcasting", row)
+        if "legendary" in monster:
+            self._post("has", "legendary", row)
+        for action in monster.get("action", []):
+            if "name" in action:
+                self._post("action", action["name"].lower(), row)
+        return row
+
+    def _posting_mask(self, column: str, value: str) -> int:
+        mask = bytearray(len(self.monsters))
+        for row in self._postings.get((column, value), ()):
+            mask[row] = 1
+        return int.from_bytes(mask, "little")
+
+    def _range_mask(self, column: bytearray, values, low, high) -> int:
+        # values[code] is the value represented by byte code in the column
+        table = bytearray(256)
+        for code, value in enumerate(values):
+            if value is None:
+                continue
+            if (low is None or value >= low) and (high is None or value <= high):
+                table[code] = 1
+        return int.from_bytes(column.translate(table), "little")
+
+    def select_rows(
+        self,
+        source=None,
+        type=None,
+        size=None,
+        min_cr=None,
+        max_cr=None,
+        spellcasting=None,
+        legendary=None,
+        action=None,
+        abilities=None,
+    ) -> list:
+        """
+        Returns the rows matching every given filter. Challenge ratings may be numbers or strings like "1/4",
+        abilities maps ability names to (min, max) score ranges and spellcasting/legendary select monsters with
+        (True) or without (False) that section
+        """
+        rowCount = len(self.monsters)
+        masks = []
+        if source is not None:
+            masks.append(self._posting_mask("source", source.lower()))
+        if type is not None:
+            masks.append(self._posting_mask("type", type.lower()))
+        if size is not None:
+            masks.append(self._posting_mask("size", size.upper()))
+        if action is not None:
+            masks.append(self._posting_mask("action", action.lower()))
+        if min_cr is not None or max_cr is not None:
+            if isinstance(min_cr, str):
+                min_cr = parse_cr_value(min_cr)
+            if isinstance(max_cr, str):
+                max_cr = parse_cr_value(max_cr)
+            masks.append(self._range_mask(self.crs, self.crValues, min_cr, max_cr))
+        if abilities:
+            for ability, (low, high) in abilities.items():
+                masks.append(
+                    self._range_mask(self.abilities[ability], range(256), low, high)
+                )
+        # Monsters without a section are selected by inverting the mask of monsters with it
+        allRows = int.from_bytes(b"\x01" * rowCount, "little")
+        for flag, wanted in (("spellcasting", spellcasting), ("legendary", legendary)):
+            if wanted is None:
+                continue
+            mask = self._posting_mask("has", flag)
+            masks.append(mask if wanted else allRows & ~mask)
+
+        selected = allRows
+        for mask in masks:
+            selected &= mask
+        return list(compress(range(rowCount), selected.to_bytes(rowCount, "little")))
+
+    def select(self, **filters) -> list:
+        """
+        Returns the statblocks matching every given filter (see select_rows)
+        """
+        return [self.monsters[row] for row in self.select_rows(**filters)]
+
+
+# endregion
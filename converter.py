@@ -1,8 +1,34 @@
+import argparse
+import copy
 import json
-import math
+import os
 import uuid
 import jsons
 import re
+import sys
+from bestiary import (
+    BestiaryIndex,
+    find_bestiary_files,
+    load_bestiaries,
+    load_bestiary_file,
+)
+from copies import resolve_copies
+from crtable import lookup_cr
+from defenses import build_defense_traits
+from languages import build_language_traits
+from markup import MarkupBudgetExceeded, TagParser, flatten_entries, strip_tags
+from merge import assign_stable_ids, mark_generated, merge_with_file
+from outputs import OutputWriter, write_atomic
+from pipeline import Stage, StageCache, StageError, fragment_attribute, run_stages
+from senses import build_sense_traits
+from spells import SPELL_CATALOG, build_spell, lookup_spell
+from statblock import ability_modifier, parse_statblock
+from store import DEFAULT_DATABASE, BestiaryStore
+from unmapped import CoverageRecorder, record_unmapped
+
+# The directory the converter and its data files are in, so it can be run from anywhere
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE = os.path.join(SOURCE_DIR, "default.json")
 
 
 # region HELPER FUNCTIONS
@@ -110,10 +136,136 @@ def saving_throws_to_gurps(save_throw: int) -> int:
     return dc
 
 
+# region TAG HANDLERS
+# Limits for a single description, see convert_to_gurps
+MAX_DESCRIPTION_LENGTH = 50000
+DESCRIPTION_TIME_BUDGET = 0.25
+# Converted descriptions kept by convert_descriptions
+DESCRIPTION_CACHE_SIZE = 8192
+_descriptionCache = {}
+
+ATTACK_TYPES = {
+    "mw": "Melee Weapon Attack,",
+    "rw": "Ranged Weapon Attack,",
+    "ms": "Melee Spell Attack,",
+    "rs": "Ranged Spell Attack,",
+    "mw,rw": "Melee or Ranged Weapon Attack,",
+    "ms,rs": "Melee or Ranged Spell Attack,",
+}
+AVERAGE_DAMAGE = re.compile(r"\d{1,6}\s\($")
+CLOSING_PARENTHESIS = re.compile(r"\)")
+SAVE_ROLL = re.compile(r" (\w{2}) roll")
+
+
+def dice_to_gurps(dice_roll: str) -> str:
+    """
+    Converts a dice roll like 2d6 + 3 to a comparable GURPS damage roll, or leaves it as is if it can't be parsed
+    """
+    dice_roll = " + ".join(term.strip() for term in dice_roll.split("+"))
+    try:
+        return damage_to_gurps(expected_value(dice_roll))
+    except ValueError:
+        return dice_roll
+
+
+def damage_tag(parser, tag, parts):
+    # "X ({@damage YdZ})" is replaced entirely, dropping the 5e average X
+    if parser.peek(CLOSING_PARENTHESIS) and parser.trim_output(AVERAGE_DAMAGE):
+        parser.consume(CLOSING_PARENTHESIS)
+    return dice_to_gurps(parts[0])
+
+
+def hit_tag(parser, tag, parts):
+    try:
+        return hit_mod_to_gurps(int(parts[0]))
+    except ValueError:
+        return parts[0]
+
+
+def dc_tag(parser, tag, parts):
+    try:
+        penalty = str(saving_throws_to_gurps(int(parts[0])))
+    except ValueError:
+        return "DC " + parts[0]
+    # "{@dc X} ST roll" becomes "ST - X roll"
+    save = parser.consume(SAVE_ROLL)
+    if save is not None:
+        return save.group(1) + " - " + penalty + " roll"
+    return "DC " + parts[0] + " (-" + penalty + ")"
+
+
+def d20_tag(parser, tag, parts):
+    if len(parts) > 1 and parts[1]:
+        return parts[1]
+    if parts[0].startswith("-"):
+        return parts[0]
+    return "+" + parts[0]
+
+
+def chance_tag(parser, tag, parts):
+    if len(parts) > 1 and parts[1]:
+        return parts[1]
+    return parts[0] + " percent"
+
+
+def recharge_tag(parser, tag, parts):
+    if parts[0] and parts[0] != "6":
+        return "(Recharge " + parts[0] + "-6)"
+    return "(Recharge 6)"
+
+
+GURPS_TAG_HANDLERS = {
+    "h": lambda parser, tag, parts: "",
+    "m": lambda parser, tag, parts: "Miss: ",
+    "hom": lambda parser, tag, parts: "Hit or Miss: ",
+    "atk": lambda parser, tag, parts: ATTACK_TYPES.get(parts[0], "Attack,"),
+    "hitYourSpellAttack": lambda parser, tag, parts: "your spell attack bonus",
+    "damage": damage_tag,
+    "hit": hit_tag,
+    "dc": dc_tag,
+    "recharge": recharge_tag,
+    "d20": d20_tag,
+    "chance": chance_tag,
+}
+# endregion
+
+
+def render_gurps_tags(text: str) -> tuple:
+    """
+    Replaces the tags in text with GURPS_TAG_HANDLERS and returns it with the names of the tags that have neither a
+    handler nor display text. Text that takes too long falls back to plain text so one bad homebrew entry can't stall
+    a batch
+    """
+    parser = TagParser(GURPS_TAG_HANDLERS, DESCRIPTION_TIME_BUDGET)
+    try:
+        return parser.parse(text), parser.unhandled
+    except MarkupBudgetExceeded:
+        return strip_tags(text), []
+
+
+def record_unmapped_tags(tags: list):
+    for tag in tags:
+        record_unmapped("tag", tag)
+
+
 def convert_to_gurps(description: str) -> str:
     """
     Converts a D&D 5e description to a GURPS description
     """
+    description, unhandled = convert_description(description)
+    record_unmapped_tags(unhandled)
+    return description
+
+
+def convert_description(description: str) -> tuple:
+    """
+    Returns the GURPS description for a D&D 5e description and the tags in it that have no handler (see
+    render_gurps_tags)
+    """
+    # Overly long (usually malformed) descriptions are cut off
+    if len(description) > MAX_DESCRIPTION_LENGTH:
+        description = description[:MAX_DESCRIPTION_LENGTH] + " [...]"
+
     # Replace all instances of " advantage" or "Advantage" with " +3" or "+3"
     description = description.replace(" advantage", " +3")
     description = description.replace("Advantage", "+3")
@@ -152,49 +304,8 @@ def convert_to_gurps(description: str) -> str:
     description = description.replace("Charisma saving throw", "WL roll")
     description = description.replace("Charisma Saving Throw", "WL roll")
 
-    # Replace all instances of {@h} with ""
-    description = description.replace("{@h}", "")
-
-    # Replace all instances of {@atk mw} with "Melee Weapon Attack,"
-    description = description.replace("{@atk mw}", "Melee Weapon Attack,")
-
-    # Replace all instances of {@atk rw} with "Ranged Weapon Attack,"
-    description = description.replace("{@atk rw}", "Ranged Weapon Attack,")
-
-    # Replace all instances of "{@condition text}" with text
-    pattern = r"\{@condition (.+?)\}"
-    description = re.sub(pattern, r"\1", description)
-
-    # Replace all instances of "{@spell text}" with text
-    pattern = r"\{@spell (.+?)\}"
-    description = re.sub(pattern, r"\1", description)
-
-    # Replace all instances of "X ({@damage YdZ})" or "X ({@damage YdZ + W})" with "YdZ" or "YdZ + W" where W, X, Y, Z are any integer
-    pattern = r"\d+\s\({@damage (.+?)\}\)"
-    description = re.sub(
-        pattern,
-        lambda match: damage_to_gurps(expected_value(match.group(1))),
-        description,
-    )
-
-    # Replace all "{@hit X} with X
-    pattern = r"\{@hit (.+?)\}"
-    description = re.sub(
-        pattern,
-        lambda match: hit_mod_to_gurps(int(match.group(1))),
-        description,
-    )
-
-    # Replace all "{@dc X} ST roll" where X is any integer and ST can be any string of length 2 with "ST - X roll"
-    pattern = r"\{@dc (\d+)\} (\w{2}) roll"
-    description = re.sub(
-        pattern,
-        lambda match: match.group(2)
-        + " - "
-        + str(saving_throws_to_gurps(int(match.group(1))))
-        + " roll",
-        description,
-    )
+    # Replace all {@tag} markup, e.g. "{@dc X} ST roll" with "ST - X roll", "X ({@damage YdZ})" with the GURPS damage and "{@condition text}" with text
+    description, unhandled = render_gurps_tags(description)
 
     # pattern = r"\b(\d+)[dD](\d+)\b"
     # description = re.sub(
@@ -213,104 +324,248 @@ def convert_to_gurps(description: str) -> str:
 
     # Saving throw DC -> comparable GURPS DC
 
-    return description
+    return description, unhandled
+
+
+def convert_name(name: str) -> str:
+    """
+    Replaces the tags in the name of an action, trait or spellcasting entry, e.g. "Blinding Spittle {@recharge 5}"
+    becomes "Blinding Spittle (Recharge 5-6)"
+    """
+    if "{@" not in name:
+        return name
+    name, unhandled = render_gurps_tags(name)
+    record_unmapped_tags(unhandled)
+    return name
+
+
+def convert_descriptions(descriptions: list) -> list:
+    """
+    Converts a batch of descriptions with convert_to_gurps. Each distinct description is only converted once, and the
+    results are cached across monsters since statblocks repeat a lot of text ("Multiattack", "Legendary Resistance").
+    The tags without a handler are cached with them, so they are recorded for every monster that uses the text
+    """
+    converted = []
+    for description in descriptions:
+        if description not in _descriptionCache:
+            if len(_descriptionCache) >= DESCRIPTION_CACHE_SIZE:
+                _descriptionCache.clear()
+            _descriptionCache[description] = convert_description(description)
+        text, unhandled = _descriptionCache[description]
+        record_unmapped_tags(unhandled)
+        converted.append(text)
+    return converted
 
 
 # endregion
-def run_convert(input_data, user_input: str):
-    # region LOADING DATA
 
-    # Load default file
-    with open("default.json", "r") as f:
-        default_data = json.load(f)
-    # endregion
 
-    # PROCESSING DATA
+# region TEMPLATE
+_template_cache = {}
+
+
+def build_attribute_index(template: dict) -> dict:
+    """
+    Maps each attr_id in a template (st, dx, iq, ht, hp, fp, basic_move, ...) to its slot in the attributes list
+    """
+    return {
+        attribute["attr_id"]: slot
+        for slot, attribute in enumerate(template["attributes"])
+    }
+
+
+def load_template(path: str = TEMPLATE):
+    """
+    Returns a fresh copy of the template at path and its attribute index. The file is only parsed and indexed the first time it is requested
+    """
+    if path not in _template_cache:
+        with open(path, "r") as f:
+            text = f.read()
+        _template_cache[path] = (text, build_attribute_index(json.loads(text)))
+    text, attrIndex = _template_cache[path]
+    # Decoding the JSON again is a much cheaper copy than deepcopy
+    return json.loads(text), attrIndex
+
+
+# endregion
+
+
+# region ACTION TRAITS
+# Text put before the description of each kind of action
+ACTION_NOTE_PREFIXES = {
+    "action": "",
+    "legendary": "For 1 fp, the following can be done following the turn of another creature. ",
+    "bonus": "For 1 fp do the following on your turn in addition to a maneuver. ",
+    "reaction": "For 1 fp, the following can be done following the turn of another creature. ",
+}
+
+
+def build_action_traits(sections: list) -> list:
+    """
+    Builds the action traits for a list of (section, actions) pairs, where section is a key of ACTION_NOTE_PREFIXES
+    and actions are statblock.Action records.
+    All descriptions are converted in one batch
+    """
+    actions = [
+        (section, action)
+        for section, sectionActions in sections
+        for action in sectionActions
+    ]
+    notes = convert_descriptions(
+        [flatten_entries(action.entries) for _, action in actions]
+    )
+    traits = []
+    for (section, action), note in zip(actions, notes):
+        traits.append(
+            {
+                "id": str(uuid.uuid4()),
+                "type": "action",
+                "name": convert_name(action.name),
+                "notes": ACTION_NOTE_PREFIXES[section] + note,
+                "base_points": 5,
+                "calc": {"points": 5},
+            }
+        )
+    return traits
+
+
+# endregion
 
-    # Proficiency Bonus
-    if "cr" in input_data:
-        if type(input_data["cr"]) == dict:
-            profString = input_data["cr"]["cr"]
-        else:
-            profString = input_data["cr"]
-        if profString == "0":
-            profBonus = 2
-        elif profString == "1/8":
-            profBonus = 2
-        elif profString == "1/4":
-            profBonus = 2
-        elif profString == "1/2":
-            profBonus = 2
-        else:
-            profBonus = math.ceil(float(profString) / 4) + 1
-    else:
-        profBonus = 2
 
+# region CONVERSION STAGES
+def attributes_stage(monster, default_data: dict, options: dict):
+    """
+    Sets the name and ST, DX, IQ and HT from the ability scores
+    """
     # Update default data with name from input data
-    creature_name = input_data["name"]
+    creature_name = monster.name
     default_data["profile"]["name"] = creature_name
 
     # Update default data with attributes from input data
-    for attribute in default_data["attributes"]:
-        if attribute["attr_id"] == "st":
-            strAd = math.floor((input_data["str"] - 10) / 2)
-            attribute["adj"] = strAd
-            attribute["calc"]["points"] = strAd * 10
-            attribute["calc"]["value"] = 10 + strAd
-
-        if attribute["attr_id"] == "dx":
-            dexAd = math.floor((input_data["dex"] - 10) / 2)
-            attribute["adj"] = dexAd
-            attribute["calc"]["points"] = dexAd * 20
-            attribute["calc"]["value"] = 10 + dexAd
-
-        if attribute["attr_id"] == "iq":
-            iqAd = max(
-                math.floor((input_data["int"] - 10) / 2),
-                math.floor((input_data["wis"] - 10) / 2),
-            )
-            attribute["adj"] = iqAd
-            attribute["calc"]["points"] = iqAd * 20
-            attribute["calc"]["value"] = 10 + iqAd
-
-        if attribute["attr_id"] == "ht":
-            conAdd = math.floor((input_data["con"] - 10) / 2)
-            attribute["adj"] = conAdd
-            attribute["calc"]["points"] = conAdd * 10
-            attribute["calc"]["value"] = 10 + conAdd
-            if input_data["con"] >= 14:
-                # region High Pain Threshold Trait
-                highPainThreshold = {
-                    "id": str(uuid.uuid4()),  # Generate a new unique ID
-                    "type": "trait",
-                    "name": "High Pain Threshold",
-                    "reference": "B59",
-                    "notes": "Never suffer shock penalties when injured",
-                    "tags": ["Advantage", "Physical"],
-                    "base_points": 10,
-                    "features": [
-                        {
-                            "type": "conditional_modifier",
-                            "situation": "on all HT rolls to avoid knockdown and stunning",
-                            "amount": 3,
-                        },
-                        {
-                            "type": "conditional_modifier",
-                            "situation": "to resist torture",
-                            "amount": 3,
-                        },
-                    ],
-                    "calc": {"points": 10},
-                }
-                # endregion
+    strAd = ability_modifier(monster.abilities.strength)
+    stAttribute = fragment_attribute(default_data, "st")
+    stAttribute["adj"] = strAd
+    stAttribute["calc"]["points"] = strAd * 10
+    stAttribute["calc"]["value"] = 10 + strAd
+
+    dexAd = ability_modifier(monster.abilities.dexterity)
+    dxAttribute = fragment_attribute(default_data, "dx")
+    dxAttribute["adj"] = dexAd
+    dxAttribute["calc"]["points"] = dexAd * 20
+    dxAttribute["calc"]["value"] = 10 + dexAd
+
+    iqAd = max(
+        ability_modifier(monster.abilities.intelligence),
+        ability_modifier(monster.abilities.wisdom),
+    )
+    iqAttribute = fragment_attribute(default_data, "iq")
+    iqAttribute["adj"] = iqAd
+    iqAttribute["calc"]["points"] = iqAd * 20
+    iqAttribute["calc"]["value"] = 10 + iqAd
+
+    conAdd = ability_modifier(monster.abilities.constitution)
+    htAttribute = fragment_attribute(default_data, "ht")
+    htAttribute["adj"] = conAdd
+    htAttribute["calc"]["points"] = conAdd * 10
+    htAttribute["calc"]["value"] = 10 + conAdd
+    if monster.abilities.constitution >= 14:
+        # region High Pain Threshold Trait
+        highPainThreshold = {
+            "id": str(uuid.uuid4()),  # Generate a new unique ID
+            "type": "trait",
+            "name": "High Pain Threshold",
+            "reference": "B59",
+            "notes": "Never suffer shock penalties when injured",
+            "tags": ["Advantage", "Physical"],
+            "base_points": 10,
+            "features": [
+                {
+                    "type": "conditional_modifier",
+                    "situation": "on all HT rolls to avoid knockdown and stunning",
+                    "amount": 3,
+                },
+                {
+                    "type": "conditional_modifier",
+                    "situation": "to resist torture",
+                    "amount": 3,
+                },
+            ],
+            "calc": {"points": 10},
+        }
+        # endregion
+
+        default_data["traits"].append(highPainThreshold)
 
-                default_data["traits"].append(highPainThreshold)
+
+def size_stage(monster, default_data: dict, options: dict):
+    """
+    Sets the size modifier and the ST and HP bonus of large creatures
+    """
+    # Give Size/Strength Bonus depending on character size
+    if monster.size is not None:
+        stAttribute = fragment_attribute(default_data, "st")
+        hpAttribute = fragment_attribute(default_data, "hp")
+        if monster.size == "M":
+            default_data["profile"]["SM"] = 0
+        elif monster.size == "S":
+            default_data["profile"]["SM"] = -1
+        elif monster.size == "T":
+            default_data["profile"]["SM"] = -4
+        elif monster.size == "L":
+            default_data["profile"]["SM"] = 2
+            stAttribute["adj"] = stAttribute["adj"] + 1
+            hpAttribute["adj"] = hpAttribute["adj"] + 10
+        elif monster.size == "H":
+            default_data["profile"]["SM"] = 3
+            stAttribute["adj"] = stAttribute["adj"] + 2
+            hpAttribute["adj"] = hpAttribute["adj"] + 20
+        elif monster.size == "G":
+            default_data["profile"]["SM"] = 4
+            stAttribute["adj"] = stAttribute["adj"] + 3
+            hpAttribute["adj"] = hpAttribute["adj"] + 30
+
+    # Size and Health Benefits from Size
+
+    # Extra Health
+
+
+# 5e skills that skills_stage converts, the rest are recorded as unmapped
+MAPPED_SKILLS = {
+    "acrobatics",
+    "animal handling",
+    "arcana",
+    "athletics",
+    "deception",
+    "history",
+    "insight",
+    "intimidation",
+    "investigation",
+    "medicine",
+    "nature",
+    "perception",
+    "performance",
+    "persuasion",
+    "religion",
+    "sleight of hand",
+    "stealth",
+    "survival",
+}
+
+
+def skills_stage(monster, default_data: dict, options: dict):
+    """
+    Adds the GURPS skills for the statblock's skills, and Diplomacy and Fast-Talk for charismatic creatures
+    """
+    profBonus = monster.profBonus
+    strAd = ability_modifier(monster.abilities.strength)
+    dexAd = ability_modifier(monster.abilities.dexterity)
+    charAd = ability_modifier(monster.abilities.charisma)
 
     # Give default persuasion and deception if charisma is high enough and no profieciency is given
-    charAd = math.floor((input_data["cha"] - 10) / 2)
+    charAd = ability_modifier(monster.abilities.charisma)
     if charAd > 0:
         #  If Pesuasion is not in the stat-block, Diplomacy is added
-        if "skill" not in input_data or "persuasion" not in input_data["skill"]:
+        if "persuasion" not in monster.skills:
             # region Diplomacy Skill
             diplomacySkill = {
                 "id": str(uuid.uuid4()),
@@ -336,7 +591,7 @@ def run_convert(input_data, user_input: str):
             # endregion
             default_data["skills"].append(diplomacySkill)
         # If Deception is not in the statblock, fast-talk is added
-        if "skill" not in input_data or "deception" not in input_data["skill"]:
+        if "deception" not in monster.skills:
             # region Fast-Talk Skill
             fastTalkSkill = {
                 "id": str(uuid.uuid4()),
@@ -362,44 +617,9 @@ def run_convert(input_data, user_input: str):
             # endregion
             default_data["skills"].append(fastTalkSkill)
 
-    # Give Size/Strength Bonus depending on character size
-    if "size" in input_data:
-        if input_data["size"][0] == "M":
-            default_data["profile"]["SM"] = 0
-        elif input_data["size"][0] == "S":
-            default_data["profile"]["SM"] = -1
-        elif input_data["size"][0] == "T":
-            default_data["profile"]["SM"] = -4
-        elif input_data["size"][0] == "L":
-            default_data["profile"]["SM"] = 2
-            default_data["attributes"][0]["adj"] = (
-                default_data["attributes"][0]["adj"] + 1
-            )
-            default_data["attributes"][14]["adj"] = (
-                default_data["attributes"][14]["adj"] + 10
-            )
-        elif input_data["size"][0] == "H":
-            default_data["profile"]["SM"] = 3
-            default_data["attributes"][0]["adj"] = (
-                default_data["attributes"][0]["adj"] + 2
-            )
-            default_data["attributes"][14]["adj"] = (
-                default_data["attributes"][14]["adj"] + 20
-            )
-        elif input_data["size"][0] == "G":
-            default_data["profile"]["SM"] = 4
-            default_data["attributes"][0]["adj"] = (
-                default_data["attributes"][0]["adj"] + 3
-            )
-            default_data["attributes"][14]["adj"] = (
-                default_data["attributes"][14]["adj"] + 30
-            )
     # Give climbing and acrobatics if character has acrobatics
-    if "skill" in input_data and "acrobatics" in input_data["skill"]:
-        acrobatics_modifier_string = input_data["skill"]["acrobatics"]
-        acrobatics_modifier = int(
-            acrobatics_modifier_string.replace("+", "")
-        )  # Remove '+' sign
+    if "acrobatics" in monster.skills:
+        acrobatics_modifier = monster.skills["acrobatics"]
         points = convert_modifier_to_points(acrobatics_modifier - dexAd)
 
         # region Climbing Skill
@@ -452,11 +672,8 @@ def run_convert(input_data, user_input: str):
         default_data["skills"].append(acrobaticsSkill)
 
     # Give animal handling (general) and riding if character has Animal Handling. Give Veterinary if character has high Animal Handling
-    if "skill" in input_data and "animal handling" in input_data["skill"]:
-        animalHandling_modifier_string = input_data["skill"]["animal handling"]
-        animalHandling_modifier = int(
-            animalHandling_modifier_string.replace("+", "")
-        )  # Remove '+' sign
+    if "animal handling" in monster.skills:
+        animalHandling_modifier = monster.skills["animal handling"]
         points = convert_modifier_to_points(profBonus)
 
         # region Animal Handling Skill
@@ -546,7 +763,7 @@ def run_convert(input_data, user_input: str):
             default_data["skills"].append(veterinarySkill)
 
     # Give Thaumatology and Occultism if the character has Arcana
-    if "skill" in input_data and "arcana" in input_data["skill"]:
+    if "arcana" in monster.skills:
         points = convert_modifier_to_points(profBonus)
 
         # region Thaumatology Skill
@@ -594,14 +811,11 @@ def run_convert(input_data, user_input: str):
         default_data["skills"].append(occultismSkill)
 
     # Give Climbing, Hiking, Brawling, and Running if the chracter has Athletics. Climbing is only added if the character doesn't have acrobatics
-    if "skill" in input_data and "athletics" in input_data["skill"]:
-        athletics_modifier_string = input_data["skill"]["athletics"]
-        athletics_modifier = int(
-            athletics_modifier_string.replace("+", "")
-        )  # Remove '+' sign
+    if "athletics" in monster.skills:
+        athletics_modifier = monster.skills["athletics"]
         points = convert_modifier_to_points(athletics_modifier - strAd)
 
-        if "acrobatics" not in input_data["skill"]:
+        if "acrobatics" not in monster.skills:
             # region Climbing Skill
             climbingSkill = {
                 "id": str(uuid.uuid4()),
@@ -693,11 +907,8 @@ def run_convert(input_data, user_input: str):
         default_data["skills"].append(runningSkill)
 
     # Give Fast-Talk if the character has Deception
-    if "skill" in input_data and "deception" in input_data["skill"]:
-        deception_modifier_string = input_data["skill"]["deception"]
-        deception_modifier = int(
-            deception_modifier_string.replace("+", "")
-        )  # Remove '+' sign
+    if "deception" in monster.skills:
+        deception_modifier = monster.skills["deception"]
         points = convert_modifier_to_points(deception_modifier - charAd)
 
         # region Fast-Talk Skill
@@ -726,7 +937,7 @@ def run_convert(input_data, user_input: str):
         default_data["skills"].append(fastTalkSkill)
 
     # Give History (General) if the character has History
-    if "skill" in input_data and "history" in input_data["skill"]:
+    if "history" in monster.skills:
         points = convert_modifier_to_points(profBonus)
 
         # region History (General) Skill
@@ -753,7 +964,7 @@ def run_convert(input_data, user_input: str):
         default_data["skills"].append(historyGeneralSkill)
 
     # Give Detect Lie if the characters have Insight
-    if "skill" in input_data and "insight" in input_data["skill"]:
+    if "insight" in monster.skills:
         points = convert_modifier_to_points(profBonus)
 
         # region Detect Lies Skill
@@ -783,11 +994,8 @@ def run_convert(input_data, user_input: str):
         default_data["skills"].append(detectLieSkill)
 
     # Give Intimidation if the character has Intimidation
-    if "skill" in input_data and "intimidation" in input_data["skill"]:
-        intimidation_modifier_string = input_data["skill"]["intimidation"]
-        intimidation_modifier = int(
-            intimidation_modifier_string.replace("+", "")
-        )  # Remove '+' sign
+    if "intimidation" in monster.skills:
+        intimidation_modifier = monster.skills["intimidation"]
         points = convert_modifier_to_points(intimidation_modifier - charAd)
 
         # region Intimidation Skill
@@ -816,7 +1024,7 @@ def run_convert(input_data, user_input: str):
         default_data["skills"].append(intimidationSkill)
 
     # Give Scrouning and Search if the character has Investgation
-    if "skill" in input_data and "investigation" in input_data["skill"]:
+    if "investigation" in monster.skills:
         points = convert_modifier_to_points(profBonus)
 
         # region Scrounging Skill
@@ -867,11 +1075,8 @@ def run_convert(input_data, user_input: str):
         default_data["skills"].append(searchSkill)
 
     # Give First-Aid, Diagnosis, Physician (if medium), and Surgery (if high) if the character has Medicine
-    if "skill" in input_data and "medicine" in input_data["skill"]:
-        medicine_modifier_string = input_data["skill"]["medicine"]
-        medicine_modifier = int(
-            medicine_modifier_string.replace("+", "")
-        )  # Remove '+' sign
+    if "medicine" in monster.skills:
+        medicine_modifier = monster.skills["medicine"]
         points = convert_modifier_to_points(profBonus)
 
         # region First-Aid Skill
@@ -1005,7 +1210,7 @@ def run_convert(input_data, user_input: str):
             default_data["skills"].append(surgerySkill)
 
     # Give Gardening and Biology (Botany) if the character has Nature
-    if "skill" in input_data and "nature" in input_data["skill"]:
+    if "nature" in monster.skills:
         points = convert_modifier_to_points(profBonus)
 
         # region Gardening Skill
@@ -1061,7 +1266,7 @@ def run_convert(input_data, user_input: str):
         default_data["skills"].append(botanySkill)
 
     # Give Observation and Acute Vision Trait if the character has Perception
-    if "skill" in input_data and "perception" in input_data["skill"]:
+    if "perception" in monster.skills:
         points = convert_modifier_to_points(profBonus)
 
         # region Observation Skill
@@ -1113,11 +1318,8 @@ def run_convert(input_data, user_input: str):
         default_data["traits"].append(acuteVisionTrait)
 
     # Give Acting, Dancing, Musical Instrument (any), and Singing if the character has Performance
-    if "skill" in input_data and "performance" in input_data["skill"]:
-        performance_modifier_string = input_data["skill"]["performance"]
-        performance_modifier = int(
-            performance_modifier_string.replace("+", "")
-        )  # Remove '+' sign
+    if "performance" in monster.skills:
+        performance_modifier = monster.skills["performance"]
         points = convert_modifier_to_points(performance_modifier - charAd)
 
         # region Acting Skill
@@ -1206,11 +1408,8 @@ def run_convert(input_data, user_input: str):
         default_data["skills"].append(singingSkill)
 
     # Give Diplomacy if the character has Persuasion
-    if "skill" in input_data and "persuasion" in input_data["skill"]:
-        persuasion_modifier_string = input_data["skill"]["persuasion"]
-        persuasion_modifier = int(
-            persuasion_modifier_string.replace("+", "")
-        )  # Remove '+' sign
+    if "persuasion" in monster.skills:
+        persuasion_modifier = monster.skills["persuasion"]
         points = convert_modifier_to_points(persuasion_modifier - charAd)
 
         # region Diplomacy Skill
@@ -1239,7 +1438,7 @@ def run_convert(input_data, user_input: str):
         default_data["skills"].append(diplomacySkill)
 
     # Give Theology (General) if the character has Religion
-    if "skill" in input_data and "religion" in input_data["skill"]:
+    if "religion" in monster.skills:
         points = convert_modifier_to_points(profBonus)
 
         # region Theology (General) Skill
@@ -1274,9 +1473,8 @@ def run_convert(input_data, user_input: str):
         default_data["skills"].append(theologySkill)
 
     # Give Sleight of Hand if the character has Sleight of Hand
-    if "skill" in input_data and "sleight of hand" in input_data["skill"]:
-        sof_modifier_string = input_data["skill"]["sleight of hand"]
-        sof_modifier = int(sof_modifier_string.replace("+", ""))  # Remove '+' sign
+    if "sleight of hand" in monster.skills:
+        sof_modifier = monster.skills["sleight of hand"]
         points = convert_modifier_to_points(sof_modifier - dexAd)
 
         # region Sleight of Hand Skill
@@ -1295,11 +1493,8 @@ def run_convert(input_data, user_input: str):
         default_data["skills"].append(sleightOfHandSkill)
 
     # Give Stealth if the character has Stealth
-    if "skill" in input_data and "stealth" in input_data["skill"]:
-        stealth_modifier_string = input_data["skill"]["stealth"]
-        stealth_modifier = int(
-            stealth_modifier_string.replace("+", "")
-        )  # Remove '+' sign
+    if "stealth" in monster.skills:
+        stealth_modifier = monster.skills["stealth"]
         points = convert_modifier_to_points(stealth_modifier - dexAd)
 
         # region Stealth Skill
@@ -1329,7 +1524,7 @@ def run_convert(input_data, user_input: str):
         default_data["skills"].append(stealthSkill)
 
     # Give Survival (any) if the character has Survival
-    if "skill" in input_data and "survival" in input_data["skill"]:
+    if "survival" in monster.skills:
         points = convert_modifier_to_points(profBonus)
 
         # region Survival (any) Skill
@@ -1400,54 +1595,29 @@ def run_convert(input_data, user_input: str):
         # endregion
         default_data["skills"].append(survivalSkill)
 
-    if user_input.lower() == "yes":
-        # region Combat Reflexes Trait
-        combatReflexesTrait = {
-            "id": str(uuid.uuid4()),
-            "type": "trait",
-            "name": "Combat Reflexes",
-            "reference": "B43",
-            "notes": "Never freeze",
-            "tags": ["Advantage", "Mental"],
-            "base_points": 15,
-            "prereqs": {
-                "type": "prereq_list",
-                "all": True,
-                "prereqs": [
-                    {
-                        "type": "trait_prereq",
-                        "has": False,
-                        "name": {"compare": "is", "qualifier": "Enhanced Time Sense"},
-                    }
-                ],
-            },
-            "features": [
-                {
-                    "type": "skill_bonus",
-                    "selection_type": "skills_with_name",
-                    "name": {"compare": "starts_with", "qualifier": "fast-draw"},
-                    "amount": 1,
-                },
-                {"type": "attribute_bonus", "attribute": "dodge", "amount": 1},
-                {"type": "attribute_bonus", "attribute": "parry", "amount": 1},
-                {"type": "attribute_bonus", "attribute": "block", "amount": 1},
-                {"type": "attribute_bonus", "attribute": "fright_check", "amount": 2},
-                {
-                    "type": "conditional_modifier",
-                    "situation": "on all IQ rolls to wake up or to recover from surprise or mental stun",
-                    "amount": 6,
-                },
-                {
-                    "type": "conditional_modifier",
-                    "situation": "to initiative rolls for your side (+2 if you are the leader)",
-                    "amount": 1,
-                },
-            ],
-            "calc": {"points": 15},
-        }
-        # endregion
-        default_data["traits"].append(combatReflexesTrait)
+    for skill in monster.skills:
+        if skill not in MAPPED_SKILLS:
+            record_unmapped("skill", skill)
+
+
+# Armor that armor_stage gives equipment for when it is part of an ac "from" entry
+ARMOR_KITS = [
+    "leather",
+    "hide",
+    "padded",
+    "shield",
+    "scale",
+    "chain",
+    "breastplate",
+    "splint",
+    "plate",
+]
+
 
+def armor_stage(monster, default_data: dict, options: dict):
+    """
+    Adds Damage Resistance for natural armor, Enhanced Dodge for unarmored defense and the armor the statblock wears
+    """
     # Adds appropriate armor according to equipment
     # region Armor Pieces
     # region Leather Armor
@@ -2253,13 +2423,10 @@ def run_convert(input_data, user_input: str):
     }
     # endregion
 
-    for item in input_data["ac"]:
-        # Nothing
-        if type(item) is str or type(item) is int:
-            continue
+    for item in monster.ac:
         # Natural Armor
-        if ("from" in item and "natural armor" in item["from"]) and (item["ac"] > 11):
-            levelFromAC = int(item["ac"]) - 11
+        if "natural armor" in item.sources and item.ac > 11:
+            levelFromAC = item.ac - 11
             # region Damage Resistance
             damageResistance = {
                 "id": str(uuid.uuid4()),
@@ -2578,8 +2745,8 @@ def run_convert(input_data, user_input: str):
             default_data["traits"].append(damageResistance)
 
         # Unarmored Defense adds Enhanced Dodge
-        if ("from" in item and "unarmored" in item["from"]) and (item["ac"] > 11):
-            levelFromAC = item["ac"] - 11
+        if "unarmored" in item.sources and item.ac > 11:
+            levelFromAC = item.ac - 11
             # region Unarmored Defense
             unarmoredDefense = {
                 "id": str(uuid.uuid4()),
@@ -2604,8 +2771,8 @@ def run_convert(input_data, user_input: str):
             default_data["traits"].append(unarmoredDefense)
 
         # Leather / Leather Armor -> Leather Armor, Leather Pants, Heavy Leather Sleeves, Leather Helm, Boots
-        elif "from" in item:
-            for s in item["from"]:
+        elif item.sources:
+            for s in item.sources:
                 if "leather" in s and "studded" not in s:
                     default_data["equipment"].append(leatherArmor)
                     default_data["equipment"].append(leatherPants)
@@ -2614,8 +2781,8 @@ def run_convert(input_data, user_input: str):
                     default_data["equipment"].append(boots)
 
         # Studded Leather / Studded Leather Armor -> Leather Armor, Heavy Leather Leggings, Heavy Leather Sleeves, Leather Helm, Studded Leather Skirts, Reinforced Boots, Leather Gloves
-        if "from" in item:
-            for s in item["from"]:
+        if item.sources:
+            for s in item.sources:
                 if "studded leather" in s:
                     default_data["equipment"].append(leatherArmor)
                     default_data["equipment"].append(heavyLeatherLeggings)
@@ -2626,8 +2793,8 @@ def run_convert(input_data, user_input: str):
                     default_data["equipment"].append(leatherGloves)
 
         # Hide Armor / Hide -> Fur Tunic, Fur Loincloth, Leather Armor, Leather Pants, Leather Helm, Reinforced Boots, Leather Gloves, Heavy Leather Sleeves, Heavy Leather Leggings
-        if "from" in item:
-            for s in item["from"]:
+        if item.sources:
+            for s in item.sources:
                 if "hide" in s:
                     default_data["equipment"].append(furTunic)
                     default_data["equipment"].append(furLoincloth)
@@ -2640,8 +2807,8 @@ def run_convert(input_data, user_input: str):
                     default_data["equipment"].append(heavyLeatherLeggings)
 
         # Padded -> Buff Coat, Leather Pants, Heavy Leather Sleeves, Leather Helm, Reinforced Boots, Leather Gloves
-        if "from" in item:
-            for s in item["from"]:
+        if item.sources:
+            for s in item.sources:
                 if "padded" in s:
                     default_data["equipment"].append(buffCoat)
                     default_data["equipment"].append(leatherPants)
@@ -2651,14 +2818,14 @@ def run_convert(input_data, user_input: str):
                     default_data["equipment"].append(leatherGloves)
 
         # Shield -> Medium Shield
-        if "from" in item:
-            for s in item["from"]:
+        if item.sources:
+            for s in item.sources:
                 if "shield" in s:
                     default_data["equipment"].append(mediumShield)
 
         # Scale Mail / Scale Mail Armor -> Scale Armor, Scale Leggings, Scale Sleeves, Pot Helm, Buff Coat, Leather Gloves, Reinforced Boots
-        if "from" in item:
-            for s in item["from"]:
+        if item.sources:
+            for s in item.sources:
                 if "scale" in s:
                     default_data["equipment"].append(scaleArmor)
                     default_data["equipment"].append(scaleLeggings)
@@ -2669,8 +2836,8 @@ def run_convert(input_data, user_input: str):
                     default_data["equipment"].append(reinforcedBoots)
 
         # Chain Shirt / Chain Mail -> Mail Coif, Mail Shirt, Mail Leggings, Mail Sleeves, Pot Helm, Buff Coat, Leather Gloves, Reinforced Boots
-        if "from" in item:
-            for s in item["from"]:
+        if item.sources:
+            for s in item.sources:
                 if "chain" in s:
                     default_data["equipment"].append(mailCoif)
                     default_data["equipment"].append(mailShirt)
@@ -2682,8 +2849,8 @@ def run_convert(input_data, user_input: str):
                     default_data["equipment"].append(reinforcedBoots)
 
         # Breastplate / Breastplate Armor -> Breastplate, Mail Leggings, Mail Sleeves, Pot Helm, Buff Coat, Leather Gloves, Reinforced Boots
-        if "from" in item:
-            for s in item["from"]:
+        if item.sources:
+            for s in item.sources:
                 if "breastplate" in s:
                     default_data["equipment"].append(steelBreastPlate)
                     default_data["equipment"].append(mailLeggings)
@@ -2695,8 +2862,8 @@ def run_convert(input_data, user_input: str):
                     print("Test")
 
         # Half Plate Armor / Half Plate -> Steel Corselet, Mail Sleeves, Pot Helm, Mail Coif, Buff Coat, Gauntlets, Mail Leggings, Sollerets
-        if "from" in item:
-            for s in item["from"]:
+        if item.sources:
+            for s in item.sources:
                 if "half plate" in s:
                     default_data["equipment"].append(steelCorselet)
                     default_data["equipment"].append(mailSleeves)
@@ -2708,8 +2875,8 @@ def run_convert(input_data, user_input: str):
                     default_data["equipment"].append(sollerets)
 
         # Splint Armor / Splint Mail / SplintMail -> Steel Corselet, Plate Arms, Plate Legs, Sollerets, Gauntlets, Mail Hauberk, Buff Coat, Barrel Helm
-        if "from" in item:
-            for s in item["from"]:
+        if item.sources:
+            for s in item.sources:
                 if "splint" in s:
                     default_data["equipment"].append(steelCorselet)
                     default_data["equipment"].append(plateArms)
@@ -2721,8 +2888,8 @@ def run_convert(input_data, user_input: str):
                     default_data["equipment"].append(barrelHelm)
 
         # Plate Mail / Plate Mail Armor / Plate / Plate Armor -> Heavy Steel Corselet, Heavy Plate Arms, Heavy Plate Legs, Sollerets, Heavy Gauntlets, Mail Hauberk, Buff Coat, Mail Leggings, Mail Sleeves, Great Helm
-        if "from" in item:
-            for s in item["from"]:
+        if item.sources:
+            for s in item.sources:
                 if "plate" in s:
                     default_data["equipment"].append(heavySteelCorselet)
                     default_data["equipment"].append(heavyPlateArms)
@@ -2735,2278 +2902,2005 @@ def run_convert(input_data, user_input: str):
                     default_data["equipment"].append(mailSleeves)
                     default_data["equipment"].append(greatHelm)
 
-    # Add resistances
-    if "resist" in input_data:
-        for res in input_data["resist"]:
-            limDamageResistance = {
+        for s in item.sources:
+            if s not in ("natural armor", "unarmored") and not any(
+                kit in s for kit in ARMOR_KITS
+            ):
+                record_unmapped("armor", s)
+
+
+def defenses_stage(monster, default_data: dict, options: dict):
+    """
+    Adds resistances, immunities, vulnerabilities and condition immunities
+    """
+    default_data["traits"].extend(build_defense_traits(monster.defenses()))
+
+
+def traits_stage(monster, default_data: dict, options: dict):
+    """
+    Adds Combat Reflexes for battle-hardened creatures and a trait for every statblock trait
+    """
+    creature_name = monster.name
+
+    if options.get("combatReflexes"):
+        # region Combat Reflexes Trait
+        combatReflexesTrait = {
+            "id": str(uuid.uuid4()),
+            "type": "trait",
+            "name": "Combat Reflexes",
+            "reference": "B43",
+            "notes": "Never freeze",
+            "tags": ["Advantage", "Mental"],
+            "base_points": 15,
+            "prereqs": {
+                "type": "prereq_list",
+                "all": True,
+                "prereqs": [
+                    {
+                        "type": "trait_prereq",
+                        "has": False,
+                        "name": {"compare": "is", "qualifier": "Enhanced Time Sense"},
+                    }
+                ],
+            },
+            "features": [
+                {
+                    "type": "skill_bonus",
+                    "selection_type": "skills_with_name",
+                    "name": {"compare": "starts_with", "qualifier": "fast-draw"},
+                    "amount": 1,
+                },
+                {"type": "attribute_bonus", "attribute": "dodge", "amount": 1},
+                {"type": "attribute_bonus", "attribute": "parry", "amount": 1},
+                {"type": "attribute_bonus", "attribute": "block", "amount": 1},
+                {"type": "attribute_bonus", "attribute": "fright_check", "amount": 2},
+                {
+                    "type": "conditional_modifier",
+                    "situation": "on all IQ rolls to wake up or to recover from surprise or mental stun",
+                    "amount": 6,
+                },
+                {
+                    "type": "conditional_modifier",
+                    "situation": "to initiative rolls for your side (+2 if you are the leader)",
+                    "amount": 1,
+                },
+            ],
+            "calc": {"points": 15},
+        }
+        # endregion
+        default_data["traits"].append(combatReflexesTrait)
+
+    # Add Traits
+    for trait in monster.traits:
+        if trait.name == "Nimble Escape":
+            nimble_escape_trait = {
                 "id": str(uuid.uuid4()),
                 "type": "trait",
-                "name": "Damage Resistance (0.5x)",
-                "notes": "Limited (Fire)",
-                "userdesc": "Half All Damage That Passed DR",
-                "base_points": 20,
-                "calc": {"points": 20},
+                "name": "Nimble Escape",
+                "notes": "Description",
+                "base_points": 5,
+                "calc": {"points": 5},
             }
-            # cold
-            if "cold" in res:
-                limDamageResistance["notes"] = "Limited (Cold)"
-                default_data["traits"].append(limDamageResistance)
-            # fire
-            elif "fire" in res:
-                limDamageResistance["notes"] = "Limited (Fire)"
-                default_data["traits"].append(limDamageResistance)
-            # poison
-            elif "poison" in res:
-                limDamageResistance["notes"] = "Limited (Poison)"
-                default_data["traits"].append(limDamageResistance)
-            # acid
-            elif "acid" in res:
-                limDamageResistance["notes"] = "Limited (Acid)"
-                default_data["traits"].append(limDamageResistance)
-            # lightning
-            elif "lightning" in res:
-                limDamageResistance["notes"] = "Limited (Lightning)"
-                default_data["traits"].append(limDamageResistance)
-            # necrotic
-            elif "necrotic" in res:
-                limDamageResistance["notes"] = "Limited (Necrotic)"
-                default_data["traits"].append(limDamageResistance)
-            # radiant
-            elif "radiant" in res:
-                limDamageResistance["notes"] = "Limited (Radiant)"
-                default_data["traits"].append(limDamageResistance)
-            # thunder
-            elif "thunder" in res:
-                limDamageResistance["notes"] = "Limited (Thunder)"
-                default_data["traits"].append(limDamageResistance)
-            # force
-            elif "force" in res:
-                limDamageResistance["notes"] = "Limited (Force)"
-                default_data["traits"].append(limDamageResistance)
-            # psychic
-            elif "psychic" in res:
-                limDamageResistance["notes"] = "Limited (Psychic)"
-                default_data["traits"].append(limDamageResistance)
-            # bludgeoning
-            elif "bludgeoning" in res:
-                limDamageResistance["notes"] = "Limited (Crushing)"
-                default_data["traits"].append(limDamageResistance)
-            # piercing
-            elif "piercing" in res:
-                limDamageResistance["notes"] = "Limited (Impaling and Piercing)"
-                default_data["traits"].append(limDamageResistance)
-            # slashing
-            elif "slashing" in res:
-                limDamageResistance["notes"] = "Limited (Cutting)"
-                default_data["traits"].append(limDamageResistance)
-            # bludgeoning, piercing, and slashing
-            elif isinstance(res, dict) and "resist" in res:
-                # Check if the value of 'resist' is a list that contains "bludgeoning", "piercing", "slashing"
-                if set(["bludgeoning", "piercing", "slashing"]).issubset(res["resist"]):
-                    limDamageResistance[
-                        "notes"
-                    ] = "Limited (Crushing, Impaling, Piercing, and Cutting From Nonmagical Weapons)"
-                    default_data["traits"].append(limDamageResistance)
-
-    # add immunities
-    if "immune" in input_data:
-        for imm in input_data["immune"]:
-            immunity = {
+            nimble_escape_trait["notes"] = (
+                "The "
+                + creature_name
+                + " does not have a limit on the number of times it can use the Retreat active defense and can take 2 steps during a Retreat. The creatures step action size also becomes a minimum of 2 yards."
+            )
+            default_data["traits"].append(nimble_escape_trait)
+        else:
+            newTrait = {
                 "id": str(uuid.uuid4()),
                 "type": "trait",
-                "name": "Damage Immunity",
-                "notes": "Limited (Fire)",
-                "base_points": 50,
-                "calc": {"points": 50},
+                "name": "Trait Name",
+                "notes": "Description",
+                "base_points": 5,
+                "calc": {"points": 5},
             }
-            # cold
-            if "cold" in imm:
-                immunity["notes"] = "Limited (Cold)"
-                default_data["traits"].append(immunity)
-            # fire
-            elif "fire" in imm:
-                immunity["notes"] = "Limited (Fire)"
-                default_data["traits"].append(immunity)
-            # poison
-            elif "poison" in imm:
-                immunity["notes"] = "Limited (Poison)"
-                default_data["traits"].append(immunity)
-            # acid
-            elif "acid" in imm:
-                immunity["notes"] = "Limited (Acid)"
-                default_data["traits"].append(immunity)
-            # lightning
-            elif "lightning" in imm:
-                immunity["notes"] = "Limited (Lightning)"
-                default_data["traits"].append(immunity)
-            # necrotic
-            elif "necrotic" in imm:
-                immunity["notes"] = "Limited (Necrotic)"
-                default_data["traits"].append(immunity)
-            # radiant
-            elif "radiant" in imm:
-                immunity["notes"] = "Limited (Radiant)"
-                default_data["traits"].append(immunity)
-            # thunder
-            elif "thunder" in imm:
-                immunity["notes"] = "Limited (Thunder)"
-                default_data["traits"].append(immunity)
-            # force
-            elif "force" in imm:
-                immunity["notes"] = "Limited (Force)"
-                default_data["traits"].append(immunity)
-            # psychic
-            elif "psychic" in imm:
-                immunity["notes"] = "Limited (Psychic)"
-                default_data["traits"].append(immunity)
-            # bludgeoning
-            elif "bludgeoning" in imm:
-                immunity["notes"] = "Limited (Crushing)"
-                default_data["traits"].append(immunity)
-            # piercing
-            elif "piercing" in imm:
-                immunity["notes"] = "Limited (Piercing and Impaling)"
-                default_data["traits"].append(immunity)
-            # slashing
-            elif "slashing" in imm:
-                immunity["notes"] = "Limited (Cutting)"
-                default_data["traits"].append(immunity)
-            # bludgeoning, piercing, slashing
-            elif isinstance(imm, dict) and "resist" in imm:
-                # Check if the value of 'resist' is a list that contains "bludgeoning", "piercing", "slashing"
-                if set(["bludgeoning", "piercing", "slashing"]).issubset(imm["immune"]):
-                    immunity[
-                        "notes"
-                    ] = "Limited (Crushing, Piercing, Impaling, and Cutting From Nonmagical Weapons)"
-                    default_data["traits"].append(immunity)
+            newTrait["name"] = convert_name(trait.name)
+            description = flatten_entries(trait.entries)
+            newTrait["notes"] = convert_to_gurps(description)
+            default_data["traits"].append(newTrait)
 
-    # Add Traits
-    if "trait" in input_data:
-        for trait in input_data["trait"]:
-            if trait["name"] == "Nimble Escape":
-                nimble_escape_trait = {
-                    "id": str(uuid.uuid4()),
-                    "type": "trait",
-                    "name": "Nimble Escape",
-                    "notes": "Description",
-                    "base_points": 5,
-                    "calc": {"points": 5},
-                }
-                nimble_escape_trait["notes"] = (
-                    "The "
-                    + creature_name
-                    + " does not have a limit on the number of times it can use the Retreat active defense and can take 2 steps during a Retreat. The creatures step action size also becomes a minimum of 2 yards."
-                )
-                default_data["traits"].append(nimble_escape_trait)
-            else:
-                newTrait = {
-                    "id": str(uuid.uuid4()),
-                    "type": "trait",
-                    "name": "Trait Name",
-                    "notes": "Description",
-                    "base_points": 5,
-                    "calc": {"points": 5},
-                }
-                newTrait["name"] = trait["name"]
-                description = trait["entries"][0]
-                newTrait["notes"] = convert_to_gurps(description)
-                default_data["traits"].append(newTrait)
+
+def spells_stage(monster, default_data: dict, options: dict):
+    """
+    Adds a trait for every spellcasting entry and the GURPS spells its spells map to
+    """
+    profBonus = monster.profBonus
 
     # Spellcasting
-    if "spellcasting" in input_data:
-        newTrait = {
-            "id": str(uuid.uuid4()),
-            "type": "trait",
-            "name": "Trait Name",
-            "notes": "Description",
-            "base_points": 5,
-            "calc": {"points": 5},
-        }
-        if input_data["spellcasting"][0]["name"] == "Innate Spellcasting":
-            newTrait["name"] = "Innate Spellcasting"
-            description = convert_to_gurps(
-                input_data["spellcasting"][0]["headerEntries"][0]
-            )
-            if "will" in input_data["spellcasting"][0]:
-                description = (
-                    description
-                    + "\nAt Will: "
-                    + convert_to_gurps(str(input_data["spellcasting"][0]["will"]))
-                )
-            if "daily" in input_data["spellcasting"][0]:
-                description = (
-                    description
-                    + "\nDaily: "
-                    + convert_to_gurps(str(input_data["spellcasting"][0]["daily"]))
-                )
-            newTrait["notes"] = description
-            default_data["traits"].append(newTrait)
-        else:
-            newTrait["name"] = "Spellcasting"
-            description = ""
-            if "headerEntries" in input_data["spellcasting"][0]:
-                description = convert_to_gurps(
-                    input_data["spellcasting"][0]["headerEntries"][0]
-                )
-            if "will" in input_data["spellcasting"][0]:
-                description = (
-                    description
-                    + "\nAt Will: "
-                    + convert_to_gurps(str(input_data["spellcasting"][0]["will"]))
+    if monster.spellcasting:
+        gurpsSpells = {}
+        for spellcasting in monster.spellcasting:
+            newTrait = {
+                "id": str(uuid.uuid4()),
+                "type": "trait",
+                "name": "Trait Name",
+                "notes": "Description",
+                "base_points": 5,
+                "calc": {"points": 5},
+            }
+            newTrait["name"] = convert_name(spellcasting.name)
+            lines = []
+            if spellcasting.headerEntries:
+                lines.append(
+                    convert_to_gurps(flatten_entries(spellcasting.headerEntries))
                 )
-            if "daily" in input_data["spellcasting"][0]:
-                description = (
-                    description
-                    + "\nDaily: "
-                    + convert_to_gurps(str(input_data["spellcasting"][0]["daily"]))
+            # Each spell list is followed by the GURPS spells they map to, which are also added as spells
+            for label, spells in spellcasting.groups:
+                spellNames = []
+                for spell in spells:
+                    spellText = convert_to_gurps(spell)
+                    gurpsSpell = lookup_spell(spell)
+                    if gurpsSpell is not None:
+                        spellText = spellText + " [" + gurpsSpell["name"] + "]"
+                        gurpsSpells[gurpsSpell["name"]] = gurpsSpell
+                    spellNames.append(spellText)
+                lines.append(label + ": " + ", ".join(spellNames))
+            if spellcasting.footerEntries:
+                lines.append(
+                    convert_to_gurps(flatten_entries(spellcasting.footerEntries))
                 )
-            if "spells" in input_data["spellcasting"][0]:
-                if "0" in input_data["spellcasting"][0]["spells"]:
-                    description = description + "0: "
-                    for spell in input_data["spellcasting"][0]["spells"]["0"]["spells"]:
-                        # remove {@ from begginging of spell and } from end of spell
-                        description = description + spell[8:-1] + ", "
-                    description = description[:-2] + "\n"
-                if "1" in input_data["spellcasting"][0]["spells"]:
-                    description = description + "1: "
-                    for spell in input_data["spellcasting"][0]["spells"]["1"]["spells"]:
-                        # remove {@ from begginging of spell and } from end of spell
-                        description = description + spell[8:-1] + ", "
-                    description = description[:-2] + "\n"
-                if "2" in input_data["spellcasting"][0]["spells"]:
-                    description = description + "2: "
-                    for spell in input_data["spellcasting"][0]["spells"]["2"]["spells"]:
-                        # remove {@ from begginging of spell and } from end of spell
-                        description = description + spell[8:-1] + ", "
-                    description = description[:-2] + "\n"
-                if "3" in input_data["spellcasting"][0]["spells"]:
-                    description = description + "3: "
-                    for spell in input_data["spellcasting"][0]["spells"]["3"]["spells"]:
-                        # remove {@ from begginging of spell and } from end of spell
-                        description = description + spell[8:-1] + ", "
-                    description = description[:-2] + "\n"
-                if "4" in input_data["spellcasting"][0]["spells"]:
-                    description = description + "4: "
-                    for spell in input_data["spellcasting"][0]["spells"]["4"]["spells"]:
-                        # remove {@ from begginging of spell and } from end of spell
-                        description = description + spell[8:-1] + ", "
-                    description = description[:-2] + "\n"
-                if "5" in input_data["spellcasting"][0]["spells"]:
-                    description = description + "5: "
-                    for spell in input_data["spellcasting"][0]["spells"]["5"]["spells"]:
-                        # remove {@ from begginging of spell and } from end of spell
-                        description = description + spell[8:-1] + ", "
-                    description = description[:-2] + "\n"
-                if "6" in input_data["spellcasting"][0]["spells"]:
-                    description = description + "6: "
-                    for spell in input_data["spellcasting"][0]["spells"]["6"]["spells"]:
-                        # remove {@ from begginging of spell and } from end of spell
-                        description = description + spell[8:-1] + ", "
-                    description = description[:-2] + "\n"
-                if "7" in input_data["spellcasting"][0]["spells"]:
-                    description = description + "7: "
-                    for spell in input_data["spellcasting"][0]["spells"]["7"]["spells"]:
-                        # remove {@ from begginging of spell and } from end of spell
-                        description = description + spell[8:-1] + ", "
-                    description = description[:-2] + "\n"
-                if "8" in input_data["spellcasting"][0]["spells"]:
-                    description = description + "8: "
-                    for spell in input_data["spellcasting"][0]["spells"]["8"]["spells"]:
-                        # remove {@ from begginging of spell and } from end of spell
-                        description = description + spell[8:-1] + ", "
-                    description = description[:-2] + "\n"
-                if "9" in input_data["spellcasting"][0]["spells"]:
-                    description = description + "9: "
-                    for spell in input_data["spellcasting"][0]["spells"]["9"]["spells"]:
-                        # remove {@ from begginging of spell and } from end of spell
-                        description = description + spell[8:-1] + ", "
-            newTrait["notes"] = description
+            newTrait["notes"] = "\n".join(lines)
             default_data["traits"].append(newTrait)
 
+        spellPoints = convert_modifier_to_points(profBonus)
+        default_data.setdefault("spells", [])
+        for gurpsSpell in gurpsSpells.values():
+            default_data["spells"].append(build_spell(gurpsSpell, spellPoints))
+
+
+def actions_stage(monster, default_data: dict, options: dict):
+    """
+    Adds natural weapons, weapon skills and equipment, and action traits for everything else
+    """
+    profBonus = monster.profBonus
+
     # Add Actions
     profPoints = convert_modifier_to_points(profBonus)
-    if "action" in input_data:
-        for action in input_data["action"]:
-            # Dagger -> Knife Skill, Knife Equipment
-            if action["name"] == "Dagger":
-                # region Knife Skill
-                knifeSkill = {
-                    "id": "5ea7070f-c321-48cf-83c2-0d9d090c41a9",
-                    "type": "skill",
-                    "name": "Knife",
-                    "reference": "B208",
-                    "tags": ["Combat", "Melee Combat", "Weapon"],
-                    "difficulty": "dx/e",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -4,
-                        "level": 7,
-                        "adjusted_level": 7,
-                        "points": -7,
-                    },
-                    "defaults": [
-                        {"type": "skill", "name": "Force Sword", "modifier": -3},
-                        {"type": "skill", "name": "Main-Gauche", "modifier": -3},
-                        {"type": "skill", "name": "Shortsword", "modifier": -3},
-                        {"type": "dx", "modifier": -4},
-                    ],
-                    "calc": {"level": 11, "rsl": "DX+0"},
-                }
-                # endregion
-                default_data["skills"].append(knifeSkill)
-
-                # region Knife Equipment
-                daggerEquipment = {
-                    "id": "0542c749-259f-401f-b977-58fd127d2db2",
-                    "type": "equipment",
-                    "description": "Dagger",
-                    "reference": "B272",
-                    "tech_level": "1",
-                    "tags": ["Melee Weapon", "Missile Weapon"],
-                    "quantity": 1,
-                    "value": 20,
-                    "weight": "0.25 lb",
-                    "weapons": [
-                        {
-                            "id": "7ba39755-8571-43fa-a9af-4d6cc53df929",
-                            "type": "melee_weapon",
-                            "damage": {"type": "imp", "st": "thr", "base": "-1"},
-                            "strength": "5",
-                            "usage": "Thrust",
-                            "reach": "C",
-                            "parry": "-1",
-                            "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -4},
-                                {"type": "skill", "name": "Knife"},
-                                {
-                                    "type": "skill",
-                                    "name": "Force Sword",
-                                    "modifier": -3,
-                                },
-                                {
-                                    "type": "skill",
-                                    "name": "Main-Gauche",
-                                    "modifier": -3,
-                                },
-                                {"type": "skill", "name": "Shortsword", "modifier": -3},
-                                {"type": "skill", "name": "Sword!"},
-                            ],
-                            "calc": {
-                                "level": 11,
-                                "parry": "7",
-                                "block": "No",
-                                "damage": "1d-3 imp",
+    genericActions = []
+    for action in monster.actions:
+        # Dagger -> Knife Skill, Knife Equipment
+        if action.name == "Dagger":
+            # region Knife Skill
+            knifeSkill = {
+                "id": "5ea7070f-c321-48cf-83c2-0d9d090c41a9",
+                "type": "skill",
+                "name": "Knife",
+                "reference": "B208",
+                "tags": ["Combat", "Melee Combat", "Weapon"],
+                "difficulty": "dx/e",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -4,
+                    "level": 7,
+                    "adjusted_level": 7,
+                    "points": -7,
+                },
+                "defaults": [
+                    {"type": "skill", "name": "Force Sword", "modifier": -3},
+                    {"type": "skill", "name": "Main-Gauche", "modifier": -3},
+                    {"type": "skill", "name": "Shortsword", "modifier": -3},
+                    {"type": "dx", "modifier": -4},
+                ],
+                "calc": {"level": 11, "rsl": "DX+0"},
+            }
+            # endregion
+            default_data["skills"].append(knifeSkill)
+
+            # region Knife Equipment
+            daggerEquipment = {
+                "id": "0542c749-259f-401f-b977-58fd127d2db2",
+                "type": "equipment",
+                "description": "Dagger",
+                "reference": "B272",
+                "tech_level": "1",
+                "tags": ["Melee Weapon", "Missile Weapon"],
+                "quantity": 1,
+                "value": 20,
+                "weight": "0.25 lb",
+                "weapons": [
+                    {
+                        "id": "7ba39755-8571-43fa-a9af-4d6cc53df929",
+                        "type": "melee_weapon",
+                        "damage": {"type": "imp", "st": "thr", "base": "-1"},
+                        "strength": "5",
+                        "usage": "Thrust",
+                        "reach": "C",
+                        "parry": "-1",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -4},
+                            {"type": "skill", "name": "Knife"},
+                            {
+                                "type": "skill",
+                                "name": "Force Sword",
+                                "modifier": -3,
                             },
+                            {
+                                "type": "skill",
+                                "name": "Main-Gauche",
+                                "modifier": -3,
+                            },
+                            {"type": "skill", "name": "Shortsword", "modifier": -3},
+                            {"type": "skill", "name": "Sword!"},
+                        ],
+                        "calc": {
+                            "level": 11,
+                            "parry": "7",
+                            "block": "No",
+                            "damage": "1d-3 imp",
                         },
-                        {
-                            "id": "7d6f591f-516a-4cc3-92bf-8971b0537f84",
-                            "type": "ranged_weapon",
-                            "damage": {"type": "imp", "st": "thr", "base": "-1"},
-                            "strength": "5",
-                            "usage": "Thrown",
-                            "accuracy": "+0",
-                            "range": "x0.5/x1",
-                            "rate_of_fire": "1",
-                            "shots": "T(1)",
-                            "bulk": "-1",
-                            "defaults": [
-                                {"type": "dx", "modifier": -4},
-                                {
-                                    "type": "skill",
-                                    "name": "Thrown Weapon",
-                                    "specialization": "Knife",
-                                },
-                            ],
-                            "calc": {"level": 7, "range": "5/10", "damage": "1d-3 imp"},
-                        },
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 20, "extended_weight": "0.25 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(daggerEquipment)
-            # Light Crossbow -> Crossbow Skill, Crossbow (str 11) equipment
-            elif action["name"] == "Light Crossbow":
-                # region Crossbow Skill
-                crossbowSkill = {
-                    "id": "d01481f1-7182-42d0-bf21-ab074ce090b2",
-                    "type": "skill",
-                    "name": "Crossbow",
-                    "reference": "B186",
-                    "tags": ["Combat", "Ranged Combat", "Weapon"],
-                    "difficulty": "dx/e",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -4,
-                        "level": 7,
-                        "adjusted_level": 7,
-                        "points": -7,
                     },
-                    "defaults": [{"type": "dx", "modifier": -4}],
-                    "calc": {"level": 11, "rsl": "DX+0"},
-                }
-                # endregion
-                default_data["skills"].append(crossbowSkill)
-                # region Crossbow Equipment
-                crossbowEquipment = {
-                    "id": "02b33894-bf95-4d8b-81f6-2ee4ae858bb1",
-                    "type": "equipment",
-                    "description": "Crossbow",
-                    "reference": "B276",
-                    "tech_level": "2",
-                    "tags": ["Missile Weapon", "UsesAmmoType:Bolt"],
-                    "rated_strength": 7,
-                    "quantity": 1,
-                    "value": 150,
-                    "weight": "6 lb",
-                    "weapons": [
-                        {
-                            "id": "dff3833e-b0dc-4362-b65e-4628d2ba454a",
-                            "type": "ranged_weapon",
-                            "damage": {"type": "imp", "st": "thr", "base": "4"},
-                            "strength": "7†",
-                            "accuracy": "4",
-                            "range": "x20/x25",
-                            "rate_of_fire": "1",
-                            "shots": "1(4)",
-                            "bulk": "-6",
-                            "defaults": [
-                                {"type": "dx", "modifier": -4},
-                                {"type": "skill", "name": "Crossbow"},
-                            ],
-                            "calc": {
-                                "level": 11,
-                                "range": "140/175",
-                                "damage": "1d+1 imp",
+                    {
+                        "id": "7d6f591f-516a-4cc3-92bf-8971b0537f84",
+                        "type": "ranged_weapon",
+                        "damage": {"type": "imp", "st": "thr", "base": "-1"},
+                        "strength": "5",
+                        "usage": "Thrown",
+                        "accuracy": "+0",
+                        "range": "x0.5/x1",
+                        "rate_of_fire": "1",
+                        "shots": "T(1)",
+                        "bulk": "-1",
+                        "defaults": [
+                            {"type": "dx", "modifier": -4},
+                            {
+                                "type": "skill",
+                                "name": "Thrown Weapon",
+                                "specialization": "Knife",
                             },
-                        }
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 150, "extended_weight": "6 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(crossbowEquipment)
-            # Club -> Broadsword Skill, light club Equipment
-            elif action["name"] == "Club":
-                # region Broadsword Skill
-                broadswordSkill = {
-                    "id": "9bc4310b-f446-4fc5-b882-d8cce9b0918a",
-                    "type": "skill",
-                    "name": "Broadsword",
-                    "reference": "B208",
-                    "tags": ["Combat", "Melee Combat", "Weapon"],
-                    "difficulty": "dx/a",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -5,
-                        "level": 6,
-                        "adjusted_level": 6,
-                        "points": -6,
+                        ],
+                        "calc": {"level": 7, "range": "5/10", "damage": "1d-3 imp"},
                     },
-                    "defaults": [
-                        {"type": "skill", "name": "Force Sword", "modifier": -4},
-                        {"type": "skill", "name": "Rapier", "modifier": -4},
-                        {"type": "skill", "name": "Saber", "modifier": -4},
-                        {"type": "skill", "name": "Shortsword", "modifier": -2},
-                        {"type": "skill", "name": "Two-Handed Sword", "modifier": -4},
-                        {"type": "dx", "modifier": -5},
-                    ],
-                    "calc": {"level": 10, "rsl": "DX-1"},
-                }
-                # endregion
-                default_data["skills"].append(broadswordSkill)
-                # region Light Club Equipment
-                lightClubEquipment = {
-                    "id": "4fd55de1-10a2-4d24-9179-27798c4a51bd",
-                    "type": "equipment",
-                    "description": "Light Club",
-                    "reference": "B271",
-                    "tech_level": "0",
-                    "tags": ["Melee Weapon"],
-                    "quantity": 1,
-                    "value": 5,
-                    "weight": "3 lb",
-                    "weapons": [
-                        {
-                            "id": "3865e69a-4d81-406e-844d-e8cc2b0bcddb",
-                            "type": "melee_weapon",
-                            "damage": {"type": "cr", "st": "sw", "base": "1"},
-                            "strength": "10",
-                            "usage": "Swung",
-                            "reach": "1",
-                            "parry": "0",
-                            "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {
-                                    "type": "skill",
-                                    "name": "Force Sword",
-                                    "modifier": -4,
-                                },
-                                {"type": "skill", "name": "Broadsword"},
-                                {"type": "skill", "name": "Rapier", "modifier": -4},
-                                {"type": "skill", "name": "Saber", "modifier": -4},
-                                {"type": "skill", "name": "Shortsword", "modifier": -2},
-                                {
-                                    "type": "skill",
-                                    "name": "Two-Handed Sword",
-                                    "modifier": -4,
-                                },
-                                {"type": "skill", "name": "Sword!"},
-                            ],
-                            "calc": {
-                                "level": 10,
-                                "parry": "8",
-                                "block": "No",
-                                "damage": "1d+1 cr",
-                            },
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 20, "extended_weight": "0.25 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(daggerEquipment)
+        # Light Crossbow -> Crossbow Skill, Crossbow (str 11) equipment
+        elif action.name == "Light Crossbow":
+            # region Crossbow Skill
+            crossbowSkill = {
+                "id": "d01481f1-7182-42d0-bf21-ab074ce090b2",
+                "type": "skill",
+                "name": "Crossbow",
+                "reference": "B186",
+                "tags": ["Combat", "Ranged Combat", "Weapon"],
+                "difficulty": "dx/e",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -4,
+                    "level": 7,
+                    "adjusted_level": 7,
+                    "points": -7,
+                },
+                "defaults": [{"type": "dx", "modifier": -4}],
+                "calc": {"level": 11, "rsl": "DX+0"},
+            }
+            # endregion
+            default_data["skills"].append(crossbowSkill)
+            # region Crossbow Equipment
+            crossbowEquipment = {
+                "id": "02b33894-bf95-4d8b-81f6-2ee4ae858bb1",
+                "type": "equipment",
+                "description": "Crossbow",
+                "reference": "B276",
+                "tech_level": "2",
+                "tags": ["Missile Weapon", "UsesAmmoType:Bolt"],
+                "rated_strength": 7,
+                "quantity": 1,
+                "value": 150,
+                "weight": "6 lb",
+                "weapons": [
+                    {
+                        "id": "dff3833e-b0dc-4362-b65e-4628d2ba454a",
+                        "type": "ranged_weapon",
+                        "damage": {"type": "imp", "st": "thr", "base": "4"},
+                        "strength": "7†",
+                        "accuracy": "4",
+                        "range": "x20/x25",
+                        "rate_of_fire": "1",
+                        "shots": "1(4)",
+                        "bulk": "-6",
+                        "defaults": [
+                            {"type": "dx", "modifier": -4},
+                            {"type": "skill", "name": "Crossbow"},
+                        ],
+                        "calc": {
+                            "level": 11,
+                            "range": "140/175",
+                            "damage": "1d+1 imp",
                         },
-                        {
-                            "id": "480b3768-4946-4e04-b117-3d1b843b36f3",
-                            "type": "melee_weapon",
-                            "damage": {"type": "cr", "st": "thr", "base": "1"},
-                            "strength": "10",
-                            "usage": "Thrust",
-                            "reach": "1",
-                            "parry": "0",
-                            "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {
-                                    "type": "skill",
-                                    "name": "Force Sword",
-                                    "modifier": -4,
-                                },
-                                {"type": "skill", "name": "Broadsword"},
-                                {"type": "skill", "name": "Rapier", "modifier": -4},
-                                {"type": "skill", "name": "Saber", "modifier": -4},
-                                {"type": "skill", "name": "Shortsword", "modifier": -2},
-                                {
-                                    "type": "skill",
-                                    "name": "Two-Handed Sword",
-                                    "modifier": -4,
-                                },
-                                {"type": "skill", "name": "Sword!"},
-                            ],
-                            "calc": {
-                                "level": 10,
-                                "parry": "8",
-                                "block": "No",
-                                "damage": "1d-1 cr",
+                    }
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 150, "extended_weight": "6 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(crossbowEquipment)
+        # Club -> Broadsword Skill, light club Equipment
+        elif action.name == "Club":
+            # region Broadsword Skill
+            broadswordSkill = {
+                "id": "9bc4310b-f446-4fc5-b882-d8cce9b0918a",
+                "type": "skill",
+                "name": "Broadsword",
+                "reference": "B208",
+                "tags": ["Combat", "Melee Combat", "Weapon"],
+                "difficulty": "dx/a",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -5,
+                    "level": 6,
+                    "adjusted_level": 6,
+                    "points": -6,
+                },
+                "defaults": [
+                    {"type": "skill", "name": "Force Sword", "modifier": -4},
+                    {"type": "skill", "name": "Rapier", "modifier": -4},
+                    {"type": "skill", "name": "Saber", "modifier": -4},
+                    {"type": "skill", "name": "Shortsword", "modifier": -2},
+                    {"type": "skill", "name": "Two-Handed Sword", "modifier": -4},
+                    {"type": "dx", "modifier": -5},
+                ],
+                "calc": {"level": 10, "rsl": "DX-1"},
+            }
+            # endregion
+            default_data["skills"].append(broadswordSkill)
+            # region Light Club Equipment
+            lightClubEquipment = {
+                "id": "4fd55de1-10a2-4d24-9179-27798c4a51bd",
+                "type": "equipment",
+                "description": "Light Club",
+                "reference": "B271",
+                "tech_level": "0",
+                "tags": ["Melee Weapon"],
+                "quantity": 1,
+                "value": 5,
+                "weight": "3 lb",
+                "weapons": [
+                    {
+                        "id": "3865e69a-4d81-406e-844d-e8cc2b0bcddb",
+                        "type": "melee_weapon",
+                        "damage": {"type": "cr", "st": "sw", "base": "1"},
+                        "strength": "10",
+                        "usage": "Swung",
+                        "reach": "1",
+                        "parry": "0",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {
+                                "type": "skill",
+                                "name": "Force Sword",
+                                "modifier": -4,
                             },
-                        },
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 5, "extended_weight": "3 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(lightClubEquipment)
-            # Scimitar or Shortsword -> Shortsword Skill, Shortsword Equipment
-            elif action["name"] == "Scimitar" or action["name"] == "Shortsword":
-                # region Shortsword Skill
-                shortswordSkill = {
-                    "id": "360f5f71-5201-47a5-a511-af7159565b9c",
-                    "type": "skill",
-                    "name": "Shortsword",
-                    "reference": "B209",
-                    "tags": ["Combat", "Melee Combat", "Weapon"],
-                    "difficulty": "dx/a",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -5,
-                        "level": 6,
-                        "adjusted_level": 6,
-                        "points": -6,
-                    },
-                    "defaults": [
-                        {"type": "skill", "name": "Broadsword", "modifier": -2},
-                        {"type": "skill", "name": "Force Sword", "modifier": -4},
-                        {"type": "skill", "name": "Jitte/Sai", "modifier": -3},
-                        {"type": "skill", "name": "Knife", "modifier": -4},
-                        {"type": "skill", "name": "Saber", "modifier": -4},
-                        {"type": "skill", "name": "Smallsword", "modifier": -4},
-                        {"type": "skill", "name": "Tonfa", "modifier": -3},
-                        {"type": "dx", "modifier": -5},
-                    ],
-                    "calc": {"level": 10, "rsl": "DX-1"},
-                }
-                # endregion
-                default_data["skills"].append(shortswordSkill)
-                # region Shortsword Equipment
-                shortswordEquipment = {
-                    "id": "dd4eb08c-679a-4e4b-834e-8d610f4d64cf",
-                    "type": "equipment",
-                    "description": "Shortsword",
-                    "reference": "B273",
-                    "tech_level": "2",
-                    "tags": ["Melee Weapon"],
-                    "quantity": 1,
-                    "value": 400,
-                    "weight": "2 lb",
-                    "weapons": [
-                        {
-                            "id": "12c9f475-1517-434b-9a98-b89941370fd2",
-                            "type": "melee_weapon",
-                            "damage": {"type": "cut", "st": "sw"},
-                            "strength": "8",
-                            "usage": "Swung",
-                            "reach": "1",
-                            "parry": "0",
-                            "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Shortsword"},
-                                {"type": "skill", "name": "Broadsword", "modifier": -2},
-                                {
-                                    "type": "skill",
-                                    "name": "Force Sword",
-                                    "modifier": -4,
-                                },
-                                {"type": "skill", "name": "Jitte/Sai", "modifier": -3},
-                                {"type": "skill", "name": "Knife", "modifier": -4},
-                                {"type": "skill", "name": "Saber", "modifier": -4},
-                                {"type": "skill", "name": "Smallsword", "modifier": -4},
-                                {"type": "skill", "name": "Tonfa", "modifier": -3},
-                                {"type": "skill", "name": "Sword!"},
-                            ],
-                            "calc": {
-                                "level": 10,
-                                "parry": "8",
-                                "block": "No",
-                                "damage": "1d cut",
+                            {"type": "skill", "name": "Broadsword"},
+                            {"type": "skill", "name": "Rapier", "modifier": -4},
+                            {"type": "skill", "name": "Saber", "modifier": -4},
+                            {"type": "skill", "name": "Shortsword", "modifier": -2},
+                            {
+                                "type": "skill",
+                                "name": "Two-Handed Sword",
+                                "modifier": -4,
                             },
-                        },
-                        {
-                            "id": "c0366cd4-e9df-4ea5-b114-3fa3850b6dd5",
-                            "type": "melee_weapon",
-                            "damage": {"type": "imp", "st": "thr"},
-                            "strength": "8",
-                            "usage": "Thrust",
-                            "reach": "1",
-                            "parry": "0",
+                            {"type": "skill", "name": "Sword!"},
+                        ],
+                        "calc": {
+                            "level": 10,
+                            "parry": "8",
                             "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Shortsword"},
-                                {"type": "skill", "name": "Broadsword", "modifier": -2},
-                                {
-                                    "type": "skill",
-                                    "name": "Force Sword",
-                                    "modifier": -4,
-                                },
-                                {"type": "skill", "name": "Jitte/Sai", "modifier": -3},
-                                {"type": "skill", "name": "Knife", "modifier": -4},
-                                {"type": "skill", "name": "Saber", "modifier": -4},
-                                {"type": "skill", "name": "Smallsword", "modifier": -4},
-                                {"type": "skill", "name": "Tonfa", "modifier": -3},
-                                {"type": "skill", "name": "Sword!"},
-                            ],
-                            "calc": {
-                                "level": 10,
-                                "parry": "8",
-                                "block": "No",
-                                "damage": "1d-2 imp",
-                            },
+                            "damage": "1d+1 cr",
                         },
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 400, "extended_weight": "2 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(shortswordEquipment)
-            # Greataxe or Great Axe -> Two-Handed Axe/Mace Skill, Great Axe Equipment
-            elif action["name"] == "Greataxe" or action["name"] == "Great Axe":
-                # region Two-Handed Axe/Mace Skill
-                twoHandedAxeMaceSkill = {
-                    "id": "0f2e8a3a-8fb5-427d-8490-2233e3fa664e",
-                    "type": "skill",
-                    "name": "Two-Handed Axe/Mace",
-                    "reference": "B208",
-                    "tags": ["Combat", "Melee Combat", "Weapon"],
-                    "difficulty": "dx/a",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -5,
-                        "level": 6,
-                        "adjusted_level": 6,
-                        "points": -6,
                     },
-                    "defaults": [
-                        {"type": "dx", "modifier": -5},
-                        {"type": "skill", "name": "Axe/Mace", "modifier": -3},
-                        {"type": "skill", "name": "Polearm", "modifier": -4},
-                        {"type": "skill", "name": "Two-Handed Flail", "modifier": -4},
-                    ],
-                    "calc": {"level": 10, "rsl": "DX-1"},
-                }
-                # endregion
-                default_data["skills"].append(twoHandedAxeMaceSkill)
-                # region Greate Axe Equipment
-                greatAxeEquipment = {
-                    "id": "459ab90c-7aab-4cf6-9613-32e582ac6b8d",
-                    "type": "equipment",
-                    "description": "Great Axe",
-                    "reference": "B274",
-                    "tech_level": "1",
-                    "tags": ["Melee Weapon"],
-                    "quantity": 1,
-                    "value": 100,
-                    "weight": "8 lb",
-                    "weapons": [
-                        {
-                            "id": "f6860129-d553-43d0-a82a-3bae8210a992",
-                            "type": "melee_weapon",
-                            "damage": {"type": "cut", "st": "sw", "base": "3"},
-                            "strength": "12‡",
-                            "usage": "Swung",
-                            "reach": "1,2*",
-                            "parry": "0U",
-                            "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Two-Handed Axe/Mace"},
-                                {"type": "skill", "name": "Axe/Mace", "modifier": -3},
-                                {"type": "skill", "name": "Polearm", "modifier": -4},
-                                {
-                                    "type": "skill",
-                                    "name": "Two-Handed Flail",
-                                    "modifier": -4,
-                                },
-                            ],
-                            "calc": {
-                                "level": 8,
-                                "parry": "7U",
-                                "block": "No",
-                                "damage": "1d+3 cut",
+                    {
+                        "id": "480b3768-4946-4e04-b117-3d1b843b36f3",
+                        "type": "melee_weapon",
+                        "damage": {"type": "cr", "st": "thr", "base": "1"},
+                        "strength": "10",
+                        "usage": "Thrust",
+                        "reach": "1",
+                        "parry": "0",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {
+                                "type": "skill",
+                                "name": "Force Sword",
+                                "modifier": -4,
                             },
-                        }
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 100, "extended_weight": "8 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(greatAxeEquipment)
-            # Hand Crossbow -> Crossbow Skill, Pistol Crossbow Equipment
-            elif action["name"] == "Hand Crossbow":
-                # region Crossbow Skill
-                crossbowSkill = {
-                    "id": "d01481f1-7182-42d0-bf21-ab074ce090b2",
-                    "type": "skill",
-                    "name": "Crossbow",
-                    "reference": "B186",
-                    "tags": ["Combat", "Ranged Combat", "Weapon"],
-                    "difficulty": "dx/e",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -4,
-                        "level": 7,
-                        "adjusted_level": 7,
-                        "points": -7,
-                    },
-                    "defaults": [{"type": "dx", "modifier": -4}],
-                    "calc": {"level": 11, "rsl": "DX+0"},
-                }
-                # endregion
-                default_data["skills"].append(crossbowSkill)
-                # region Hand Crossbow Equipment
-                handCrossbowEquipment = {
-                    "id": "00941d41-0574-4d80-a6a3-54f2586b2cca",
-                    "type": "equipment",
-                    "description": "Pistol Crossbow",
-                    "reference": "B276",
-                    "tech_level": "3",
-                    "tags": ["Missile Weapon", "UsesAmmoType:Bolt"],
-                    "rated_strength": 7,
-                    "quantity": 1,
-                    "value": 150,
-                    "weight": "4 lb",
-                    "weapons": [
-                        {
-                            "id": "5e3257b7-30d3-431d-8f2a-e6bc491f02e2",
-                            "type": "ranged_weapon",
-                            "damage": {"type": "imp", "st": "thr", "base": "2"},
-                            "strength": "7",
-                            "accuracy": "1",
-                            "range": "x15/x20",
-                            "rate_of_fire": "1",
-                            "shots": "1(4)",
-                            "bulk": "-4",
-                            "defaults": [
-                                {"type": "dx", "modifier": -4},
-                                {"type": "skill", "name": "Crossbow"},
-                            ],
-                            "calc": {
-                                "level": 7,
-                                "range": "105/140",
-                                "damage": "1d-1 imp",
+                            {"type": "skill", "name": "Broadsword"},
+                            {"type": "skill", "name": "Rapier", "modifier": -4},
+                            {"type": "skill", "name": "Saber", "modifier": -4},
+                            {"type": "skill", "name": "Shortsword", "modifier": -2},
+                            {
+                                "type": "skill",
+                                "name": "Two-Handed Sword",
+                                "modifier": -4,
                             },
-                        }
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 150, "extended_weight": "4 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(handCrossbowEquipment)
-            # Heavy Crossbow -> Crossbow Skill, Heavy Crossbow Equipment
-            elif action["name"] == "Heavy Crossbow":
-                # region Crossbow Skill
-                crossbowSkill = {
-                    "id": "d01481f1-7182-42d0-bf21-ab074ce090b2",
-                    "type": "skill",
-                    "name": "Crossbow",
-                    "reference": "B186",
-                    "tags": ["Combat", "Ranged Combat", "Weapon"],
-                    "difficulty": "dx/e",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -4,
-                        "level": 7,
-                        "adjusted_level": 7,
-                        "points": -7,
+                            {"type": "skill", "name": "Sword!"},
+                        ],
+                        "calc": {
+                            "level": 10,
+                            "parry": "8",
+                            "block": "No",
+                            "damage": "1d-1 cr",
+                        },
                     },
-                    "defaults": [{"type": "dx", "modifier": -4}],
-                    "calc": {"level": 11, "rsl": "DX+0"},
-                }
-                # endregion
-                default_data["skills"].append(crossbowSkill)
-                # region Heavy Crossbow Equipment
-                heavyCrossbowEquipment = {
-                    "id": "86cc2a19-4adf-4dd2-8ce7-c798946f1035",
-                    "type": "equipment",
-                    "description": "Military Crossbow",
-                    "reference": "LT74",
-                    "notes": "Steel crossbow (See LT78, Note 6)",
-                    "tech_level": "4",
-                    "tags": ["Missile Weapon"],
-                    "quantity": 1,
-                    "value": 750,
-                    "weight": "15 lb",
-                    "weapons": [
-                        {
-                            "id": "d0a00dea-04b6-4381-a827-13d8553dbd66",
-                            "type": "ranged_weapon",
-                            "damage": {"type": "imp", "st": "thr", "base": "5"},
-                            "strength": "12†",
-                            "usage": "Fire Bolt",
-                            "accuracy": "4",
-                            "range": "x25/x30",
-                            "rate_of_fire": "1",
-                            "shots": "1(32)",
-                            "bulk": "-6",
-                            "defaults": [
-                                {"type": "dx", "modifier": -4},
-                                {"type": "skill", "name": "Crossbow"},
-                            ],
-                            "calc": {
-                                "level": 12,
-                                "range": "300/360",
-                                "damage": "1d+4 imp",
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 5, "extended_weight": "3 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(lightClubEquipment)
+        # Scimitar or Shortsword -> Shortsword Skill, Shortsword Equipment
+        elif action.name == "Scimitar" or action.name == "Shortsword":
+            # region Shortsword Skill
+            shortswordSkill = {
+                "id": "360f5f71-5201-47a5-a511-af7159565b9c",
+                "type": "skill",
+                "name": "Shortsword",
+                "reference": "B209",
+                "tags": ["Combat", "Melee Combat", "Weapon"],
+                "difficulty": "dx/a",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -5,
+                    "level": 6,
+                    "adjusted_level": 6,
+                    "points": -6,
+                },
+                "defaults": [
+                    {"type": "skill", "name": "Broadsword", "modifier": -2},
+                    {"type": "skill", "name": "Force Sword", "modifier": -4},
+                    {"type": "skill", "name": "Jitte/Sai", "modifier": -3},
+                    {"type": "skill", "name": "Knife", "modifier": -4},
+                    {"type": "skill", "name": "Saber", "modifier": -4},
+                    {"type": "skill", "name": "Smallsword", "modifier": -4},
+                    {"type": "skill", "name": "Tonfa", "modifier": -3},
+                    {"type": "dx", "modifier": -5},
+                ],
+                "calc": {"level": 10, "rsl": "DX-1"},
+            }
+            # endregion
+            default_data["skills"].append(shortswordSkill)
+            # region Shortsword Equipment
+            shortswordEquipment = {
+                "id": "dd4eb08c-679a-4e4b-834e-8d610f4d64cf",
+                "type": "equipment",
+                "description": "Shortsword",
+                "reference": "B273",
+                "tech_level": "2",
+                "tags": ["Melee Weapon"],
+                "quantity": 1,
+                "value": 400,
+                "weight": "2 lb",
+                "weapons": [
+                    {
+                        "id": "12c9f475-1517-434b-9a98-b89941370fd2",
+                        "type": "melee_weapon",
+                        "damage": {"type": "cut", "st": "sw"},
+                        "strength": "8",
+                        "usage": "Swung",
+                        "reach": "1",
+                        "parry": "0",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Shortsword"},
+                            {"type": "skill", "name": "Broadsword", "modifier": -2},
+                            {
+                                "type": "skill",
+                                "name": "Force Sword",
+                                "modifier": -4,
                             },
-                        }
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 750, "extended_weight": "15 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(heavyCrossbowEquipment)
-            # Spear -> Spear Skill, Spear Equipment
-            elif action["name"] == "Spear":
-                # region Spear Skill
-                spearSkill = {
-                    "id": "71d611f4-adef-4c59-9e29-7828a5832a64",
-                    "type": "skill",
-                    "name": "Spear",
-                    "reference": "B208",
-                    "tags": ["Combat", "Melee Combat", "Weapon"],
-                    "difficulty": "dx/a",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -5,
-                        "level": 6,
-                        "adjusted_level": 6,
-                        "points": -6,
-                    },
-                    "defaults": [
-                        {"type": "dx", "modifier": -5},
-                        {"type": "skill", "name": "Polearm", "modifier": -4},
-                        {"type": "skill", "name": "Staff", "modifier": -2},
-                    ],
-                    "calc": {"level": 10, "rsl": "DX-1"},
-                }
-                # endregion
-                default_data["skills"].append(spearSkill)
-                # region Spear Equipment
-                spearEquipment = {
-                    "id": "25ddaedf-0710-4902-8eb3-36885c64219a",
-                    "type": "equipment",
-                    "description": "Spear",
-                    "reference": "B273",
-                    "tech_level": "0",
-                    "tags": ["Melee Weapon", "Missile Weapon"],
-                    "quantity": 1,
-                    "value": 40,
-                    "weight": "4 lb",
-                    "weapons": [
-                        {
-                            "id": "a0ab4b29-3d89-4e1a-b631-242a5dd9061a",
-                            "type": "melee_weapon",
-                            "damage": {"type": "imp", "st": "thr", "base": "2"},
-                            "strength": "9",
-                            "usage": "Thrust",
-                            "reach": "1*",
-                            "parry": "0",
+                            {"type": "skill", "name": "Jitte/Sai", "modifier": -3},
+                            {"type": "skill", "name": "Knife", "modifier": -4},
+                            {"type": "skill", "name": "Saber", "modifier": -4},
+                            {"type": "skill", "name": "Smallsword", "modifier": -4},
+                            {"type": "skill", "name": "Tonfa", "modifier": -3},
+                            {"type": "skill", "name": "Sword!"},
+                        ],
+                        "calc": {
+                            "level": 10,
+                            "parry": "8",
                             "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Spear"},
-                                {"type": "skill", "name": "Polearm", "modifier": -4},
-                                {"type": "skill", "name": "Staff", "modifier": -2},
-                            ],
-                            "calc": {
-                                "level": 10,
-                                "parry": "8",
-                                "block": "No",
-                                "damage": "1d+1 imp",
-                            },
+                            "damage": "1d cut",
                         },
-                        {
-                            "id": "c08a3872-56ac-438a-91af-b5164b8af563",
-                            "type": "melee_weapon",
-                            "damage": {"type": "imp", "st": "thr", "base": "3"},
-                            "strength": "9†",
-                            "usage": "Thrust",
-                            "reach": "1,2*",
-                            "parry": "0",
-                            "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Spear"},
-                                {"type": "skill", "name": "Polearm", "modifier": -4},
-                                {"type": "skill", "name": "Staff", "modifier": -2},
-                            ],
-                            "calc": {
-                                "level": 10,
-                                "parry": "8",
-                                "block": "No",
-                                "damage": "1d+2 imp",
+                    },
+                    {
+                        "id": "c0366cd4-e9df-4ea5-b114-3fa3850b6dd5",
+                        "type": "melee_weapon",
+                        "damage": {"type": "imp", "st": "thr"},
+                        "strength": "8",
+                        "usage": "Thrust",
+                        "reach": "1",
+                        "parry": "0",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Shortsword"},
+                            {"type": "skill", "name": "Broadsword", "modifier": -2},
+                            {
+                                "type": "skill",
+                                "name": "Force Sword",
+                                "modifier": -4,
                             },
+                            {"type": "skill", "name": "Jitte/Sai", "modifier": -3},
+                            {"type": "skill", "name": "Knife", "modifier": -4},
+                            {"type": "skill", "name": "Saber", "modifier": -4},
+                            {"type": "skill", "name": "Smallsword", "modifier": -4},
+                            {"type": "skill", "name": "Tonfa", "modifier": -3},
+                            {"type": "skill", "name": "Sword!"},
+                        ],
+                        "calc": {
+                            "level": 10,
+                            "parry": "8",
+                            "block": "No",
+                            "damage": "1d-2 imp",
                         },
-                        {
-                            "id": "144a40da-e63e-47c5-86df-45782f6c5c35",
-                            "type": "ranged_weapon",
-                            "damage": {"type": "imp", "st": "thr", "base": "3"},
-                            "strength": "9",
-                            "usage": "Thrown",
-                            "accuracy": "+2",
-                            "range": "x1/x1.5",
-                            "rate_of_fire": "1",
-                            "shots": "T(1)",
-                            "bulk": "-6",
-                            "defaults": [
-                                {"type": "dx", "modifier": -4},
-                                {
-                                    "type": "skill",
-                                    "name": "Thrown Weapon",
-                                    "specialization": "Spear",
-                                },
-                                {
-                                    "type": "skill",
-                                    "name": "Spear Thrower",
-                                    "modifier": -4,
-                                },
-                                {
-                                    "type": "skill",
-                                    "name": "Thrown Weapon",
-                                    "specialization": "Harpoon",
-                                    "modifier": -2,
-                                },
-                            ],
-                            "calc": {
-                                "level": 7,
-                                "range": "12/18",
-                                "damage": "1d+2 imp",
+                    },
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 400, "extended_weight": "2 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(shortswordEquipment)
+        # Greataxe or Great Axe -> Two-Handed Axe/Mace Skill, Great Axe Equipment
+        elif action.name == "Greataxe" or action.name == "Great Axe":
+            # region Two-Handed Axe/Mace Skill
+            twoHandedAxeMaceSkill = {
+                "id": "0f2e8a3a-8fb5-427d-8490-2233e3fa664e",
+                "type": "skill",
+                "name": "Two-Handed Axe/Mace",
+                "reference": "B208",
+                "tags": ["Combat", "Melee Combat", "Weapon"],
+                "difficulty": "dx/a",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -5,
+                    "level": 6,
+                    "adjusted_level": 6,
+                    "points": -6,
+                },
+                "defaults": [
+                    {"type": "dx", "modifier": -5},
+                    {"type": "skill", "name": "Axe/Mace", "modifier": -3},
+                    {"type": "skill", "name": "Polearm", "modifier": -4},
+                    {"type": "skill", "name": "Two-Handed Flail", "modifier": -4},
+                ],
+                "calc": {"level": 10, "rsl": "DX-1"},
+            }
+            # endregion
+            default_data["skills"].append(twoHandedAxeMaceSkill)
+            # region Greate Axe Equipment
+            greatAxeEquipment = {
+                "id": "459ab90c-7aab-4cf6-9613-32e582ac6b8d",
+                "type": "equipment",
+                "description": "Great Axe",
+                "reference": "B274",
+                "tech_level": "1",
+                "tags": ["Melee Weapon"],
+                "quantity": 1,
+                "value": 100,
+                "weight": "8 lb",
+                "weapons": [
+                    {
+                        "id": "f6860129-d553-43d0-a82a-3bae8210a992",
+                        "type": "melee_weapon",
+                        "damage": {"type": "cut", "st": "sw", "base": "3"},
+                        "strength": "12‡",
+                        "usage": "Swung",
+                        "reach": "1,2*",
+                        "parry": "0U",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Two-Handed Axe/Mace"},
+                            {"type": "skill", "name": "Axe/Mace", "modifier": -3},
+                            {"type": "skill", "name": "Polearm", "modifier": -4},
+                            {
+                                "type": "skill",
+                                "name": "Two-Handed Flail",
+                                "modifier": -4,
                             },
+                        ],
+                        "calc": {
+                            "level": 8,
+                            "parry": "7U",
+                            "block": "No",
+                            "damage": "1d+3 cut",
                         },
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 40, "extended_weight": "4 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(spearEquipment)
-            # Javelin -> Spear Skill, Spear Throw Skill, Javelin Equipment
-            elif action["name"] == "Javelin":
-                # region Spear Skill
-                spearSkill = {
-                    "id": "71d611f4-adef-4c59-9e29-7828a5832a64",
-                    "type": "skill",
-                    "name": "Spear",
-                    "reference": "B208",
-                    "tags": ["Combat", "Melee Combat", "Weapon"],
-                    "difficulty": "dx/a",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -5,
-                        "level": 6,
-                        "adjusted_level": 6,
-                        "points": -6,
-                    },
-                    "defaults": [
-                        {"type": "dx", "modifier": -5},
-                        {"type": "skill", "name": "Polearm", "modifier": -4},
-                        {"type": "skill", "name": "Staff", "modifier": -2},
-                    ],
-                    "calc": {"level": 10, "rsl": "DX-1"},
-                }
-                # endregion
-                default_data["skills"].append(spearSkill)
-                # region Spear Throw Skill
-                spearThrowSkill = {
-                    "id": "4f5ec478-8673-40ba-9a08-b6650b523ed3",
-                    "type": "skill",
-                    "name": "Thrown Weapon",
-                    "reference": "B226",
-                    "tags": ["Combat", "Ranged Combat", "Weapon"],
-                    "specialization": "Spear",
-                    "difficulty": "dx/e",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -4,
-                        "level": 7,
-                        "adjusted_level": 7,
-                        "points": -7,
-                    },
-                    "defaults": [
-                        {"type": "dx", "modifier": -4},
-                        {"type": "skill", "name": "Spear Thrower", "modifier": -4},
-                        {
-                            "type": "skill",
-                            "name": "Thrown Weapon",
-                            "specialization": "Harpoon",
-                            "modifier": -2,
+                    }
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 100, "extended_weight": "8 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(greatAxeEquipment)
+        # Hand Crossbow -> Crossbow Skill, Pistol Crossbow Equipment
+        elif action.name == "Hand Crossbow":
+            # region Crossbow Skill
+            crossbowSkill = {
+                "id": "d01481f1-7182-42d0-bf21-ab074ce090b2",
+                "type": "skill",
+                "name": "Crossbow",
+                "reference": "B186",
+                "tags": ["Combat", "Ranged Combat", "Weapon"],
+                "difficulty": "dx/e",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -4,
+                    "level": 7,
+                    "adjusted_level": 7,
+                    "points": -7,
+                },
+                "defaults": [{"type": "dx", "modifier": -4}],
+                "calc": {"level": 11, "rsl": "DX+0"},
+            }
+            # endregion
+            default_data["skills"].append(crossbowSkill)
+            # region Hand Crossbow Equipment
+            handCrossbowEquipment = {
+                "id": "00941d41-0574-4d80-a6a3-54f2586b2cca",
+                "type": "equipment",
+                "description": "Pistol Crossbow",
+                "reference": "B276",
+                "tech_level": "3",
+                "tags": ["Missile Weapon", "UsesAmmoType:Bolt"],
+                "rated_strength": 7,
+                "quantity": 1,
+                "value": 150,
+                "weight": "4 lb",
+                "weapons": [
+                    {
+                        "id": "5e3257b7-30d3-431d-8f2a-e6bc491f02e2",
+                        "type": "ranged_weapon",
+                        "damage": {"type": "imp", "st": "thr", "base": "2"},
+                        "strength": "7",
+                        "accuracy": "1",
+                        "range": "x15/x20",
+                        "rate_of_fire": "1",
+                        "shots": "1(4)",
+                        "bulk": "-4",
+                        "defaults": [
+                            {"type": "dx", "modifier": -4},
+                            {"type": "skill", "name": "Crossbow"},
+                        ],
+                        "calc": {
+                            "level": 7,
+                            "range": "105/140",
+                            "damage": "1d-1 imp",
                         },
-                    ],
-                    "calc": {"level": 11, "rsl": "DX+0"},
-                }
-                # endregion
-                default_data["skills"].append(spearThrowSkill)
-                # region Javelin Equipment
-                javelinEquipment = {
-                    "id": "c08950a3-f4ca-40ba-9ed2-995dbe78ade1",
-                    "type": "equipment",
-                    "description": "Javelin",
-                    "reference": "B273",
-                    "tech_level": "1",
-                    "tags": ["AmmoType:Javelin", "Melee Weapon", "Missile Weapon"],
-                    "quantity": 1,
-                    "value": 30,
-                    "weight": "2 lb",
-                    "weapons": [
-                        {
-                            "id": "707acb6e-2ee2-49ae-a12d-86e8a805256b",
-                            "type": "melee_weapon",
-                            "damage": {"type": "imp", "st": "thr", "base": "1"},
-                            "strength": "6",
-                            "usage": "Thrust",
-                            "reach": "1",
-                            "parry": "0",
-                            "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Spear"},
-                                {"type": "skill", "name": "Polearm", "modifier": -4},
-                                {"type": "skill", "name": "Staff", "modifier": -2},
-                            ],
-                            "calc": {
-                                "level": 10,
-                                "parry": "8",
-                                "block": "No",
-                                "damage": "1d imp",
-                            },
+                    }
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 150, "extended_weight": "4 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(handCrossbowEquipment)
+        # Heavy Crossbow -> Crossbow Skill, Heavy Crossbow Equipment
+        elif action.name == "Heavy Crossbow":
+            # region Crossbow Skill
+            crossbowSkill = {
+                "id": "d01481f1-7182-42d0-bf21-ab074ce090b2",
+                "type": "skill",
+                "name": "Crossbow",
+                "reference": "B186",
+                "tags": ["Combat", "Ranged Combat", "Weapon"],
+                "difficulty": "dx/e",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -4,
+                    "level": 7,
+                    "adjusted_level": 7,
+                    "points": -7,
+                },
+                "defaults": [{"type": "dx", "modifier": -4}],
+                "calc": {"level": 11, "rsl": "DX+0"},
+            }
+            # endregion
+            default_data["skills"].append(crossbowSkill)
+            # region Heavy Crossbow Equipment
+            heavyCrossbowEquipment = {
+                "id": "86cc2a19-4adf-4dd2-8ce7-c798946f1035",
+                "type": "equipment",
+                "description": "Military Crossbow",
+                "reference": "LT74",
+                "notes": "Steel crossbow (See LT78, Note 6)",
+                "tech_level": "4",
+                "tags": ["Missile Weapon"],
+                "quantity": 1,
+                "value": 750,
+                "weight": "15 lb",
+                "weapons": [
+                    {
+                        "id": "d0a00dea-04b6-4381-a827-13d8553dbd66",
+                        "type": "ranged_weapon",
+                        "damage": {"type": "imp", "st": "thr", "base": "5"},
+                        "strength": "12†",
+                        "usage": "Fire Bolt",
+                        "accuracy": "4",
+                        "range": "x25/x30",
+                        "rate_of_fire": "1",
+                        "shots": "1(32)",
+                        "bulk": "-6",
+                        "defaults": [
+                            {"type": "dx", "modifier": -4},
+                            {"type": "skill", "name": "Crossbow"},
+                        ],
+                        "calc": {
+                            "level": 12,
+                            "range": "300/360",
+                            "damage": "1d+4 imp",
                         },
-                        {
-                            "id": "fb94724e-fb6c-48d9-85b2-5c95a3a66a53",
-                            "type": "ranged_weapon",
-                            "damage": {"type": "imp", "st": "thr", "base": "1"},
-                            "strength": "6",
-                            "usage": "Thrown",
-                            "accuracy": "+3",
-                            "range": "x1.5/x2.5",
-                            "rate_of_fire": "1",
-                            "shots": "T(1)",
-                            "bulk": "-4",
-                            "defaults": [
-                                {"type": "dx", "modifier": -4},
-                                {
-                                    "type": "skill",
-                                    "name": "Thrown Weapon",
-                                    "specialization": "Spear",
-                                },
-                                {
-                                    "type": "skill",
-                                    "name": "Spear Thrower",
-                                    "modifier": -4,
-                                },
-                                {
-                                    "type": "skill",
-                                    "name": "Thrown Weapon",
-                                    "specialization": "Harpoon",
-                                    "modifier": -2,
-                                },
-                            ],
-                            "calc": {"level": 11, "range": "18/30", "damage": "1d imp"},
+                    }
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 750, "extended_weight": "15 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(heavyCrossbowEquipment)
+        # Spear -> Spear Skill, Spear Equipment
+        elif action.name == "Spear":
+            # region Spear Skill
+            spearSkill = {
+                "id": "71d611f4-adef-4c59-9e29-7828a5832a64",
+                "type": "skill",
+                "name": "Spear",
+                "reference": "B208",
+                "tags": ["Combat", "Melee Combat", "Weapon"],
+                "difficulty": "dx/a",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -5,
+                    "level": 6,
+                    "adjusted_level": 6,
+                    "points": -6,
+                },
+                "defaults": [
+                    {"type": "dx", "modifier": -5},
+                    {"type": "skill", "name": "Polearm", "modifier": -4},
+                    {"type": "skill", "name": "Staff", "modifier": -2},
+                ],
+                "calc": {"level": 10, "rsl": "DX-1"},
+            }
+            # endregion
+            default_data["skills"].append(spearSkill)
+            # region Spear Equipment
+            spearEquipment = {
+                "id": "25ddaedf-0710-4902-8eb3-36885c64219a",
+                "type": "equipment",
+                "description": "Spear",
+                "reference": "B273",
+                "tech_level": "0",
+                "tags": ["Melee Weapon", "Missile Weapon"],
+                "quantity": 1,
+                "value": 40,
+                "weight": "4 lb",
+                "weapons": [
+                    {
+                        "id": "a0ab4b29-3d89-4e1a-b631-242a5dd9061a",
+                        "type": "melee_weapon",
+                        "damage": {"type": "imp", "st": "thr", "base": "2"},
+                        "strength": "9",
+                        "usage": "Thrust",
+                        "reach": "1*",
+                        "parry": "0",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Spear"},
+                            {"type": "skill", "name": "Polearm", "modifier": -4},
+                            {"type": "skill", "name": "Staff", "modifier": -2},
+                        ],
+                        "calc": {
+                            "level": 10,
+                            "parry": "8",
+                            "block": "No",
+                            "damage": "1d+1 imp",
                         },
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 30, "extended_weight": "2 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(javelinEquipment)
-            # Longsword / Long Sword -> Broadsword Skill, Broadsword Equipment
-            elif action["name"] == "Longsword" or action["name"] == "Long Sword":
-                # region Broadsword Skill
-                broadswordSkill = {
-                    "id": "2041b1b5-68df-4978-bf0e-c09dcb997a73",
-                    "type": "skill",
-                    "name": "Broadsword",
-                    "reference": "B208",
-                    "tags": ["Combat", "Melee Combat", "Weapon"],
-                    "difficulty": "dx/a",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -5,
-                        "level": 6,
-                        "adjusted_level": 6,
-                        "points": -6,
                     },
-                    "defaults": [
-                        {"type": "skill", "name": "Force Sword", "modifier": -4},
-                        {"type": "skill", "name": "Rapier", "modifier": -4},
-                        {"type": "skill", "name": "Saber", "modifier": -4},
-                        {"type": "skill", "name": "Shortsword", "modifier": -2},
-                        {"type": "skill", "name": "Two-Handed Sword", "modifier": -4},
-                        {"type": "dx", "modifier": -5},
-                    ],
-                    "calc": {"level": 10, "rsl": "DX-1"},
-                }
-                # endregion
-                default_data["skills"].append(broadswordSkill)
-                # region Broadsword Equipment
-                broadswordEquipment = {
-                    "id": "8df98dbb-c1d5-4cc9-83a1-350fba6aaa1c",
-                    "type": "equipment",
-                    "description": "Broadsword",
-                    "reference": "B271",
-                    "tech_level": "2",
-                    "tags": ["Melee Weapon"],
-                    "quantity": 1,
-                    "value": 500,
-                    "weight": "3 lb",
-                    "weapons": [
-                        {
-                            "id": "294c4e7e-c390-4660-8c70-008dba5dad1a",
-                            "type": "melee_weapon",
-                            "damage": {"type": "cut", "st": "sw", "base": "1"},
-                            "strength": "10",
-                            "usage": "Swung",
-                            "reach": "1",
-                            "parry": "0",
+                    {
+                        "id": "c08a3872-56ac-438a-91af-b5164b8af563",
+                        "type": "melee_weapon",
+                        "damage": {"type": "imp", "st": "thr", "base": "3"},
+                        "strength": "9†",
+                        "usage": "Thrust",
+                        "reach": "1,2*",
+                        "parry": "0",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Spear"},
+                            {"type": "skill", "name": "Polearm", "modifier": -4},
+                            {"type": "skill", "name": "Staff", "modifier": -2},
+                        ],
+                        "calc": {
+                            "level": 10,
+                            "parry": "8",
                             "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {
-                                    "type": "skill",
-                                    "name": "Force Sword",
-                                    "modifier": -4,
-                                },
-                                {"type": "skill", "name": "Broadsword"},
-                                {"type": "skill", "name": "Rapier", "modifier": -4},
-                                {"type": "skill", "name": "Saber", "modifier": -4},
-                                {"type": "skill", "name": "Shortsword", "modifier": -2},
-                                {
-                                    "type": "skill",
-                                    "name": "Two-Handed Sword",
-                                    "modifier": -4,
-                                },
-                                {"type": "skill", "name": "Sword!"},
-                            ],
-                            "calc": {
-                                "level": 10,
-                                "parry": "8",
-                                "block": "No",
-                                "damage": "1d+3 cut",
-                            },
+                            "damage": "1d+2 imp",
                         },
-                        {
-                            "id": "43ac8fd1-cfdf-4c93-8850-d276f4987761",
-                            "type": "melee_weapon",
-                            "damage": {"type": "cr", "st": "thr", "base": "1"},
-                            "strength": "10",
-                            "usage": "Thrust",
-                            "reach": "1",
-                            "parry": "0",
-                            "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {
-                                    "type": "skill",
-                                    "name": "Force Sword",
-                                    "modifier": -4,
-                                },
-                                {"type": "skill", "name": "Broadsword"},
-                                {"type": "skill", "name": "Rapier", "modifier": -4},
-                                {"type": "skill", "name": "Saber", "modifier": -4},
-                                {"type": "skill", "name": "Shortsword", "modifier": -2},
-                                {
-                                    "type": "skill",
-                                    "name": "Two-Handed Sword",
-                                    "modifier": -4,
-                                },
-                                {"type": "skill", "name": "Sword!"},
-                            ],
-                            "calc": {
-                                "level": 10,
-                                "parry": "8",
-                                "block": "No",
-                                "damage": "1d cr",
+                    },
+                    {
+                        "id": "144a40da-e63e-47c5-86df-45782f6c5c35",
+                        "type": "ranged_weapon",
+                        "damage": {"type": "imp", "st": "thr", "base": "3"},
+                        "strength": "9",
+                        "usage": "Thrown",
+                        "accuracy": "+2",
+                        "range": "x1/x1.5",
+                        "rate_of_fire": "1",
+                        "shots": "T(1)",
+                        "bulk": "-6",
+                        "defaults": [
+                            {"type": "dx", "modifier": -4},
+                            {
+                                "type": "skill",
+                                "name": "Thrown Weapon",
+                                "specialization": "Spear",
                             },
-                        },
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 500, "extended_weight": "3 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(broadswordEquipment)
-            # Longbow -> Longbow equipment, Bow Skill
-            elif action["name"] == "Longbow":
-                # region Longbow equipment
-                longbowEquipment = {
-                    "id": "99bbf283-906b-4993-8eb1-78ed83a4e61f",
-                    "type": "equipment",
-                    "description": "Longbow",
-                    "reference": "B275",
-                    "tech_level": "0",
-                    "tags": ["Missile Weapon", "UsesAmmoType:Arrow"],
-                    "rated_strength": 11,
-                    "quantity": 1,
-                    "value": 200,
-                    "weight": "3 lb",
-                    "weapons": [
-                        {
-                            "id": "8759c6ab-39fa-475c-9378-5329ad63a91c",
-                            "type": "ranged_weapon",
-                            "damage": {"type": "imp", "st": "thr", "base": "2"},
-                            "strength": "11†",
-                            "accuracy": "3",
-                            "range": "x15/x20",
-                            "rate_of_fire": "1",
-                            "shots": "1(2)",
-                            "bulk": "-8",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Bow"},
-                            ],
-                            "calc": {
-                                "level": 10,
-                                "range": "165/220",
-                                "damage": "1d+1 imp",
+                            {
+                                "type": "skill",
+                                "name": "Spear Thrower",
+                                "modifier": -4,
                             },
-                        }
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 200, "extended_weight": "3 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(longbowEquipment)
-                # region Bow Skill
-                bowSkill = {
-                    "id": "41a2c7dd-3283-4782-a7d8-20e85ff1d368",
-                    "type": "skill",
-                    "name": "Bow",
-                    "reference": "B182",
-                    "tags": ["Combat", "Ranged Combat", "Weapon"],
-                    "difficulty": "dx/a",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -5,
-                        "level": 6,
-                        "adjusted_level": 6,
-                        "points": -6,
-                    },
-                    "defaults": [{"type": "dx", "modifier": -5}],
-                    "calc": {"level": 10, "rsl": "DX-1"},
-                }
-                # endregion
-                default_data["skills"].append(bowSkill)
-            # Shortbow -> Shortbow equipment, Bow Skill
-            elif action["name"] == "Shortbow":
-                # region Shortbow equipment
-                shortbowEquipment = {
-                    "id": "99bbf283-906b-4993-8eb1-78ed83a4e61f",
-                    "type": "equipment",
-                    "description": "Longbow",
-                    "reference": "B275",
-                    "tech_level": "0",
-                    "tags": ["Missile Weapon", "UsesAmmoType:Arrow"],
-                    "rated_strength": 11,
-                    "quantity": 1,
-                    "value": 200,
-                    "weight": "3 lb",
-                    "weapons": [
-                        {
-                            "id": "8759c6ab-39fa-475c-9378-5329ad63a91c",
-                            "type": "ranged_weapon",
-                            "damage": {"type": "imp", "st": "thr", "base": "2"},
-                            "strength": "11†",
-                            "accuracy": "3",
-                            "range": "x15/x20",
-                            "rate_of_fire": "1",
-                            "shots": "1(2)",
-                            "bulk": "-8",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Bow"},
-                            ],
-                            "calc": {
-                                "level": 10,
-                                "range": "165/220",
-                                "damage": "1d+1 imp",
+                            {
+                                "type": "skill",
+                                "name": "Thrown Weapon",
+                                "specialization": "Harpoon",
+                                "modifier": -2,
                             },
-                        }
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 200, "extended_weight": "3 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(shortbowEquipment)
-                # region Bow Skill
-                bowSkill = {
-                    "id": "41a2c7dd-3283-4782-a7d8-20e85ff1d368",
-                    "type": "skill",
-                    "name": "Bow",
-                    "reference": "B182",
-                    "tags": ["Combat", "Ranged Combat", "Weapon"],
-                    "difficulty": "dx/a",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -5,
-                        "level": 6,
-                        "adjusted_level": 6,
-                        "points": -6,
+                        ],
+                        "calc": {
+                            "level": 7,
+                            "range": "12/18",
+                            "damage": "1d+2 imp",
+                        },
                     },
-                    "defaults": [{"type": "dx", "modifier": -5}],
-                    "calc": {"level": 10, "rsl": "DX-1"},
-                }
-                # endregion
-                default_data["skills"].append(bowSkill)
-            # Rapier -> Rapier Skill, Rapier Equipment
-            elif action["name"] == "Rapier":
-                # region Rapier Skill
-                rapierSkill = {
-                    "id": "cd367975-81e9-4869-ac6d-e716f9188339",
-                    "type": "skill",
-                    "name": "Rapier",
-                    "reference": "B208",
-                    "tags": ["Combat", "Melee Combat", "Weapon"],
-                    "difficulty": "dx/a",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -5,
-                        "level": 6,
-                        "adjusted_level": 6,
-                        "points": -6,
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 40, "extended_weight": "4 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(spearEquipment)
+        # Javelin -> Spear Skill, Spear Throw Skill, Javelin Equipment
+        elif action.name == "Javelin":
+            # region Spear Skill
+            spearSkill = {
+                "id": "71d611f4-adef-4c59-9e29-7828a5832a64",
+                "type": "skill",
+                "name": "Spear",
+                "reference": "B208",
+                "tags": ["Combat", "Melee Combat", "Weapon"],
+                "difficulty": "dx/a",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -5,
+                    "level": 6,
+                    "adjusted_level": 6,
+                    "points": -6,
+                },
+                "defaults": [
+                    {"type": "dx", "modifier": -5},
+                    {"type": "skill", "name": "Polearm", "modifier": -4},
+                    {"type": "skill", "name": "Staff", "modifier": -2},
+                ],
+                "calc": {"level": 10, "rsl": "DX-1"},
+            }
+            # endregion
+            default_data["skills"].append(spearSkill)
+            # region Spear Throw Skill
+            spearThrowSkill = {
+                "id": "4f5ec478-8673-40ba-9a08-b6650b523ed3",
+                "type": "skill",
+                "name": "Thrown Weapon",
+                "reference": "B226",
+                "tags": ["Combat", "Ranged Combat", "Weapon"],
+                "specialization": "Spear",
+                "difficulty": "dx/e",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -4,
+                    "level": 7,
+                    "adjusted_level": 7,
+                    "points": -7,
+                },
+                "defaults": [
+                    {"type": "dx", "modifier": -4},
+                    {"type": "skill", "name": "Spear Thrower", "modifier": -4},
+                    {
+                        "type": "skill",
+                        "name": "Thrown Weapon",
+                        "specialization": "Harpoon",
+                        "modifier": -2,
                     },
-                    "defaults": [
-                        {"type": "dx", "modifier": -5},
-                        {"type": "skill", "name": "Broadsword", "modifier": -4},
-                        {"type": "skill", "name": "Main-Gauche", "modifier": -3},
-                        {"type": "skill", "name": "Saber", "modifier": -3},
-                        {"type": "skill", "name": "Smallsword", "modifier": -3},
-                    ],
-                    "calc": {"level": 10, "rsl": "DX-1"},
-                }
-                # endregion
-                default_data["skills"].append(rapierSkill)
-                # region Rapier Equipment
-                rapierEquipment = {
-                    "id": "a8baa8c1-8cd5-497c-a4e8-e6ac5b038f80",
-                    "type": "equipment",
-                    "description": "Rapier",
-                    "reference": "B273",
-                    "tech_level": "4",
-                    "tags": ["Melee Weapon"],
-                    "quantity": 1,
-                    "value": 500,
-                    "weight": "2.75 lb",
-                    "weapons": [
-                        {
-                            "id": "faed2269-9c35-4b6c-b478-4d353e824920",
-                            "type": "melee_weapon",
-                            "damage": {"type": "imp", "st": "thr", "base": "1"},
-                            "strength": "9",
-                            "usage": "Thrust",
-                            "reach": "1,2",
-                            "parry": "0F",
+                ],
+                "calc": {"level": 11, "rsl": "DX+0"},
+            }
+            # endregion
+            default_data["skills"].append(spearThrowSkill)
+            # region Javelin Equipment
+            javelinEquipment = {
+                "id": "c08950a3-f4ca-40ba-9ed2-995dbe78ade1",
+                "type": "equipment",
+                "description": "Javelin",
+                "reference": "B273",
+                "tech_level": "1",
+                "tags": ["AmmoType:Javelin", "Melee Weapon", "Missile Weapon"],
+                "quantity": 1,
+                "value": 30,
+                "weight": "2 lb",
+                "weapons": [
+                    {
+                        "id": "707acb6e-2ee2-49ae-a12d-86e8a805256b",
+                        "type": "melee_weapon",
+                        "damage": {"type": "imp", "st": "thr", "base": "1"},
+                        "strength": "6",
+                        "usage": "Thrust",
+                        "reach": "1",
+                        "parry": "0",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Spear"},
+                            {"type": "skill", "name": "Polearm", "modifier": -4},
+                            {"type": "skill", "name": "Staff", "modifier": -2},
+                        ],
+                        "calc": {
+                            "level": 10,
+                            "parry": "8",
                             "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Rapier"},
-                                {"type": "skill", "name": "Broadsword", "modifier": -4},
-                                {
-                                    "type": "skill",
-                                    "name": "Main-Gauche",
-                                    "modifier": -3,
-                                },
-                                {"type": "skill", "name": "Saber", "modifier": -3},
-                                {"type": "skill", "name": "Smallsword", "modifier": -3},
-                                {"type": "skill", "name": "Sword!"},
-                            ],
-                            "calc": {
-                                "level": 10,
-                                "parry": "8F",
-                                "block": "No",
-                                "damage": "1d imp",
-                            },
-                        }
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 500, "extended_weight": "2.75 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(rapierEquipment)
-            # Greatclub or Great Club -> Axe/Mace Skill, Knobbed Club Equipment
-            elif action["name"] == "Greatclub" or action["name"] == "Great Club":
-                # region Axe/Mace Skill
-                axeMaceSkill = {
-                    "id": "9a8f4d0c-b66b-4605-a01f-e3534c2fd006",
-                    "type": "skill",
-                    "name": "Axe/Mace",
-                    "reference": "B208",
-                    "tags": ["Combat", "Melee Combat", "Weapon"],
-                    "difficulty": "dx/a",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -5,
-                        "level": 6,
-                        "adjusted_level": 6,
-                        "points": -6,
-                    },
-                    "defaults": [
-                        {"type": "dx", "modifier": -5},
-                        {
-                            "type": "skill",
-                            "name": "Two-Handed Axe/Mace",
-                            "modifier": -3,
+                            "damage": "1d imp",
                         },
-                        {"type": "skill", "name": "Flail", "modifier": -4},
-                    ],
-                    "calc": {"level": 10, "rsl": "DX-1"},
-                }
-                # endregion
-                default_data["skills"].append(axeMaceSkill)
-                # region Knobbed Club Equipment
-                knobbedClubEquipment = {
-                    "id": "8e7ed5b8-fed2-4c1f-a3f5-023bc19fde02",
-                    "type": "equipment",
-                    "description": "Knobbed Club",
-                    "reference": "LT58",
-                    "tech_level": "0",
-                    "tags": ["Melee Weapon"],
-                    "quantity": 1,
-                    "value": 20,
-                    "weight": "2 lb",
-                    "weapons": [
-                        {
-                            "id": "9bbcb7f6-447b-4905-a888-9a3834c5bb4d",
-                            "type": "melee_weapon",
-                            "damage": {"type": "cr", "st": "sw", "base": "1"},
-                            "strength": "8",
-                            "usage": "Swung",
-                            "reach": "1",
-                            "parry": "0",
-                            "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Axe/Mace"},
-                                {"type": "skill", "name": "Flail", "modifier": -4},
-                                {
-                                    "type": "skill",
-                                    "name": "Two-Handed Axe/Mace",
-                                    "modifier": -3,
-                                },
-                            ],
-                            "calc": {
-                                "level": 10,
-                                "parry": "8",
-                                "block": "No",
-                                "damage": "1d+3 cr",
+                    },
+                    {
+                        "id": "fb94724e-fb6c-48d9-85b2-5c95a3a66a53",
+                        "type": "ranged_weapon",
+                        "damage": {"type": "imp", "st": "thr", "base": "1"},
+                        "strength": "6",
+                        "usage": "Thrown",
+                        "accuracy": "+3",
+                        "range": "x1.5/x2.5",
+                        "rate_of_fire": "1",
+                        "shots": "T(1)",
+                        "bulk": "-4",
+                        "defaults": [
+                            {"type": "dx", "modifier": -4},
+                            {
+                                "type": "skill",
+                                "name": "Thrown Weapon",
+                                "specialization": "Spear",
                             },
-                        }
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 20, "extended_weight": "2 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(knobbedClubEquipment)
-            # Sling -> Sling Equipment, Sling Skill
-            elif action["name"] == "Sling":
-                # region Sling Equipment
-                slingEquipment = {
-                    "id": "7288b4d9-0c11-4b09-8ad4-e781cb5e13b9",
-                    "type": "equipment",
-                    "description": "Sling",
-                    "reference": "B276",
-                    "tech_level": "0",
-                    "tags": ["Missile Weapon", "UsesAmmoType:Sling"],
-                    "quantity": 1,
-                    "value": 20,
-                    "weight": "0.5 lb",
-                    "weapons": [
-                        {
-                            "id": "b566ba0b-ea56-4701-8f84-186385028e7b",
-                            "type": "ranged_weapon",
-                            "damage": {"type": "pi", "st": "sw"},
-                            "strength": "6",
-                            "accuracy": "0",
-                            "range": "x6/x10",
-                            "rate_of_fire": "1",
-                            "shots": "1(2)",
-                            "bulk": "-4",
-                            "defaults": [
-                                {"type": "dx", "modifier": -6},
-                                {"type": "skill", "name": "Sling"},
-                            ],
-                            "calc": {
-                                "level": 9,
-                                "range": "72/120",
-                                "damage": "1d+2 pi",
+                            {
+                                "type": "skill",
+                                "name": "Spear Thrower",
+                                "modifier": -4,
                             },
-                        }
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 20, "extended_weight": "0.5 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(slingEquipment)
-                # region Sling Skill
-                slingSkill = {
-                    "id": "eecbbb0c-c1a9-4c8a-b536-62ccd2f1109d",
-                    "type": "skill",
-                    "name": "Sling",
-                    "reference": "B221",
-                    "tags": ["Combat", "Ranged Combat", "Weapon"],
-                    "difficulty": "dx/h",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -6,
-                        "level": 5,
-                        "adjusted_level": 5,
-                        "points": -5,
-                    },
-                    "defaults": [{"type": "dx", "modifier": -6}],
-                    "calc": {"level": 9, "rsl": "DX-2"},
-                }
-                # endregion
-                default_data["skills"].append(slingSkill)
-            # Quarterstaff or Staff or Quarter Staff -> Staff Skill, Quarterstaff Equipment
-            elif (
-                action["name"] == "Quarterstaff"
-                or action["name"] == "Staff"
-                or action["name"] == "Quarter Staff"
-            ):
-                # region Staff Skill
-                staffSkill = {
-                    "id": "c1704e0f-ba0b-4896-8a7b-f93e2762f8c2",
-                    "type": "skill",
-                    "name": "Staff",
-                    "reference": "B208",
-                    "tags": ["Combat", "Melee Combat", "Weapon"],
-                    "difficulty": "dx/a",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -5,
-                        "level": 6,
-                        "adjusted_level": 6,
-                        "points": -6,
-                    },
-                    "defaults": [
-                        {"type": "dx", "modifier": -5},
-                        {"type": "skill", "name": "Polearm", "modifier": -4},
-                        {"type": "skill", "name": "Spear", "modifier": -2},
-                    ],
-                    "calc": {"level": 10, "rsl": "DX-1"},
-                }
-                # endregion
-                default_data["skills"].append(staffSkill)
-                # region Quarterstaff Equipment
-                quarterstaffEquipment = {
-                    "id": "49b5ba32-584f-4b8f-97b9-f3f5415b4a6c",
-                    "type": "equipment",
-                    "description": "Quarterstaff",
-                    "reference": "B273",
-                    "tech_level": "0",
-                    "tags": ["Melee Weapon"],
-                    "quantity": 1,
-                    "value": 10,
-                    "weight": "4 lb",
-                    "weapons": [
-                        {
-                            "id": "ad65dc1c-caf5-4c71-a880-84587832d8ea",
-                            "type": "melee_weapon",
-                            "damage": {"type": "cr", "st": "sw", "base": "2"},
-                            "strength": "7†",
-                            "usage": "Swung",
-                            "usage_notes": "Staff",
-                            "reach": "1,2",
-                            "parry": "+2",
-                            "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Staff"},
-                                {"type": "skill", "name": "Polearm", "modifier": -4},
-                                {"type": "skill", "name": "Spear", "modifier": -2},
-                            ],
-                            "calc": {
-                                "level": 10,
-                                "parry": "10",
-                                "block": "No",
-                                "damage": "1d+4 cr",
+                            {
+                                "type": "skill",
+                                "name": "Thrown Weapon",
+                                "specialization": "Harpoon",
+                                "modifier": -2,
                             },
-                        },
-                        {
-                            "id": "0f333350-cfd8-4fba-a202-b2bf19773be5",
-                            "type": "melee_weapon",
-                            "damage": {"type": "cr", "st": "thr", "base": "2"},
-                            "strength": "7†",
-                            "usage": "Thrust",
-                            "usage_notes": "Staff",
-                            "reach": "1,2",
-                            "parry": "+2",
-                            "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Staff"},
-                                {"type": "skill", "name": "Polearm", "modifier": -4},
-                                {"type": "skill", "name": "Spear", "modifier": -2},
-                            ],
-                            "calc": {
-                                "level": 10,
-                                "parry": "10",
-                                "block": "No",
-                                "damage": "1d+1 cr",
+                        ],
+                        "calc": {"level": 11, "range": "18/30", "damage": "1d imp"},
+                    },
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 30, "extended_weight": "2 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(javelinEquipment)
+        # Longsword / Long Sword -> Broadsword Skill, Broadsword Equipment
+        elif action.name == "Longsword" or action.name == "Long Sword":
+            # region Broadsword Skill
+            broadswordSkill = {
+                "id": "2041b1b5-68df-4978-bf0e-c09dcb997a73",
+                "type": "skill",
+                "name": "Broadsword",
+                "reference": "B208",
+                "tags": ["Combat", "Melee Combat", "Weapon"],
+                "difficulty": "dx/a",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -5,
+                    "level": 6,
+                    "adjusted_level": 6,
+                    "points": -6,
+                },
+                "defaults": [
+                    {"type": "skill", "name": "Force Sword", "modifier": -4},
+                    {"type": "skill", "name": "Rapier", "modifier": -4},
+                    {"type": "skill", "name": "Saber", "modifier": -4},
+                    {"type": "skill", "name": "Shortsword", "modifier": -2},
+                    {"type": "skill", "name": "Two-Handed Sword", "modifier": -4},
+                    {"type": "dx", "modifier": -5},
+                ],
+                "calc": {"level": 10, "rsl": "DX-1"},
+            }
+            # endregion
+            default_data["skills"].append(broadswordSkill)
+            # region Broadsword Equipment
+            broadswordEquipment = {
+                "id": "8df98dbb-c1d5-4cc9-83a1-350fba6aaa1c",
+                "type": "equipment",
+                "description": "Broadsword",
+                "reference": "B271",
+                "tech_level": "2",
+                "tags": ["Melee Weapon"],
+                "quantity": 1,
+                "value": 500,
+                "weight": "3 lb",
+                "weapons": [
+                    {
+                        "id": "294c4e7e-c390-4660-8c70-008dba5dad1a",
+                        "type": "melee_weapon",
+                        "damage": {"type": "cut", "st": "sw", "base": "1"},
+                        "strength": "10",
+                        "usage": "Swung",
+                        "reach": "1",
+                        "parry": "0",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {
+                                "type": "skill",
+                                "name": "Force Sword",
+                                "modifier": -4,
                             },
-                        },
-                        {
-                            "id": "cbc835a1-cf24-479a-bd41-0e8a7b4b8c37",
-                            "type": "melee_weapon",
-                            "damage": {"type": "cr", "st": "sw", "base": "2"},
-                            "strength": "9†",
-                            "usage": "Swung",
-                            "usage_notes": "Two-Handed Sword",
-                            "reach": "1,2",
-                            "parry": "0",
-                            "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Two-Handed Sword"},
-                                {"type": "skill", "name": "Broadsword", "modifier": -4},
-                                {
-                                    "type": "skill",
-                                    "name": "Force Sword",
-                                    "modifier": -4,
-                                },
-                                {"type": "skill", "name": "Sword!"},
-                            ],
-                            "calc": {
-                                "level": 6,
-                                "parry": "6",
-                                "block": "No",
-                                "damage": "1d+4 cr",
+                            {"type": "skill", "name": "Broadsword"},
+                            {"type": "skill", "name": "Rapier", "modifier": -4},
+                            {"type": "skill", "name": "Saber", "modifier": -4},
+                            {"type": "skill", "name": "Shortsword", "modifier": -2},
+                            {
+                                "type": "skill",
+                                "name": "Two-Handed Sword",
+                                "modifier": -4,
                             },
-                        },
-                        {
-                            "id": "3cb8cfdd-ea36-4144-b25e-406f4a105764",
-                            "type": "melee_weapon",
-                            "damage": {"type": "cr", "st": "thr", "base": "1"},
-                            "strength": "9†",
-                            "usage": "Thrust",
-                            "usage_notes": "Two-Handed Sword",
-                            "reach": "2",
-                            "parry": "0",
+                            {"type": "skill", "name": "Sword!"},
+                        ],
+                        "calc": {
+                            "level": 10,
+                            "parry": "8",
                             "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Two-Handed Sword"},
-                                {"type": "skill", "name": "Broadsword", "modifier": -4},
-                                {
-                                    "type": "skill",
-                                    "name": "Force Sword",
-                                    "modifier": -4,
-                                },
-                                {"type": "skill", "name": "Sword!"},
-                            ],
-                            "calc": {
-                                "level": 6,
-                                "parry": "6",
-                                "block": "No",
-                                "damage": "1d cr",
-                            },
+                            "damage": "1d+3 cut",
                         },
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 10, "extended_weight": "4 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(quarterstaffEquipment)
-            # Maul -> Two-Handed Axe/Mace Skill, Maul Equipment
-            elif action["name"] == "Maul":
-                # region Two-Handed Axe/Mace Skill
-                twoHandedAxeMaceSkill = {
-                    "id": "0f2e8a3a-8fb5-427d-8490-2233e3fa664e",
-                    "type": "skill",
-                    "name": "Two-Handed Axe/Mace",
-                    "reference": "B208",
-                    "tags": ["Combat", "Melee Combat", "Weapon"],
-                    "difficulty": "dx/a",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -5,
-                        "level": 6,
-                        "adjusted_level": 6,
-                        "points": -6,
                     },
-                    "defaults": [
-                        {"type": "dx", "modifier": -5},
-                        {"type": "skill", "name": "Axe/Mace", "modifier": -3},
-                        {"type": "skill", "name": "Polearm", "modifier": -4},
-                        {"type": "skill", "name": "Two-Handed Flail", "modifier": -4},
-                    ],
-                    "calc": {"level": 10, "rsl": "DX-1"},
-                }
-                # endregion
-                default_data["skills"].append(twoHandedAxeMaceSkill)
-                # region Maul Equipment
-                maulEquipment = {
-                    "id": "13d9287b-4699-4a62-a2b1-8b17d51b0f74",
-                    "type": "equipment",
-                    "description": "Maul",
-                    "reference": "B274",
-                    "tech_level": "0",
-                    "tags": ["Melee Weapon"],
-                    "quantity": 1,
-                    "value": 80,
-                    "weight": "12 lb",
-                    "weapons": [
-                        {
-                            "id": "a381d818-2974-407e-823d-1db893882778",
-                            "type": "melee_weapon",
-                            "damage": {"type": "cr", "st": "sw", "base": "4"},
-                            "strength": "13‡",
-                            "usage": "Swung",
-                            "reach": "1,2*",
-                            "parry": "0U",
-                            "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Two-Handed Axe/Mace"},
-                                {"type": "skill", "name": "Axe/Mace", "modifier": -3},
-                                {"type": "skill", "name": "Polearm", "modifier": -4},
-                                {
-                                    "type": "skill",
-                                    "name": "Two-Handed Flail",
-                                    "modifier": -4,
-                                },
-                            ],
-                            "calc": {
-                                "level": 5,
-                                "parry": "5U",
-                                "block": "No",
-                                "damage": "1d+6 cr",
+                    {
+                        "id": "43ac8fd1-cfdf-4c93-8850-d276f4987761",
+                        "type": "melee_weapon",
+                        "damage": {"type": "cr", "st": "thr", "base": "1"},
+                        "strength": "10",
+                        "usage": "Thrust",
+                        "reach": "1",
+                        "parry": "0",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {
+                                "type": "skill",
+                                "name": "Force Sword",
+                                "modifier": -4,
                             },
-                        }
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 80, "extended_weight": "12 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(maulEquipment)
-            # Pike -> Spear Skill, Pike Equipment
-            elif action["name"] == "Pike":
-                # region Spear Skill
-                spearSkill = {
-                    "id": "71d611f4-adef-4c59-9e29-7828a5832a64",
-                    "type": "skill",
-                    "name": "Spear",
-                    "reference": "B208",
-                    "tags": ["Combat", "Melee Combat", "Weapon"],
-                    "difficulty": "dx/a",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -5,
-                        "level": 6,
-                        "adjusted_level": 6,
-                        "points": -6,
-                    },
-                    "defaults": [
-                        {"type": "dx", "modifier": -5},
-                        {"type": "skill", "name": "Polearm", "modifier": -4},
-                        {"type": "skill", "name": "Staff", "modifier": -2},
-                    ],
-                    "calc": {"level": 10, "rsl": "DX-1"},
-                }
-                # endregion
-                default_data["skills"].append(spearSkill)
-                # region Pike Equipment
-                pikeEquipment = {
-                    "id": "b634189c-139f-4ee1-874a-cad639b8730b",
-                    "type": "equipment",
-                    "description": "Pike",
-                    "reference": "LT60",
-                    "tech_level": "2",
-                    "tags": ["Melee Weapon"],
-                    "quantity": 1,
-                    "value": 80,
-                    "weight": "13 lb",
-                    "weapons": [
-                        {
-                            "id": "7fd9a17a-ca6b-4c11-b5df-a5851d962c6b",
-                            "type": "melee_weapon",
-                            "damage": {"type": "imp", "st": "thr", "base": "3"},
-                            "strength": "12†",
-                            "usage": "Thrust",
-                            "reach": "4, 5*",
-                            "parry": "0U / 0",
-                            "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Spear"},
-                                {"type": "skill", "name": "Polearm", "modifier": -4},
-                                {"type": "skill", "name": "Staff", "modifier": -2},
-                            ],
-                            "calc": {
-                                "level": 6,
-                                "parry": "6U / 0",
-                                "block": "No",
-                                "damage": "1d+2 imp",
+                            {"type": "skill", "name": "Broadsword"},
+                            {"type": "skill", "name": "Rapier", "modifier": -4},
+                            {"type": "skill", "name": "Saber", "modifier": -4},
+                            {"type": "skill", "name": "Shortsword", "modifier": -2},
+                            {
+                                "type": "skill",
+                                "name": "Two-Handed Sword",
+                                "modifier": -4,
                             },
-                        }
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 80, "extended_weight": "13 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(pikeEquipment)
-            # Hand Axe -> Axe/Mace Skill, Axe Equipment
-            elif action["name"] == "Hand Axe":
-                # region Axe/Mace Skill
-                axeMaceSkill = {
-                    "id": "8a428136-80a2-489e-9e0d-fa113e1f99cd",
-                    "type": "skill",
-                    "name": "Axe/Mace",
-                    "reference": "B208",
-                    "tags": ["Combat", "Melee Combat", "Weapon"],
-                    "difficulty": "dx/a",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -5,
-                        "level": 6,
-                        "adjusted_level": 6,
-                        "points": -6,
-                    },
-                    "defaults": [
-                        {"type": "dx", "modifier": -5},
-                        {
-                            "type": "skill",
-                            "name": "Two-Handed Axe/Mace",
-                            "modifier": -3,
-                        },
-                        {"type": "skill", "name": "Flail", "modifier": -4},
-                    ],
-                    "calc": {"level": 10, "rsl": "DX-1"},
-                }
-                # endregion
-                default_data["skills"].append(axeMaceSkill)
-                # region Axe Equipment
-                axeEquipment = {
-                    "id": "9211d2df-bf12-4cc5-bf15-096fb119da14",
-                    "type": "equipment",
-                    "description": "Axe",
-                    "reference": "B271",
-                    "tech_level": "0",
-                    "tags": ["Melee Weapon"],
-                    "quantity": 1,
-                    "value": 50,
-                    "weight": "4 lb",
-                    "weapons": [
-                        {
-                            "id": "50000db7-86e6-4251-aa90-cd0424209d96",
-                            "type": "melee_weapon",
-                            "damage": {"type": "cut", "st": "sw", "base": "2"},
-                            "strength": "11",
-                            "usage": "Swung",
-                            "reach": "1",
-                            "parry": "0U",
+                            {"type": "skill", "name": "Sword!"},
+                        ],
+                        "calc": {
+                            "level": 10,
+                            "parry": "8",
                             "block": "No",
-                            "defaults": [
-                                {"type": "dx", "modifier": -5},
-                                {"type": "skill", "name": "Axe/Mace"},
-                                {"type": "skill", "name": "Flail", "modifier": -4},
-                                {
-                                    "type": "skill",
-                                    "name": "Two-Handed Axe/Mace",
-                                    "modifier": -3,
-                                },
-                            ],
-                            "calc": {
-                                "level": 10,
-                                "parry": "8U",
-                                "block": "No",
-                                "damage": "1d+4 cut",
-                            },
-                        }
-                    ],
-                    "equipped": True,
-                    "calc": {"extended_value": 50, "extended_weight": "4 lb"},
-                }
-                # endregion
-                default_data["equipment"].append(axeEquipment)
-            # Trident -> Spear Skill, Spear Throw Skill, Trident Equipment
-            elif action["name"] == "Trident":
-                # region Spear Skill
-                spearSkill = {
-                    "id": "71d611f4-adef-4c59-9e29-7828a5832a64",
-                    "type": "skill",
-                    "name": "Spear",
-                    "reference": "B208",
-                    "tags": ["Combat", "Melee Combat", "Weapon"],
-                    "difficulty": "dx/a",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -5,
-                        "level": 6,
-                        "adjusted_level": 6,
-                        "points": -6,
-                    },
-                    "defaults": [
-                        {"type": "dx", "modifier": -5},
-                        {"type": "skill", "name": "Polearm", "modifier": -4},
-                        {"type": "skill", "name": "Staff", "modifier": -2},
-                    ],
-                    "calc": {"level": 10, "rsl": "DX-1"},
-                }
-                # endregion
-                default_data["skills"].append(spearSkill)
-                # region Spear Throw Skill
-                spearThrowSkill = {
-                    "id": "4f5ec478-8673-40ba-9a08-b6650b523ed3",
-                    "type": "skill",
-                    "name": "Thrown Weapon",
-                    "reference": "B226",
-                    "tags": ["Combat", "Ranged Combat", "Weapon"],
-                    "specialization": "Spear",
-                    "difficulty": "dx/e",
-                    "points": profPoints,
-                    "defaulted_from": {
-                        "type": "dx",
-                        "modifier": -4,
-                        "level": 7,
-                        "adjusted_level": 7,
-                        "points": -7,
+                            "damage": "1d cr",
+                        },
                     },
-                    "defaults": [
-                        {"type": "dx", "modifier": -4},
-                        {"type": "skill", "name": "Spear Thrower", "modifier": -4},
-                        {
-                            "type": "skill",
-                            "name": "Thrown Weapon",
-                            "specialization": "Harpoon",
-                            "modifier": -2,
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 500, "extended_weight": "3 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(broadswordEquipment)
+        # Longbow -> Longbow equipment, Bow Skill
+        elif action.name == "Longbow":
+            # region Longbow equipment
+            longbowEquipment = {
+                "id": "99bbf283-906b-4993-8eb1-78ed83a4e61f",
+                "type": "equipment",
+                "description": "Longbow",
+                "reference": "B275",
+                "tech_level": "0",
+                "tags": ["Missile Weapon", "UsesAmmoType:Arrow"],
+                "rated_strength": 11,
+                "quantity": 1,
+                "value": 200,
+                "weight": "3 lb",
+                "weapons": [
+                    {
+                        "id": "8759c6ab-39fa-475c-9378-5329ad63a91c",
+                        "type": "ranged_weapon",
+                        "damage": {"type": "imp", "st": "thr", "base": "2"},
+                        "strength": "11†",
+                        "accuracy": "3",
+                        "range": "x15/x20",
+                        "rate_of_fire": "1",
+                        "shots": "1(2)",
+                        "bulk": "-8",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Bow"},
+                        ],
+                        "calc": {
+                            "level": 10,
+                            "range": "165/220",
+                            "damage": "1d+1 imp",
                         },
-                    ],
-                    "calc": {"level": 11, "rsl": "DX+0"},
-                }
-                # endregion
-                default_data["skills"].append(spearThrowSkill)
-
-                tridentEquipment = jsons.tridentEquipment
-                default_data["equipment"].append(tridentEquipment)
-            # Claws / Claw -> Sharp Claws
-            elif action["name"] == "Claws" or action["name"] == "Claw":
-                default_data["traits"].append(jsons.sharpClawsTrait)
-            # Fangs -> Fangs Trait
-            elif action["name"] == "Fangs":
-                default_data["traits"].append(jsons.fangsTrait)
-            # Bite -> Sharp Teeth Trait
-            elif action["name"] == "Bite":
-                default_data["traits"].append(jsons.sharpTeethTrait)
-            else:
-                newActionTrait = {
-                    "id": str(uuid.uuid4()),
-                    "type": "action",
-                    "name": "Action Name",
-                    "notes": "Description",
-                    "base_points": 5,
-                    "calc": {"points": 5},
-                }
-                newActionTrait["name"] = action["name"]
-                newActionTrait["notes"] = convert_to_gurps(action["entries"][0])
-                default_data["traits"].append(newActionTrait)
-
-    # Add Legendary Actions as Trait
-    if "legendary" in input_data:
-        for action in input_data["legendary"]:
-            newActionTrait = {
-                "id": str(uuid.uuid4()),
-                "type": "action",
-                "name": "Action Name",
-                "notes": "Description",
-                "base_points": 5,
-                "calc": {"points": 5},
+                    }
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 200, "extended_weight": "3 lb"},
             }
-            newActionTrait["name"] = action["name"]
-            newActionTrait["notes"] = (
-                "For 1 fp, the following can be done following the turn of another creature. "
-                + convert_to_gurps(action["entries"][0])
-            )
-            default_data["traits"].append(newActionTrait)
-
-    # Bonus Action
-    if "bonus" in input_data:
-        for action in input_data["bonus"]:
-            newActionTrait = {
-                "id": str(uuid.uuid4()),
-                "type": "action",
-                "name": "Action Name",
-                "notes": "Description",
-                "base_points": 5,
-                "calc": {"points": 5},
+            # endregion
+            default_data["equipment"].append(longbowEquipment)
+            # region Bow Skill
+            bowSkill = {
+                "id": "41a2c7dd-3283-4782-a7d8-20e85ff1d368",
+                "type": "skill",
+                "name": "Bow",
+                "reference": "B182",
+                "tags": ["Combat", "Ranged Combat", "Weapon"],
+                "difficulty": "dx/a",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -5,
+                    "level": 6,
+                    "adjusted_level": 6,
+                    "points": -6,
+                },
+                "defaults": [{"type": "dx", "modifier": -5}],
+                "calc": {"level": 10, "rsl": "DX-1"},
+            }
+            # endregion
+            default_data["skills"].append(bowSkill)
+        # Shortbow -> Shortbow equipment, Bow Skill
+        elif action.name == "Shortbow":
+            # region Shortbow equipment
+            shortbowEquipment = {
+                "id": "99bbf283-906b-4993-8eb1-78ed83a4e61f",
+                "type": "equipment",
+                "description": "Longbow",
+                "reference": "B275",
+                "tech_level": "0",
+                "tags": ["Missile Weapon", "UsesAmmoType:Arrow"],
+                "rated_strength": 11,
+                "quantity": 1,
+                "value": 200,
+                "weight": "3 lb",
+                "weapons": [
+                    {
+                        "id": "8759c6ab-39fa-475c-9378-5329ad63a91c",
+                        "type": "ranged_weapon",
+                        "damage": {"type": "imp", "st": "thr", "base": "2"},
+                        "strength": "11†",
+                        "accuracy": "3",
+                        "range": "x15/x20",
+                        "rate_of_fire": "1",
+                        "shots": "1(2)",
+                        "bulk": "-8",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Bow"},
+                        ],
+                        "calc": {
+                            "level": 10,
+                            "range": "165/220",
+                            "damage": "1d+1 imp",
+                        },
+                    }
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 200, "extended_weight": "3 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(shortbowEquipment)
+            # region Bow Skill
+            bowSkill = {
+                "id": "41a2c7dd-3283-4782-a7d8-20e85ff1d368",
+                "type": "skill",
+                "name": "Bow",
+                "reference": "B182",
+                "tags": ["Combat", "Ranged Combat", "Weapon"],
+                "difficulty": "dx/a",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -5,
+                    "level": 6,
+                    "adjusted_level": 6,
+                    "points": -6,
+                },
+                "defaults": [{"type": "dx", "modifier": -5}],
+                "calc": {"level": 10, "rsl": "DX-1"},
+            }
+            # endregion
+            default_data["skills"].append(bowSkill)
+        # Rapier -> Rapier Skill, Rapier Equipment
+        elif action.name == "Rapier":
+            # region Rapier Skill
+            rapierSkill = {
+                "id": "cd367975-81e9-4869-ac6d-e716f9188339",
+                "type": "skill",
+                "name": "Rapier",
+                "reference": "B208",
+                "tags": ["Combat", "Melee Combat", "Weapon"],
+                "difficulty": "dx/a",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -5,
+                    "level": 6,
+                    "adjusted_level": 6,
+                    "points": -6,
+                },
+                "defaults": [
+                    {"type": "dx", "modifier": -5},
+                    {"type": "skill", "name": "Broadsword", "modifier": -4},
+                    {"type": "skill", "name": "Main-Gauche", "modifier": -3},
+                    {"type": "skill", "name": "Saber", "modifier": -3},
+                    {"type": "skill", "name": "Smallsword", "modifier": -3},
+                ],
+                "calc": {"level": 10, "rsl": "DX-1"},
+            }
+            # endregion
+            default_data["skills"].append(rapierSkill)
+            # region Rapier Equipment
+            rapierEquipment = {
+                "id": "a8baa8c1-8cd5-497c-a4e8-e6ac5b038f80",
+                "type": "equipment",
+                "description": "Rapier",
+                "reference": "B273",
+                "tech_level": "4",
+                "tags": ["Melee Weapon"],
+                "quantity": 1,
+                "value": 500,
+                "weight": "2.75 lb",
+                "weapons": [
+                    {
+                        "id": "faed2269-9c35-4b6c-b478-4d353e824920",
+                        "type": "melee_weapon",
+                        "damage": {"type": "imp", "st": "thr", "base": "1"},
+                        "strength": "9",
+                        "usage": "Thrust",
+                        "reach": "1,2",
+                        "parry": "0F",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Rapier"},
+                            {"type": "skill", "name": "Broadsword", "modifier": -4},
+                            {
+                                "type": "skill",
+                                "name": "Main-Gauche",
+                                "modifier": -3,
+                            },
+                            {"type": "skill", "name": "Saber", "modifier": -3},
+                            {"type": "skill", "name": "Smallsword", "modifier": -3},
+                            {"type": "skill", "name": "Sword!"},
+                        ],
+                        "calc": {
+                            "level": 10,
+                            "parry": "8F",
+                            "block": "No",
+                            "damage": "1d imp",
+                        },
+                    }
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 500, "extended_weight": "2.75 lb"},
             }
-            newActionTrait["name"] = action["name"]
-            newActionTrait["notes"] = (
-                "For 1 fp do the following on your turn in addition to a maneuver. "
-                + convert_to_gurps(action["entries"][0])
-            )
-            default_data["traits"].append(newActionTrait)
-
-    # Reaction
-    if "reaction" in input_data:
-        for reaction in input_data["reaction"]:
-            newActionTrait = {
-                "id": str(uuid.uuid4()),
-                "type": "action",
-                "name": "Action Name",
-                "notes": "Description",
-                "base_points": 5,
-                "calc": {"points": 5},
+            # endregion
+            default_data["equipment"].append(rapierEquipment)
+        # Greatclub or Great Club -> Axe/Mace Skill, Knobbed Club Equipment
+        elif action.name == "Greatclub" or action.name == "Great Club":
+            # region Axe/Mace Skill
+            axeMaceSkill = {
+                "id": "9a8f4d0c-b66b-4605-a01f-e3534c2fd006",
+                "type": "skill",
+                "name": "Axe/Mace",
+                "reference": "B208",
+                "tags": ["Combat", "Melee Combat", "Weapon"],
+                "difficulty": "dx/a",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -5,
+                    "level": 6,
+                    "adjusted_level": 6,
+                    "points": -6,
+                },
+                "defaults": [
+                    {"type": "dx", "modifier": -5},
+                    {
+                        "type": "skill",
+                        "name": "Two-Handed Axe/Mace",
+                        "modifier": -3,
+                    },
+                    {"type": "skill", "name": "Flail", "modifier": -4},
+                ],
+                "calc": {"level": 10, "rsl": "DX-1"},
             }
-            newActionTrait["name"] = reaction["name"]
-            newActionTrait["notes"] = (
-                "For 1 fp, the following can be done following the turn of another creature. "
-                + convert_to_gurps(reaction["entries"][0])
-            )
-            default_data["traits"].append(newActionTrait)
-
-    # Size and Health Benefits from Size
-
-    # Extra Health
-
-    # Senses
-    if "senses" in input_data:
-        for sense in input_data["senses"]:
-            if "darkvision" in sense:
-                # region Darkvision Trait
-                darkvisionTrait = {
-                    "id": str(uuid.uuid4()),
-                    "type": "trait",
-                    "name": "Dark Vision",
-                    "reference": "B47,P46",
-                    "tags": ["Advantage", "Exotic", "Physical"],
-                    "modifiers": [
-                        {
-                            "id": "d8886d7f-b079-4e07-9f7a-749f509e1bc0",
-                            "type": "modifier",
-                            "name": "Can see colors in the dark",
-                            "cost": 20,
-                            "disabled": True,
+            # endregion
+            default_data["skills"].append(axeMaceSkill)
+            # region Knobbed Club Equipment
+            knobbedClubEquipment = {
+                "id": "8e7ed5b8-fed2-4c1f-a3f5-023bc19fde02",
+                "type": "equipment",
+                "description": "Knobbed Club",
+                "reference": "LT58",
+                "tech_level": "0",
+                "tags": ["Melee Weapon"],
+                "quantity": 1,
+                "value": 20,
+                "weight": "2 lb",
+                "weapons": [
+                    {
+                        "id": "9bbcb7f6-447b-4905-a888-9a3834c5bb4d",
+                        "type": "melee_weapon",
+                        "damage": {"type": "cr", "st": "sw", "base": "1"},
+                        "strength": "8",
+                        "usage": "Swung",
+                        "reach": "1",
+                        "parry": "0",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Axe/Mace"},
+                            {"type": "skill", "name": "Flail", "modifier": -4},
+                            {
+                                "type": "skill",
+                                "name": "Two-Handed Axe/Mace",
+                                "modifier": -3,
+                            },
+                        ],
+                        "calc": {
+                            "level": 10,
+                            "parry": "8",
+                            "block": "No",
+                            "damage": "1d+3 cr",
                         },
-                        {
-                            "id": "f515b6a5-62d7-4105-9622-ffc131556f64",
-                            "type": "modifier",
-                            "name": "Hypersensory",
-                            "reference": "P46",
-                            "cost": 40,
-                            "disabled": True,
+                    }
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 20, "extended_weight": "2 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(knobbedClubEquipment)
+        # Sling -> Sling Equipment, Sling Skill
+        elif action.name == "Sling":
+            # region Sling Equipment
+            slingEquipment = {
+                "id": "7288b4d9-0c11-4b09-8ad4-e781cb5e13b9",
+                "type": "equipment",
+                "description": "Sling",
+                "reference": "B276",
+                "tech_level": "0",
+                "tags": ["Missile Weapon", "UsesAmmoType:Sling"],
+                "quantity": 1,
+                "value": 20,
+                "weight": "0.5 lb",
+                "weapons": [
+                    {
+                        "id": "b566ba0b-ea56-4701-8f84-186385028e7b",
+                        "type": "ranged_weapon",
+                        "damage": {"type": "pi", "st": "sw"},
+                        "strength": "6",
+                        "accuracy": "0",
+                        "range": "x6/x10",
+                        "rate_of_fire": "1",
+                        "shots": "1(2)",
+                        "bulk": "-4",
+                        "defaults": [
+                            {"type": "dx", "modifier": -6},
+                            {"type": "skill", "name": "Sling"},
+                        ],
+                        "calc": {
+                            "level": 9,
+                            "range": "72/120",
+                            "damage": "1d+2 pi",
                         },
-                    ],
-                    "base_points": 25,
-                    "calc": {"points": 25},
-                }
-                # endregion
-                default_data["traits"].append(darkvisionTrait)
-            elif "blindsight" in sense:
-                blindsightTrait = {
-                    "id": str(uuid.uuid4()),
-                    "type": "trait",
-                    "name": "Blindsight",
-                    "userdesc": "Can perceive its surroundings without relying on sight, within 60 ft.",
-                    "base_points": 40,
-                    "calc": {"points": 40},
-                }
-                default_data["traits"].append(blindsightTrait)
-            elif "tremor" in sense:
-                tremorsenseTrait = {
-                    "id": str(uuid.uuid4()),
-                    "type": "trait",
-                    "name": "Tremorsense",
-                    "userdesc": "Can sense its surroundings via vibrations in the ground. Can automaticaly pinpoint the location of anything in contact with the ground within 60 ft.",
-                    "base_points": 40,
-                    "calc": {"points": 40},
-                }
-                default_data["traits"].append(tremorsenseTrait)
-            elif "true" in sense:
-                truesightTrait = {
-                    "id": str(uuid.uuid4()),
-                    "type": "trait",
-                    "name": "True Sight",
-                    "userdesc": "Can see normally in magical and nonmagical darkness, see invisible creatures and objects, automatically detect visual illusions and succeed on saving throws against them, and perceive the original form of a shapechanger or a creature that is transformed by magic. Within 120 ft.",
-                    "base_points": 60,
-                    "calc": {"points": 60},
-                }
-                default_data["traits"].append(truesightTrait)
-            elif "devil" in sense:
-                devilssightTrait = {
-                    "id": str(uuid.uuid4()),
-                    "type": "trait",
-                    "name": "Devil's Sight",
-                    "userdesc": "Can see normally in magical and nonmagical darkness, within 120 ft.",
-                    "base_points": 30,
-                    "calc": {"points": 30},
-                }
-                default_data["traits"].append(devilssightTrait)
-
-    # Languages
-    if "languages" in input_data:
-        for language in input_data["languages"]:
-            # region Language Trait
-            languageTrait = {
-                "id": str(uuid.uuid4()),
-                "type": "trait",
-                "name": "Language: Any",
-                "reference": "B24",
-                "tags": ["Advantage", "Language", "Mental"],
-                "modifiers": [
+                    }
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 20, "extended_weight": "0.5 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(slingEquipment)
+            # region Sling Skill
+            slingSkill = {
+                "id": "eecbbb0c-c1a9-4c8a-b536-62ccd2f1109d",
+                "type": "skill",
+                "name": "Sling",
+                "reference": "B221",
+                "tags": ["Combat", "Ranged Combat", "Weapon"],
+                "difficulty": "dx/h",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -6,
+                    "level": 5,
+                    "adjusted_level": 5,
+                    "points": -5,
+                },
+                "defaults": [{"type": "dx", "modifier": -6}],
+                "calc": {"level": 9, "rsl": "DX-2"},
+            }
+            # endregion
+            default_data["skills"].append(slingSkill)
+        # Quarterstaff or Staff or Quarter Staff -> Staff Skill, Quarterstaff Equipment
+        elif (
+            action.name == "Quarterstaff"
+            or action.name == "Staff"
+            or action.name == "Quarter Staff"
+        ):
+            # region Staff Skill
+            staffSkill = {
+                "id": "c1704e0f-ba0b-4896-8a7b-f93e2762f8c2",
+                "type": "skill",
+                "name": "Staff",
+                "reference": "B208",
+                "tags": ["Combat", "Melee Combat", "Weapon"],
+                "difficulty": "dx/a",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -5,
+                    "level": 6,
+                    "adjusted_level": 6,
+                    "points": -6,
+                },
+                "defaults": [
+                    {"type": "dx", "modifier": -5},
+                    {"type": "skill", "name": "Polearm", "modifier": -4},
+                    {"type": "skill", "name": "Spear", "modifier": -2},
+                ],
+                "calc": {"level": 10, "rsl": "DX-1"},
+            }
+            # endregion
+            default_data["skills"].append(staffSkill)
+            # region Quarterstaff Equipment
+            quarterstaffEquipment = {
+                "id": "49b5ba32-584f-4b8f-97b9-f3f5415b4a6c",
+                "type": "equipment",
+                "description": "Quarterstaff",
+                "reference": "B273",
+                "tech_level": "0",
+                "tags": ["Melee Weapon"],
+                "quantity": 1,
+                "value": 10,
+                "weight": "4 lb",
+                "weapons": [
                     {
-                        "id": "ff972d9a-b925-4895-a489-f3d14999074d",
-                        "type": "modifier",
-                        "name": "Native",
-                        "reference": "B23",
-                        "cost": -6,
-                        "cost_type": "points",
-                        "disabled": True,
+                        "id": "ad65dc1c-caf5-4c71-a880-84587832d8ea",
+                        "type": "melee_weapon",
+                        "damage": {"type": "cr", "st": "sw", "base": "2"},
+                        "strength": "7†",
+                        "usage": "Swung",
+                        "usage_notes": "Staff",
+                        "reach": "1,2",
+                        "parry": "+2",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Staff"},
+                            {"type": "skill", "name": "Polearm", "modifier": -4},
+                            {"type": "skill", "name": "Spear", "modifier": -2},
+                        ],
+                        "calc": {
+                            "level": 10,
+                            "parry": "10",
+                            "block": "No",
+                            "damage": "1d+4 cr",
+                        },
                     },
                     {
-                        "id": "e9f38c71-c4bd-45ee-a5e2-b47a33029f96",
-                        "type": "modifier",
-                        "name": "Spoken",
-                        "reference": "B24",
-                        "notes": "None",
-                        "cost_type": "points",
-                        "disabled": True,
+                        "id": "0f333350-cfd8-4fba-a202-b2bf19773be5",
+                        "type": "melee_weapon",
+                        "damage": {"type": "cr", "st": "thr", "base": "2"},
+                        "strength": "7†",
+                        "usage": "Thrust",
+                        "usage_notes": "Staff",
+                        "reach": "1,2",
+                        "parry": "+2",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Staff"},
+                            {"type": "skill", "name": "Polearm", "modifier": -4},
+                            {"type": "skill", "name": "Spear", "modifier": -2},
+                        ],
+                        "calc": {
+                            "level": 10,
+                            "parry": "10",
+                            "block": "No",
+                            "damage": "1d+1 cr",
+                        },
                     },
                     {
-                        "id": "6cd10ab4-c4f9-4764-a47d-0e77d105d862",
-                        "type": "modifier",
-                        "name": "Spoken",
-                        "reference": "B24",
-                        "notes": "Broken",
-                        "cost": 1,
-                        "cost_type": "points",
-                        "disabled": True,
+                        "id": "cbc835a1-cf24-479a-bd41-0e8a7b4b8c37",
+                        "type": "melee_weapon",
+                        "damage": {"type": "cr", "st": "sw", "base": "2"},
+                        "strength": "9†",
+                        "usage": "Swung",
+                        "usage_notes": "Two-Handed Sword",
+                        "reach": "1,2",
+                        "parry": "0",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Two-Handed Sword"},
+                            {"type": "skill", "name": "Broadsword", "modifier": -4},
+                            {
+                                "type": "skill",
+                                "name": "Force Sword",
+                                "modifier": -4,
+                            },
+                            {"type": "skill", "name": "Sword!"},
+                        ],
+                        "calc": {
+                            "level": 6,
+                            "parry": "6",
+                            "block": "No",
+                            "damage": "1d+4 cr",
+                        },
                     },
                     {
-                        "id": "3c7caa3c-055e-4422-ac8e-6a2d632b391c",
-                        "type": "modifier",
-                        "name": "Spoken",
-                        "reference": "B24",
-                        "notes": "Accented",
-                        "cost": 2,
-                        "cost_type": "points",
-                        "disabled": True,
+                        "id": "3cb8cfdd-ea36-4144-b25e-406f4a105764",
+                        "type": "melee_weapon",
+                        "damage": {"type": "cr", "st": "thr", "base": "1"},
+                        "strength": "9†",
+                        "usage": "Thrust",
+                        "usage_notes": "Two-Handed Sword",
+                        "reach": "2",
+                        "parry": "0",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Two-Handed Sword"},
+                            {"type": "skill", "name": "Broadsword", "modifier": -4},
+                            {
+                                "type": "skill",
+                                "name": "Force Sword",
+                                "modifier": -4,
+                            },
+                            {"type": "skill", "name": "Sword!"},
+                        ],
+                        "calc": {
+                            "level": 6,
+                            "parry": "6",
+                            "block": "No",
+                            "damage": "1d cr",
+                        },
                     },
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 10, "extended_weight": "4 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(quarterstaffEquipment)
+        # Maul -> Two-Handed Axe/Mace Skill, Maul Equipment
+        elif action.name == "Maul":
+            # region Two-Handed Axe/Mace Skill
+            twoHandedAxeMaceSkill = {
+                "id": "0f2e8a3a-8fb5-427d-8490-2233e3fa664e",
+                "type": "skill",
+                "name": "Two-Handed Axe/Mace",
+                "reference": "B208",
+                "tags": ["Combat", "Melee Combat", "Weapon"],
+                "difficulty": "dx/a",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -5,
+                    "level": 6,
+                    "adjusted_level": 6,
+                    "points": -6,
+                },
+                "defaults": [
+                    {"type": "dx", "modifier": -5},
+                    {"type": "skill", "name": "Axe/Mace", "modifier": -3},
+                    {"type": "skill", "name": "Polearm", "modifier": -4},
+                    {"type": "skill", "name": "Two-Handed Flail", "modifier": -4},
+                ],
+                "calc": {"level": 10, "rsl": "DX-1"},
+            }
+            # endregion
+            default_data["skills"].append(twoHandedAxeMaceSkill)
+            # region Maul Equipment
+            maulEquipment = {
+                "id": "13d9287b-4699-4a62-a2b1-8b17d51b0f74",
+                "type": "equipment",
+                "description": "Maul",
+                "reference": "B274",
+                "tech_level": "0",
+                "tags": ["Melee Weapon"],
+                "quantity": 1,
+                "value": 80,
+                "weight": "12 lb",
+                "weapons": [
                     {
-                        "id": "231ba28d-11ce-44e1-8d23-074d40ca57c6",
-                        "type": "modifier",
-                        "name": "Spoken",
-                        "reference": "B24",
-                        "notes": "Native",
-                        "cost": 3,
-                        "cost_type": "points",
-                    },
+                        "id": "a381d818-2974-407e-823d-1db893882778",
+                        "type": "melee_weapon",
+                        "damage": {"type": "cr", "st": "sw", "base": "4"},
+                        "strength": "13‡",
+                        "usage": "Swung",
+                        "reach": "1,2*",
+                        "parry": "0U",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Two-Handed Axe/Mace"},
+                            {"type": "skill", "name": "Axe/Mace", "modifier": -3},
+                            {"type": "skill", "name": "Polearm", "modifier": -4},
+                            {
+                                "type": "skill",
+                                "name": "Two-Handed Flail",
+                                "modifier": -4,
+                            },
+                        ],
+                        "calc": {
+                            "level": 5,
+                            "parry": "5U",
+                            "block": "No",
+                            "damage": "1d+6 cr",
+                        },
+                    }
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 80, "extended_weight": "12 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(maulEquipment)
+        # Pike -> Spear Skill, Pike Equipment
+        elif action.name == "Pike":
+            # region Spear Skill
+            spearSkill = {
+                "id": "71d611f4-adef-4c59-9e29-7828a5832a64",
+                "type": "skill",
+                "name": "Spear",
+                "reference": "B208",
+                "tags": ["Combat", "Melee Combat", "Weapon"],
+                "difficulty": "dx/a",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -5,
+                    "level": 6,
+                    "adjusted_level": 6,
+                    "points": -6,
+                },
+                "defaults": [
+                    {"type": "dx", "modifier": -5},
+                    {"type": "skill", "name": "Polearm", "modifier": -4},
+                    {"type": "skill", "name": "Staff", "modifier": -2},
+                ],
+                "calc": {"level": 10, "rsl": "DX-1"},
+            }
+            # endregion
+            default_data["skills"].append(spearSkill)
+            # region Pike Equipment
+            pikeEquipment = {
+                "id": "b634189c-139f-4ee1-874a-cad639b8730b",
+                "type": "equipment",
+                "description": "Pike",
+                "reference": "LT60",
+                "tech_level": "2",
+                "tags": ["Melee Weapon"],
+                "quantity": 1,
+                "value": 80,
+                "weight": "13 lb",
+                "weapons": [
                     {
-                        "id": "152ad20b-dc58-4abb-b256-71da14dbb89c",
-                        "type": "modifier",
-                        "name": "Written",
-                        "reference": "B24",
-                        "notes": "None",
-                        "cost_type": "points",
-                        "disabled": True,
-                    },
+                        "id": "7fd9a17a-ca6b-4c11-b5df-a5851d962c6b",
+                        "type": "melee_weapon",
+                        "damage": {"type": "imp", "st": "thr", "base": "3"},
+                        "strength": "12†",
+                        "usage": "Thrust",
+                        "reach": "4, 5*",
+                        "parry": "0U / 0",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Spear"},
+                            {"type": "skill", "name": "Polearm", "modifier": -4},
+                            {"type": "skill", "name": "Staff", "modifier": -2},
+                        ],
+                        "calc": {
+                            "level": 6,
+                            "parry": "6U / 0",
+                            "block": "No",
+                            "damage": "1d+2 imp",
+                        },
+                    }
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 80, "extended_weight": "13 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(pikeEquipment)
+        # Hand Axe -> Axe/Mace Skill, Axe Equipment
+        elif action.name == "Hand Axe":
+            # region Axe/Mace Skill
+            axeMaceSkill = {
+                "id": "8a428136-80a2-489e-9e0d-fa113e1f99cd",
+                "type": "skill",
+                "name": "Axe/Mace",
+                "reference": "B208",
+                "tags": ["Combat", "Melee Combat", "Weapon"],
+                "difficulty": "dx/a",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -5,
+                    "level": 6,
+                    "adjusted_level": 6,
+                    "points": -6,
+                },
+                "defaults": [
+                    {"type": "dx", "modifier": -5},
                     {
-                        "id": "6304a0d6-80f3-4a5f-b3cc-3ba2ae0c8063",
-                        "type": "modifier",
-                        "name": "Written",
-                        "reference": "B24",
-                        "notes": "Broken",
-                        "cost": 1,
-                        "cost_type": "points",
-                        "disabled": True,
+                        "type": "skill",
+                        "name": "Two-Handed Axe/Mace",
+                        "modifier": -3,
                     },
+                    {"type": "skill", "name": "Flail", "modifier": -4},
+                ],
+                "calc": {"level": 10, "rsl": "DX-1"},
+            }
+            # endregion
+            default_data["skills"].append(axeMaceSkill)
+            # region Axe Equipment
+            axeEquipment = {
+                "id": "9211d2df-bf12-4cc5-bf15-096fb119da14",
+                "type": "equipment",
+                "description": "Axe",
+                "reference": "B271",
+                "tech_level": "0",
+                "tags": ["Melee Weapon"],
+                "quantity": 1,
+                "value": 50,
+                "weight": "4 lb",
+                "weapons": [
                     {
-                        "id": "5818ab4a-2c4b-4c3e-a711-c4b6332daaca",
-                        "type": "modifier",
-                        "name": "Written",
-                        "reference": "B24",
-                        "notes": "Accented",
-                        "cost": 2,
-                        "cost_type": "points",
-                        "disabled": True,
-                    },
+                        "id": "50000db7-86e6-4251-aa90-cd0424209d96",
+                        "type": "melee_weapon",
+                        "damage": {"type": "cut", "st": "sw", "base": "2"},
+                        "strength": "11",
+                        "usage": "Swung",
+                        "reach": "1",
+                        "parry": "0U",
+                        "block": "No",
+                        "defaults": [
+                            {"type": "dx", "modifier": -5},
+                            {"type": "skill", "name": "Axe/Mace"},
+                            {"type": "skill", "name": "Flail", "modifier": -4},
+                            {
+                                "type": "skill",
+                                "name": "Two-Handed Axe/Mace",
+                                "modifier": -3,
+                            },
+                        ],
+                        "calc": {
+                            "level": 10,
+                            "parry": "8U",
+                            "block": "No",
+                            "damage": "1d+4 cut",
+                        },
+                    }
+                ],
+                "equipped": True,
+                "calc": {"extended_value": 50, "extended_weight": "4 lb"},
+            }
+            # endregion
+            default_data["equipment"].append(axeEquipment)
+        # Trident -> Spear Skill, Spear Throw Skill, Trident Equipment
+        elif action.name == "Trident":
+            # region Spear Skill
+            spearSkill = {
+                "id": "71d611f4-adef-4c59-9e29-7828a5832a64",
+                "type": "skill",
+                "name": "Spear",
+                "reference": "B208",
+                "tags": ["Combat", "Melee Combat", "Weapon"],
+                "difficulty": "dx/a",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -5,
+                    "level": 6,
+                    "adjusted_level": 6,
+                    "points": -6,
+                },
+                "defaults": [
+                    {"type": "dx", "modifier": -5},
+                    {"type": "skill", "name": "Polearm", "modifier": -4},
+                    {"type": "skill", "name": "Staff", "modifier": -2},
+                ],
+                "calc": {"level": 10, "rsl": "DX-1"},
+            }
+            # endregion
+            default_data["skills"].append(spearSkill)
+            # region Spear Throw Skill
+            spearThrowSkill = {
+                "id": "4f5ec478-8673-40ba-9a08-b6650b523ed3",
+                "type": "skill",
+                "name": "Thrown Weapon",
+                "reference": "B226",
+                "tags": ["Combat", "Ranged Combat", "Weapon"],
+                "specialization": "Spear",
+                "difficulty": "dx/e",
+                "points": profPoints,
+                "defaulted_from": {
+                    "type": "dx",
+                    "modifier": -4,
+                    "level": 7,
+                    "adjusted_level": 7,
+                    "points": -7,
+                },
+                "defaults": [
+                    {"type": "dx", "modifier": -4},
+                    {"type": "skill", "name": "Spear Thrower", "modifier": -4},
                     {
-                        "id": "1b77515e-5789-49a0-8238-7242900c8c2c",
-                        "type": "modifier",
-                        "name": "Written",
-                        "reference": "B24",
-                        "notes": "Native",
-                        "cost": 3,
-                        "cost_type": "points",
+                        "type": "skill",
+                        "name": "Thrown Weapon",
+                        "specialization": "Harpoon",
+                        "modifier": -2,
                     },
                 ],
-                "calc": {"points": 6},
+                "calc": {"level": 11, "rsl": "DX+0"},
             }
             # endregion
-            languageTrait["name"] = language
-            default_data["traits"].append(languageTrait)
+            default_data["skills"].append(spearThrowSkill)
+
+            tridentEquipment = copy.deepcopy(jsons.tridentEquipment)
+            default_data["equipment"].append(tridentEquipment)
+        # Claws / Claw -> Sharp Claws
+        elif action.name == "Claws" or action.name == "Claw":
+            default_data["traits"].append(copy.deepcopy(jsons.sharpClawsTrait))
+        # Fangs -> Fangs Trait
+        elif action.name == "Fangs":
+            default_data["traits"].append(copy.deepcopy(jsons.fangsTrait))
+        # Bite -> Sharp Teeth Trait
+        elif action.name == "Bite":
+            default_data["traits"].append(copy.deepcopy(jsons.sharpTeethTrait))
+        else:
+            genericActions.append(action)
+            record_unmapped("action", action.name)
+
+    # Actions without a GURPS equivalent, legendary actions, bonus actions and reactions become action traits
+    default_data["traits"].extend(
+        build_action_traits(
+            [
+                ("action", genericActions),
+                ("legendary", monster.legendary),
+                ("bonus", monster.bonus),
+                ("reaction", monster.reactions),
+            ]
+        )
+    )
+
+
+def senses_stage(monster, default_data: dict, options: dict):
+    """
+    Adds a trait for every sense
+    """
+    default_data["traits"].extend(build_sense_traits(monster.senses))
+
+
+def languages_stage(monster, default_data: dict, options: dict):
+    """
+    Adds a trait for every language
+    """
+    default_data["traits"].extend(build_language_traits(monster.languages))
+
+
+# Stages in the order their entries appear on the sheet, with the statblock keys and options each one reads. Every
+# stage's results also depend on the parser that builds the statblocks it is given, and the spells stage on the catalog
+CONVERSION_STAGES = [
+    Stage(
+        "attributes",
+        attributes_stage,
+        ["name", "str", "dex", "con", "int", "wis"],
+        dependencies=[parse_statblock],
+    ),
+    Stage("size", size_stage, ["size"], dependencies=[parse_statblock]),
+    Stage(
+        "skills",
+        skills_stage,
+        ["skill", "str", "dex", "cha", "cr"],
+        dependencies=[parse_statblock],
+    ),
+    Stage("armor", armor_stage, ["ac"], dependencies=[parse_statblock]),
+    Stage(
+        "defenses",
+        defenses_stage,
+        ["resist", "immune", "vulnerable", "conditionImmune"],
+        dependencies=[parse_statblock],
+    ),
+    Stage(
+        "traits",
+        traits_stage,
+        ["name", "trait"],
+        ["combatReflexes"],
+        dependencies=[parse_statblock],
+    ),
+    Stage(
+        "spells",
+        spells_stage,
+        ["spellcasting", "cr"],
+        dependencies=[parse_statblock, SPELL_CATALOG],
+    ),
+    Stage(
+        "actions",
+        actions_stage,
+        ["action", "legendary", "bonus", "reaction", "cr"],
+        dependencies=[parse_statblock],
+    ),
+    Stage("senses", senses_stage, ["senses"], dependencies=[parse_statblock]),
+    Stage("languages", languages_stage, ["languages"], dependencies=[parse_statblock]),
+]
+
+
+# endregion
+
+
+def convert(input_data: dict, options: dict = None, cache: StageCache = None) -> dict:
+    """
+    Converts a 5etools statblock to a GCS character sheet. options holds the choices the statblock doesn't make
+    ({"combatReflexes": True}). With a cache, stages whose inputs haven't changed since an earlier run are reused
+    """
+    # region LOADING DATA
+
+    # Load default file
+    default_data, attrIndex = load_template()
+
+    # Normalize the statblock once, every stage reads it instead of input_data
+    try:
+        monster = parse_statblock(input_data)
+    except Exception as error:
+        raise StageError("parse", error) from error
+    # endregion
+
+    # PROCESSING DATA
+    run_stages(
+        CONVERSION_STAGES,
+        default_data,
+        attrIndex,
+        monster,
+        input_data,
+        options or {},
+        cache,
+    )
 
     # # Info
     # if "fluff" in input_data:
@@ -5028,17 +4922,297 @@ def run_convert(input_data, user_input: str):
     #         image_url = input_data["fluff"]["images"][0]["href"]["url"]
     #         pass
 
+    # Ids only depend on the monster and the entry, so a reconversion can be merged into an edited sheet
+    assign_stable_ids(default_data, monster.name, monster.source)
+    mark_generated(default_data)
+
+    return default_data
+
+
+def serialize(default_data: dict) -> str:
+    """
+    Serializes a character sheet to the contents of a .gcs file
+    """
+    return json.dumps(default_data, indent=4)
+
+
+def write_character(default_data: dict, path: str):
+    """
+    Writes a character sheet to path atomically, so a crash can't leave a half-written file
+    """
+    write_atomic(path, serialize(default_data))
+
+
+def analyze_corpus(
+    paths, databasePath: str = None, options: dict = None
+) -> CoverageRecorder:
+    """
+    Converts every statblock in a list of bestiary files and directories, one file at a time, and counts the actions,
+    armor, skills and tags that have no GURPS mapping. Runs without a stage cache, as cached stages don't report
+    """
+    store = None
+    if databasePath is not None and os.path.exists(databasePath):
+        store = BestiaryStore(databasePath)
+    with CoverageRecorder() as recorder:
+        for path in find_bestiary_files(paths):
+            monsters = [
+                monster for monster in load_bestiary_file(path) if "name" in monster
+            ]
+            for input_data in resolve_copies(
+                monsters, store.get if store is not None else None
+            ):
+                recorder.start(input_data["name"], input_data.get("source", ""))
+                try:
+                    convert(input_data, options)
+                except StageError:
+                    recorder.failed += 1
+    if store is not None:
+        store.close()
+    return recorder
+
+
+def run_convert(input_data, user_input: str):
+    options = {"combatReflexes": user_input.lower() == "yes"}
+
     # WRITE OUTPUT FILE
-    with open("output.gcs", "w") as f:
-        json.dump(default_data, f, indent=4)
+    write_character(convert(input_data, options), "output.gcs")
+
+
+# region COMMAND LINE
+def parse_range(text: str):
+    """
+    Parses "5-12", "5-", "-12" or "5" into a (low, high) pair of strings, with None for an open end
+    """
+    if "-" not in text:
+        return text, text
+    low, high = text.split("-", 1)
+    return (low or None), (high or None)
+
+
+def run_interactive():
+    # Ask the user if the character is battle-hardened
+    user_input = input("Is the character battle-hardened? (Yes/No): ")
+    # Load input file
+    with open("input.json", "r") as f:
+        input_data = json.load(f)
+    # Copies of other monsters can only be expanded if the base is in the local database
+    if "_copy" in input_data and os.path.exists(DEFAULT_DATABASE):
+        with BestiaryStore(DEFAULT_DATABASE) as store:
+            input_data = store.resolver().resolve(input_data)
+
+    # Run main function
+    run_convert(input_data, user_input)
+
+
+def filter_command(args):
+    index = BestiaryIndex(resolve_copies(load_bestiaries(args.paths)))
+    filters = {
+        "source": args.source,
+        "type": args.type,
+        "size": args.size,
+        "action": args.action,
+        "spellcasting": args.spellcasting,
+        "legendary": args.legendary,
+    }
+    if args.cr is not None:
+        filters["min_cr"], filters["max_cr"] = parse_range(args.cr)
+    if args.ability:
+        filters["abilities"] = {}
+        for ability in args.ability:
+            name, scores = ability.split(":")
+            low, high = parse_range(scores)
+            filters["abilities"][name] = (
+                None if low is None else int(low),
+                None if high is None else int(high),
+            )
+    rows = index.select_rows(**filters)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"monster": [index.monsters[row] for row in rows]}, f, indent=4)
+    for row in rows:
+        monster = index.monsters[row]
+        print(
+            monster.get("name", "")
+            + " ("
+            + monster.get("source", "")
+            + ") CR "
+            + str(lookup_cr(monster.get("cr"))["cr"])
+        )
+    print(str(len(rows)) + " of " + str(len(index)) + " monsters selected")
+
+
+def import_command(args):
+    with BestiaryStore(args.db) as store:
+        count = store.import_files(args.paths)
+        print("Imported " + str(count) + " monsters into " + args.db)
+
+
+def resolve_monster(store: BestiaryStore, name: str, source: str = None):
+    """
+    Fetches a monster by exact name, falling back to the closest fuzzy matches. When run from a terminal the user picks between several close matches
+    """
+    input_data = store.get_resolved(name, source)
+    if input_data is not None:
+        return input_data
+    candidates = store.search(name, source)
+    if not candidates:
+        return None
+    if len(candidates) > 1 and sys.stdin.isatty():
+        print("No monster named " + name + ". Did you mean:")
+        for number, (score, candidateName, candidateSource) in enumerate(candidates):
+            print(str(number + 1) + ". " + candidateName + " (" + candidateSource + ")")
+        choice = input("Which monster? (1-" + str(len(candidates)) + "): ")
+        if not choice.isdigit() or not 1 <= int(choice) <= len(candidates):
+            return None
+        score, candidateName, candidateSource = candidates[int(choice) - 1]
+    else:
+        score, candidateName, candidateSource = candidates[0]
+        print("Using " + candidateName + " (" + candidateSource + ")")
+    return store.get_resolved(candidateName, candidateSource)
+
+
+def search_command(args):
+    with BestiaryStore(args.db) as store:
+        for score, name, source in store.search(args.name, args.source, args.limit):
+            print(name + " (" + source + ") " + str(round(score, 2)))
+
+
+def analyze_command(args):
+    recorder = analyze_corpus(args.paths, args.db, {"combatReflexes": False})
+    print(recorder.summary(args.limit))
+    if args.output:
+        write_atomic(
+            args.output, json.dumps(recorder.to_dict(), indent=4, ensure_ascii=False)
+        )
+        print("Wrote " + args.output)
+
+
+def convert_command(args):
+    with BestiaryStore(args.db) as store:
+        input_data = resolve_monster(store, args.name, args.source)
+    if input_data is None:
+        print("No monster named " + args.name + " in " + args.db)
+        return
+    options = {"combatReflexes": args.combat_reflexes}
+    with StageCache(args.stage_cache) as cache:
+        character = convert(input_data, options, cache)
+    with OutputWriter(args.output, fsync="file") as writer:
+        path = writer.reserve(input_data["name"], input_data.get("source", ""))
+        if args.merge and os.path.exists(path):
+            try:
+                character, stats = merge_with_file(path, character)
+            except ValueError as error:
+                print("Can't merge into " + path + ": " + str(error))
+                return
+            if character is None:
+                print(path + " is up to date")
+                return
+            print("Merged into " + path + ": " + stats.report())
+        writer.write_to(path, serialize(character))
+    print("Wrote " + path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Converts D&D 5e statblocks to GURPS Character Sheet files. Without a command, input.json is converted to output.gcs"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    filterParser = subparsers.add_parser(
+        "filter", help="Select monsters from 5etools bestiary files"
+    )
+    filterParser.add_argument(
+        "paths", nargs="+", help="Bestiary files or directories of them"
+    )
+    filterParser.add_argument("--source", help="Source book, e.g. MM")
+    filterParser.add_argument("--type", help="Creature type, e.g. undead")
+    filterParser.add_argument("--size", help="Size letter, e.g. L")
+    filterParser.add_argument("--cr", help="Challenge rating or range, e.g. 5-12")
+    filterParser.add_argument("--action", help="Name of an action, e.g. Multiattack")
+    filterParser.add_argument(
+        "--ability",
+        action="append",
+        help="Ability score range, e.g. str:14-30 (can be repeated)",
+    )
+    filterParser.add_argument("--spellcasting", action=argparse.BooleanOptionalAction)
+    filterParser.add_argument("--legendary", action=argparse.BooleanOptionalAction)
+    filterParser.add_argument(
+        "--output", help="Write the selected statblocks to this bestiary file"
+    )
+    filterParser.set_defaults(func=filter_command)
+
+    importParser = subparsers.add_parser(
+        "import", help="Import 5etools bestiary files into the local database"
+    )
+    importParser.add_argument(
+        "paths", nargs="+", help="Bestiary files or directories of them"
+    )
+    importParser.add_argument("--db", default=DEFAULT_DATABASE)
+    importParser.set_defaults(func=import_command)
+
+    convertParser = subparsers.add_parser(
+        "convert",
+        help="Convert a monster from the local database to a .gcs file named after it",
+    )
+    convertParser.add_argument("--name", required=True, help="Monster name")
+    convertParser.add_argument("--source", help="Source book, e.g. MM")
+    convertParser.add_argument("--db", default=DEFAULT_DATABASE)
+    convertParser.add_argument(
+        "--combat-reflexes",
+        action="store_true",
+        help="The monster is battle-hardened and gets Combat Reflexes",
+    )
+    convertParser.add_argument(
+        "--output", default=".", help="Directory to write the .gcs file to"
+    )
+    convertParser.add_argument(
+        "--stage-cache",
+        help="SQLite file to cache conversion stage results in between runs",
+    )
+    convertParser.add_argument(
+        "--merge",
+        action="store_true",
+        help="Update an existing .gcs file instead of replacing it, keeping the changes made to it by hand",
+    )
+    convertParser.set_defaults(func=convert_command)
+
+    searchParser = subparsers.add_parser(
+        "search", help="Find monsters in the local database by approximate name"
+    )
+    searchParser.add_argument("name", help="Monster name, may be misspelled")
+    searchParser.add_argument("--source", help="Source book, e.g. MM")
+    searchParser.add_argument("--limit", type=int, default=5)
+    searchParser.add_argument("--db", default=DEFAULT_DATABASE)
+    searchParser.set_defaults(func=search_command)
+
+    analyzeParser = subparsers.add_parser(
+        "analyze",
+        help="Count the actions, armor, skills and tags of a corpus that the converter has no mapping for",
+    )
+    analyzeParser.add_argument(
+        "paths", nargs="+", help="Bestiary files or directories of them"
+    )
+    analyzeParser.add_argument(
+        "--db", default=DEFAULT_DATABASE, help="Database to look up _copy bases in"
+    )
+    analyzeParser.add_argument(
+        "--limit", type=int, default=10, help="Most common values shown per kind"
+    )
+    analyzeParser.add_argument(
+        "--output", help="Write every count, with example monsters, to this JSON file"
+    )
+    analyzeParser.set_defaults(func=analyze_command)
 
+    args = parser.parse_args(argv)
+    if args.command is None:
+        run_interactive()
+    else:
+        args.func(args)
+
+
+# endregion
 
-# Run main function
-# Ask the user if the character is battle-hardened
-user_input = input("Is the character battle-hardened? (Yes/No): ")
-# Load input file
-with open("input.json", "r") as f:
-    input = json.load(f)
 
-# Run main function
-run_convert(input, user_input)
+if __name__ == "__main__":
+    main()
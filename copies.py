@@ -0,0 +1,458 @@
+import copy
+import math
+import re
+
+from crtable import lookup_cr
+
+# region COPY TABLES
+# Properties of a base monster that are only copied if listed in _copy._preserve
+PRESERVE_ONLY_PROPS = [
+    "page",
+    "otherSources",
+    "srd",
+    "basicRules",
+    "reprintedAs",
+    "hasFluff",
+    "hasFluffImages",
+    "hasToken",
+    "_versions",
+]
+
+# Properties holding entries, used by "*" mods such as replaceTxt
+ENTRY_PROPS = [
+    "action",
+    "bonus",
+    "reaction",
+    "trait",
+    "legendary",
+    "mythic",
+    "variant",
+    "spellcasting",
+    "actionHeader",
+    "bonusHeader",
+    "reactionHeader",
+    "legendaryHeader",
+    "mythicHeader",
+]
+
+# Expanded statblocks a CopyResolver keeps before it starts over
+RESOLVED_CACHE_SIZE = 4096
+
+# Keys of entry objects whose contents are text
+ENTRY_TEXT_KEYS = ["entries", "entry", "items", "headerEntries", "footerEntries"]
+
+SKILL_ABILITIES = {
+    "acrobatics": "dex",
+    "animal handling": "wis",
+    "arcana": "int",
+    "athletics": "str",
+    "deception": "cha",
+    "history": "int",
+    "insight": "wis",
+    "intimidation": "cha",
+    "investigation": "int",
+    "medicine": "wis",
+    "nature": "int",
+    "perception": "wis",
+    "performance": "cha",
+    "persuasion": "cha",
+    "religion": "int",
+    "sleight of hand": "dex",
+    "stealth": "dex",
+    "survival": "wis",
+}
+# endregion
+
+
+class CopyError(Exception):
+    """
+    Raised when a _copy can't be expanded because its base is missing or the copies are circular
+    """
+
+
+# region HELPER FUNCTIONS
+def monster_key(name: str, source: str) -> tuple:
+    return (name.lower(), source.lower())
+
+
+def ability_modifier(score: int) -> int:
+    return math.floor((score - 10) / 2)
+
+
+def format_bonus(bonus: int) -> str:
+    """
+    Formats a bonus as a statblock string ("+5", "-1")
+    """
+    if bonus >= 0:
+        return "+" + str(bonus)
+    return str(bonus)
+
+
+def entry_name(entry) -> str:
+    if type(entry) == dict:
+        return entry.get("name", "")
+    return entry
+
+
+def matches_name(entry, names) -> bool:
+    if type(names) != list:
+        names = [names]
+    return entry_name(entry) in names
+
+
+def replace_entry_text(entries, pattern, replacement):
+    """
+    Replaces text in every string of a (possibly nested) entries structure, returning the new structure
+    """
+    if type(entries) == str:
+        return pattern.sub(replacement, entries)
+    if type(entries) == list:
+        return [replace_entry_text(entry, pattern, replacement) for entry in entries]
+    if type(entries) == dict:
+        for key in ENTRY_TEXT_KEYS:
+            if key in entries:
+                entries[key] = replace_entry_text(entries[key], pattern, replacement)
+    return entries
+
+
+def js_replacement(replacement: str) -> str:
+    """
+    Converts a JavaScript replacement string ("$1") to Python syntax ("\\g<1>")
+    """
+    replacement = replacement.replace("\\", "\\\\")
+    return re.sub(r"\$(\d+)", r"\\g<\1>", replacement)
+
+
+def get_path(data: dict, path: str):
+    for key in path.split("."):
+        data = data[key]
+    return data
+
+
+def set_path(data: dict, path: str, value):
+    keys = path.split(".")
+    for key in keys[:-1]:
+        data = data.setdefault(key, {})
+    data[keys[-1]] = value
+
+
+# endregion
+
+
+# region MOD MODES
+def apply_array_mod(target: list, mod: dict) -> list:
+    """
+    Applies an array mod (appendArr, removeArr, ...) to a list of entries and returns the new list
+    """
+    mode = mod["mode"]
+    items = mod.get("items", [])
+    if type(items) != list:
+        items = [items]
+
+    if mode == "appendArr":
+        return target + items
+    if mode == "prependArr":
+        return items + target
+    if mode == "insertArr":
+        return target[: mod["index"]] + items + target[mod["index"] :]
+    if mode == "appendIfNotExistsArr":
+        return target + [item for item in items if item not in target]
+    if mode == "removeArr":
+        if "names" in mod:
+            return [entry for entry in target if not matches_name(entry, mod["names"])]
+        return [entry for entry in target if entry not in items]
+    if mode == "replaceArr" or mode == "replaceOrAppendArr":
+        replace = mod["replace"]
+        for position, entry in enumerate(target):
+            if type(replace) == dict and "index" in replace:
+                found = position == replace["index"]
+            else:
+                found = matches_name(entry, replace)
+            if found:
+                return target[:position] + items + target[position + 1 :]
+        if mode == "replaceOrAppendArr":
+            return target + items
+        return target
+    return target
+
+
+def apply_scalar_mod(target: dict, mod: dict):
+    """
+    Adds to or multiplies numeric properties, including statblock bonus strings like "+4"
+    """
+    props = target.keys() if mod["prop"] == "*" else [mod["prop"]]
+    for prop in list(props):
+        if prop not in target:
+            continue
+        value = target[prop]
+        isBonus = type(value) == str
+        number = int(value) if isBonus else value
+        if mod["mode"] == "scalarAddProp":
+            number = number + mod["scalar"]
+        else:
+            number = number * mod["scalar"]
+            if mod.get("floor"):
+                number = math.floor(number)
+        target[prop] = format_bonus(number) if isBonus else number
+
+
+def apply_hit_dc_mod(monster: dict, prop: str, mod: dict):
+    """
+    Adds to every {@hit X} or {@dc X} in the entries of prop
+    """
+    tag = "hit" if mod["mode"] == "scalarAddHit" else "dc"
+    pattern = re.compile(r"\{@" + tag + r" ([-+]?\d+)\}")
+
+    def replacement(match):
+        return "{@" + tag + " " + str(int(match.group(1)) + mod["scalar"]) + "}"
+
+    monster[prop] = replace_entry_text(monster[prop], pattern, replacement)
+
+
+def add_proficiencies(monster: dict, prop: str, abilities: dict, proficiencies: dict):
+    """
+    Adds saving throw or skill bonuses for proficiency levels (1 for proficient, 2 for expertise)
+    """
+    profBonus = lookup_cr(monster.get("cr"))["prof_bonus"]
+    bonuses = monster.setdefault(prop, {})
+    for name, level in proficiencies.items():
+        ability = abilities.get(name, name)
+        bonus = ability_modifier(monster.get(ability, 10)) + profBonus * level
+        bonuses[name] = format_bonus(bonus)
+
+
+def add_senses(monster: dict, senses):
+    if type(senses) != list:
+        senses = [senses]
+    existing = monster.setdefault("senses", [])
+    for sense in senses:
+        # A new range replaces a shorter range of the same sense
+        for position, old in enumerate(existing):
+            if old.startswith(sense["type"]):
+                oldRange = re.search(r"\d+", old)
+                if oldRange is None or int(oldRange.group()) < sense["range"]:
+                    existing[position] = (
+                        sense["type"] + " " + str(sense["range"]) + " ft."
+                    )
+                break
+        else:
+            existing.append(sense["type"] + " " + str(sense["range"]) + " ft.")
+
+
+def modify_spells(monster: dict, mod: dict):
+    """
+    Applies addSpells, replaceSpells and removeSpells to the first spellcasting entry
+    """
+    if not monster.get("spellcasting"):
+        return
+    spellcasting = monster["spellcasting"][0]
+    mode = mod["mode"]
+
+    if "spells" in mod:
+        levels = spellcasting.setdefault("spells", {})
+        for level, change in mod["spells"].items():
+            spells = levels.setdefault(level, {"spells": []})["spells"]
+            if mode == "addSpells":
+                spells.extend(change["spells"])
+            elif mode == "replaceSpells":
+                for replacement in change:
+                    if replacement["replace"] in spells:
+                        position = spells.index(replacement["replace"])
+                        spells[position : position + 1] = replacement["with"]
+            elif mode == "removeSpells":
+                spells[:] = [spell for spell in spells if spell not in change]
+
+    for frequency in ["will", "daily", "rest", "weekly"]:
+        if frequency not in mod:
+            continue
+        change = mod[frequency]
+        if frequency == "will":
+            groups = {None: change}
+        else:
+            groups = change
+        for group, groupChange in groups.items():
+            if group is None:
+                spells = spellcasting.setdefault("will", [])
+            else:
+                spells = spellcasting.setdefault(frequency, {}).setdefault(group, [])
+            if mode == "addSpells":
+                spells.extend(groupChange)
+            elif mode == "replaceSpells":
+                for replacement in groupChange:
+                    if replacement["replace"] in spells:
+                        position = spells.index(replacement["replace"])
+                        spells[position : position + 1] = replacement["with"]
+            elif mode == "removeSpells":
+                spells[:] = [spell for spell in spells if spell not in groupChange]
+
+
+def apply_mod(monster: dict, prop: str, mod: dict):
+    """
+    Applies a single _mod entry to prop of monster. Unsupported modes are left unapplied
+    """
+    mode = mod["mode"]
+    props = [key for key in ENTRY_PROPS if key in monster] if prop == "*" else [prop]
+
+    if mode == "replaceTxt":
+        flags = re.IGNORECASE if "i" in mod.get("flags", "") else 0
+        pattern = re.compile(mod["replace"], flags)
+        replacement = js_replacement(mod["with"])
+        for key in props:
+            if key in monster:
+                monster[key] = replace_entry_text(monster[key], pattern, replacement)
+    elif mode.endswith("Arr"):
+        monster[prop] = apply_array_mod(monster.get(prop, []), mod)
+    elif mode == "setProp":
+        set_path(monster, mod["prop"], copy.deepcopy(mod["value"]))
+    elif mode == "prefixSuffixStringProp":
+        value = get_path(monster, mod["prop"])
+        set_path(
+            monster, mod["prop"], mod.get("prefix", "") + value + mod.get("suffix", "")
+        )
+    elif mode == "scalarAddProp" or mode == "scalarMultProp":
+        target = monster if prop == "_" else monster.get(prop)
+        if type(target) == dict:
+            apply_scalar_mod(target, mod)
+    elif mode == "scalarAddHit" or mode == "scalarAddDc":
+        for key in props:
+            if key in monster:
+                apply_hit_dc_mod(monster, key, mod)
+    elif mode == "addSenses":
+        add_senses(monster, mod["senses"])
+    elif mode == "addSaves":
+        add_proficiencies(monster, "save", {}, mod["saves"])
+    elif mode == "addSkills":
+        add_proficiencies(monster, "skill", SKILL_ABILITIES, mod["skills"])
+    elif mode in ("addSpells", "replaceSpells", "removeSpells"):
+        modify_spells(monster, mod)
+
+
+# endregion
+
+
+class CopyResolver:
+    """
+    Expands 5etools _copy/_mod statblocks into full statblocks.
+
+    lookup(name, source) returns the raw statblock for a monster (or None). Every statblock looked up is
+    memoized expanded, so a base monster copied by many variants is only expanded once per resolver. Statblocks
+    passed to resolve are not, as another statblock may share their name and source.
+    """
+
+    def __init__(self, lookup):
+        self.lookup = lookup
+        self._resolved = {}
+        self._resolving = set()
+
+    def resolve(self, monster: dict) -> dict:
+        """
+        Returns monster with its _copy chain expanded. Raises CopyError for missing bases and circular copies
+        """
+        if "_copy" not in monster:
+            return monster
+        key = monster_key(monster["name"], monster.get("source", ""))
+        if key in self._resolving:
+            raise CopyError(
+                "Circular _copy involving " + monster["name"] + " (" + key[1] + ")"
+            )
+
+        self._resolving.add(key)
+        try:
+            copyMeta = monster["_copy"]
+            baseSource = copyMeta.get("source", monster.get("source", ""))
+            base = self.resolve_name(copyMeta["name"], baseSource)
+            if base is None:
+                raise CopyError(
+                    "Missing _copy base "
+                    + copyMeta["name"]
+                    + " ("
+                    + baseSource
+                    + ") for "
+                    + monster["name"]
+                )
+            resolved = self.merge(base, monster)
+        finally:
+            self._resolving.discard(key)
+        return resolved
+
+    def resolve_name(self, name: str, source: str):
+        """
+        Looks up a monster by name and source and returns it expanded, or None if it doesn't exist
+        """
+        key = monster_key(name, source)
+        if key in self._resolved:
+            return self._resolved[key]
+        monster = self.lookup(name, source)
+        if monster is None:
+            return None
+        resolved = self.resolve(monster)
+        if len(self._resolved) >= RESOLVED_CACHE_SIZE:
+            self._resolved.clear()
+        self._resolved[key] = resolved
+        return resolved
+
+    def merge(self, base: dict, monster: dict) -> dict:
+        """
+        Copies the properties of base that monster doesn't set, then applies monster's _mod
+        """
+        copyMeta = monster["_copy"]
+        preserve = copyMeta.get("_preserve", {})
+        merged = copy.deepcopy(
+            {key: value for key, value in monster.items() if key != "_copy"}
+        )
+        for key, value in base.items():
+            if key in monster:
+                continue
+            if key in PRESERVE_ONLY_PROPS and not (
+                preserve.get("*") or preserve.get(key)
+            ):
+                continue
+            merged[key] = copy.deepcopy(value)
+        # Properties set to null in the copy are removed
+        for key in [key for key, value in merged.items() if value is None]:
+            del merged[key]
+
+        for prop, mods in copyMeta.get("_mod", {}).items():
+            if mods == "remove":
+                merged.pop(prop, None)
+                continue
+            if type(mods) != list:
+                mods = [mods]
+            for mod in mods:
+                if type(mod) == str:
+                    mod = {"mode": mod}
+                apply_mod(merged, prop, mod)
+        return merged
+
+
+def resolve_copies(monsters, lookup=None, onError=None) -> list:
+    """
+    Expands every _copy statblock in monsters, looking bases up among the monsters themselves (and lookup, if given).
+    Statblocks whose base can't be found are returned unexpanded. Statblocks whose expansion fails otherwise (a
+    malformed _mod) are left out and passed to onError(monster, error) if it is given, and returned unexpanded if not
+    """
+    byKey = {
+        monster_key(monster["name"], monster.get("source", "")): monster
+        for monster in monsters
+        if "name" in monster
+    }
+
+    def find(name, source):
+        monster = byKey.get(monster_key(name, source))
+        if monster is None and lookup is not None:
+            monster = lookup(name, source)
+        return monster
+
+    resolver = CopyResolver(find)
+    resolved = []
+    for monster in monsters:
+        try:
+            resolved.append(resolver.resolve(monster))
+        except CopyError:
+            resolved.append(monster)
+        except Exception as error:
+            if onError is None:
+                resolved.append(monster)
+            else:
+                onError(monster, error)
+    return resolved
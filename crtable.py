@@ -0,0 +1,159 @@
+import math
+
+# region CR TABLE
+# XP awarded for defeating a creature of each challenge rating
+XP_BY_CR = {
+    "0": 10,
+    "1/8": 25,
+    "1/4": 50,
+    "1/2": 100,
+    "1": 200,
+    "2": 450,
+    "3": 700,
+    "4": 1100,
+    "5": 1800,
+    "6": 2300,
+    "7": 2900,
+    "8": 3900,
+    "9": 5000,
+    "10": 5900,
+    "11": 7200,
+    "12": 8400,
+    "13": 10000,
+    "14": 11500,
+    "15": 13000,
+    "16": 15000,
+    "17": 18000,
+    "18": 20000,
+    "19": 22000,
+    "20": 25000,
+    "21": 33000,
+    "22": 41000,
+    "23": 50000,
+    "24": 62000,
+    "25": 75000,
+    "26": 90000,
+    "27": 105000,
+    "28": 120000,
+    "29": 135000,
+    "30": 155000,
+}
+
+# Keys of the dict form of "cr" that hold an alternate challenge rating
+CR_VARIANTS = ["lair", "coven"]
+
+# Used for statblocks without a challenge rating (or with one like "Unknown")
+UNKNOWN_CR = {"cr": None, "value": None, "prof_bonus": 2, "xp": 0}
+
+
+def parse_cr_value(cr: str) -> float:
+    """
+    Converts a challenge rating string ("1/4", "3") to a number
+    """
+    if "/" in cr:
+        numerator, denominator = cr.split("/")
+        return int(numerator) / int(denominator)
+    return float(cr)
+
+
+def proficiency_bonus(value: float) -> int:
+    """
+    Proficiency bonus for a numeric challenge rating
+    """
+    if value < 1:
+        return 2
+    return math.ceil(value / 4) + 1
+
+
+def build_cr_entry(cr: str, xp=None) -> dict:
+    """
+    Builds the table entry for a challenge rating string
+    """
+    value = parse_cr_value(cr)
+    if xp is None:
+        xp = XP_BY_CR.get(cr, 0)
+    return {"cr": cr, "value": value, "prof_bonus": proficiency_bonus(value), "xp": xp}
+
+
+CR_TABLE = {cr: build_cr_entry(cr) for cr in XP_BY_CR}
+# endregion
+
+# Entries of the ratings outside of CR_TABLE, parsed once
+_parsedCrs = {}
+
+
+def lookup_cr_string(cr: str) -> dict:
+    """
+    Returns the table entry for a challenge rating string. Ratings outside of the table are parsed once
+    """
+    entry = CR_TABLE.get(cr)
+    if entry is not None:
+        return entry
+    if cr in _parsedCrs:
+        return _parsedCrs[cr]
+    try:
+        entry = build_cr_entry(cr)
+    except (ValueError, ZeroDivisionError):
+        # e.g. "1/0"
+        entry = UNKNOWN_CR
+    _parsedCrs[cr] = entry
+    return entry
+
+
+def lookup_cr(cr) -> dict:
+    """
+    Returns the table entry for the "cr" field of a statblock, which is either a string or a dict like {"cr": "10", "lair": "11"}
+    """
+    if cr is None:
+        return UNKNOWN_CR
+    if type(cr) == dict:
+        entry = lookup_cr_string(cr["cr"])
+        # Some statblocks override the XP (e.g. summoned creatures worth 0 XP)
+        if "xp" in cr and cr["xp"] != entry["xp"]:
+            entry = dict(entry)
+            entry["xp"] = cr["xp"]
+        return entry
+    return lookup_cr_string(cr)
+
+
+def cr_variants(cr) -> dict:
+    """
+    Returns the table entries for every challenge rating of a statblock, keyed by "cr", "lair" and "coven"
+    """
+    variants = {"cr": lookup_cr(cr)}
+    if type(cr) == dict:
+        for variant in CR_VARIANTS:
+            if variant in cr:
+                variants[variant] = lookup_cr_string(cr[variant])
+    return variants
+
+
+def cr_sort_key(monster: dict) -> float:
+    """
+    Sort key ordering statblocks by challenge rating, with unrated statblocks last
+    """
+    value = lookup_cr(monster.get("cr"))["value"]
+    if value is None:
+        return math.inf
+    return value
+
+
+def filter_by_cr(monsters, min_cr=None, max_cr=None) -> list:
+    """
+    Returns the statblocks whose challenge rating is between min_cr and max_cr (inclusive). Bounds may be numbers or strings like "1/2"
+    """
+    if type(min_cr) == str:
+        min_cr = parse_cr_value(min_cr)
+    if type(max_cr) == str:
+        max_cr = parse_cr_value(max_cr)
+    selected = []
+    for monster in monsters:
+        value = lookup_cr(monster.get("cr"))["value"]
+        if value is None:
+            continue
+        if min_cr is not None and value < min_cr:
+            continue
+        if max_cr is not None and value > max_cr:
+            continue
+        selected.append(monster)
+    return selected
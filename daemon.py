@@ -0,0 +1,328 @@
+import argparse
+import json
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from converter import convert, load_template
+from copies import CopyResolver
+from pipeline import StageCache
+from spells import load_spell_index
+from store import DEFAULT_DATABASE, BestiaryStore
+
+DEFAULT_SOCKET = "converter.sock"
+# Latencies of this many recent requests are kept for the percentiles
+METRICS_WINDOW = 1000
+# Requests larger than this are rejected
+MAX_REQUEST_SIZE = 16 * 1024 * 1024
+# Stage results each worker keeps warm
+WORKER_CACHE_SIZE = 20000
+
+# Per-process state, set up once by init_worker
+_store = None
+_cache = None
+
+
+# region WORKERS
+def init_worker(databasePath: str = None):
+    """
+    Loads everything a conversion needs once per worker: the template, the spell catalog, the bestiary database and a
+    stage cache that stays warm between requests
+    """
+    global _store, _cache
+    load_template()
+    load_spell_index()
+    if databasePath is not None and os.path.exists(databasePath):
+        _store = BestiaryStore(databasePath)
+    _cache = StageCache(limit=WORKER_CACHE_SIZE)
+
+
+def find_monster(name: str, source: str = None):
+    """
+    Returns the monster with this name from the database, or the closest fuzzy match
+    """
+    if _store is None:
+        raise LookupError(
+            'No bestiary database loaded, send the statblock as "monster"'
+        )
+    monster = _store.get_resolved(name, source)
+    if monster is not None:
+        return monster
+    candidates = _store.search(name, source, limit=1)
+    if not candidates:
+        raise LookupError("No monster named " + name)
+    score, candidateName, candidateSource = candidates[0]
+    return _store.get_resolved(candidateName, candidateSource)
+
+
+def convert_request(request: dict) -> tuple:
+    """
+    Converts the monster of a request and returns the character as JSON text and the conversion time in seconds
+    """
+    start = time.perf_counter()
+    if "monster" in request:
+        monster = request["monster"]
+        # Copies can only be expanded if their base is in the database. The statblock may differ from the one in the
+        # database with the same name, so it gets a resolver of its own rather than the store's memoized one
+        if "_copy" in monster and _store is not None:
+            monster = CopyResolver(_store.get).resolve(monster)
+    else:
+        monster = find_monster(request["name"], request.get("source"))
+    character = convert(monster, request.get("options", {}), _cache)
+    return json.dumps(character), time.perf_counter() - start
+
+
+# endregion
+
+
+class LatencyMetrics:
+    """
+    Thread-safe request counts and latency percentiles over the last METRICS_WINDOW requests
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=METRICS_WINDOW)
+        self.conversions = deque(maxlen=METRICS_WINDOW)
+
+    def record(self, latency: float, conversion: float = None, ok: bool = True):
+        with self.lock:
+            self.requests += 1
+            if not ok:
+                self.errors += 1
+            self.latencies.append(latency)
+            if conversion is not None:
+                self.conversions.append(conversion)
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            latencies = sorted(self.latencies)
+            conversions = sorted(self.conversions)
+            snapshot = {
+                "uptime_s": round(time.time() - self.started, 1),
+                "requests": self.requests,
+                "errors": self.errors,
+            }
+        snapshot["latency_ms"] = percentiles(latencies)
+        snapshot["conversion_ms"] = percentiles(conversions)
+        return snapshot
+
+
+def percentiles(values: list) -> dict:
+    """
+    Returns the p50, p95, p99 and max of sorted values (in seconds) in milliseconds
+    """
+    if not values:
+        return {}
+    result = {}
+    for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+        result[name] = round(
+            values[min(int(fraction * len(values)), len(values) - 1)] * 1000, 3
+        )
+    result["max"] = round(values[-1] * 1000, 3)
+    return result
+
+
+# region SERVER
+class ConversionHandler(socketserver.StreamRequestHandler):
+    """
+    Serves one connection. Requests and responses are JSON objects, one per line:
+
+    {"id": 1, "op": "convert", "name": "Goblin", "source": "MM", "options": {"combatReflexes": true}}
+    {"id": 2, "op": "convert", "monster": {...5etools statblock...}}
+    {"id": 3, "op": "metrics"}
+    {"id": 4, "op": "ping"}
+
+    Conversions answer {"id": 1, "ok": true, "elapsed_ms": ..., "character": {...}}, failures {"id": 1, "ok": false, "error": "..."}
+    """
+
+    def handle(self):
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_SIZE + 1)
+            if not line:
+                return
+            if len(line) > MAX_REQUEST_SIZE and not line.endswith(b"\n"):
+                # The rest of the request is still unread, so the connection can't be kept in step
+                self.wfile.write(self.server.respond(line).encode() + b"\n")
+                self.wfile.flush()
+                return
+            if not line.strip():
+                continue
+            self.wfile.write(self.server.respond(line).encode() + b"\n")
+            self.wfile.flush()
+
+
+class ConversionServer:
+    """
+    Accepts connections on a thread each and runs conversions on a pool of worker processes. With no workers they
+    run on a single thread of the daemon process, which saves passing requests between processes
+    """
+
+    def __init__(self, workers: int = None, databasePath: str = DEFAULT_DATABASE):
+        self.metrics = LatencyMetrics()
+        if workers == 0:
+            # One thread, since the worker state (the database connection) can't be shared between threads
+            self.pool = ThreadPoolExecutor(
+                max_workers=1, initializer=init_worker, initargs=(databasePath,)
+            )
+        else:
+            self.pool = ProcessPoolExecutor(
+                max_workers=workers, initializer=init_worker, initargs=(databasePath,)
+            )
+
+    def respond(self, line: bytes) -> str:
+        """
+        Handles one request line and returns the response line
+        """
+        start = time.perf_counter()
+        requestId = None
+        try:
+            if len(line) > MAX_REQUEST_SIZE:
+                raise ValueError(
+                    "Request is larger than " + str(MAX_REQUEST_SIZE) + " bytes"
+                )
+            request = json.loads(line)
+            if type(request) != dict:
+                raise ValueError("Requests must be JSON objects")
+            requestId = request.get("id")
+            op = request.get("op", "convert")
+            if op == "ping":
+                return json.dumps({"id": requestId, "ok": True})
+            if op == "metrics":
+                return json.dumps(
+                    {"id": requestId, "ok": True, "metrics": self.metrics.snapshot()}
+                )
+            if op != "convert":
+                raise ValueError("Unknown op " + str(op))
+            if "monster" not in request and "name" not in request:
+                raise ValueError('Convert requests need a "monster" or a "name"')
+            character, conversion = self.pool.submit(convert_request, request).result()
+        except Exception as error:
+            self.metrics.record(time.perf_counter() - start, ok=False)
+            return json.dumps(
+                {
+                    "id": requestId,
+                    "ok": False,
+                    "error": type(error).__name__ + ": " + str(error),
+                }
+            )
+        latency = time.perf_counter() - start
+        self.metrics.record(latency, conversion)
+        # The character is already JSON, so it is spliced in instead of decoded and encoded again
+        return (
+            '{"id": '
+            + json.dumps(requestId)
+            + ', "ok": true, "elapsed_ms": '
+            + str(round(latency * 1000, 3))
+            + ', "character": '
+            + character
+            + "}"
+        )
+
+    def serve(self, socketPath: str = None, port: int = None):
+        """
+        Serves on a Unix domain socket, or on localhost:port if a port is given, until interrupted
+        """
+        if port is not None:
+            serverClass = socketserver.ThreadingTCPServer
+            address = ("127.0.0.1", port)
+        else:
+            serverClass = socketserver.ThreadingUnixStreamServer
+            address = socketPath
+            remove_stale_socket(socketPath)
+        serverClass.daemon_threads = True
+        serverClass.allow_reuse_address = True
+        with serverClass(address, ConversionHandler) as server:
+            server.respond = self.respond
+            if port is None:
+                socketInode = os.stat(socketPath).st_ino
+            print("Serving conversions on " + str(address))
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                # Only our own socket is removed, not one a newer daemon has put in its place
+                if port is None:
+                    try:
+                        if os.stat(socketPath).st_ino == socketInode:
+                            os.remove(socketPath)
+                    except FileNotFoundError:
+                        pass
+                self.pool.shutdown(cancel_futures=True)
+
+
+def remove_stale_socket(socketPath: str):
+    """
+    Removes the socket a daemon that is no longer running left behind. Raises if something else is at the path or a
+    daemon is still listening on it
+    """
+    try:
+        mode = os.stat(socketPath).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(socketPath + " exists and is not a socket")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socketPath)
+    except OSError:
+        # Nothing is listening, so it is left over from a daemon that stopped without cleaning up
+        os.remove(socketPath)
+        return
+    finally:
+        probe.close()
+    raise FileExistsError("A daemon is already listening on " + socketPath)
+
+
+# endregion
+
+
+def send_request(
+    request: dict, socketPath: str = DEFAULT_SOCKET, port: int = None
+) -> dict:
+    """
+    Sends one request to a running daemon and returns its response
+    """
+    if port is not None:
+        connection = socket.create_connection(("127.0.0.1", port))
+    else:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(socketPath)
+    with connection, connection.makefile("rwb") as stream:
+        stream.write(json.dumps(request).encode() + b"\n")
+        stream.flush()
+        return json.loads(stream.readline())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Serves statblock conversions over a Unix socket (or localhost TCP) with everything loaded once"
+    )
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Unix socket path")
+    parser.add_argument(
+        "--port", type=int, help="Serve on localhost:PORT instead of a Unix socket"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes (default: one per CPU, 0 converts on one thread of the daemon)",
+    )
+    parser.add_argument("--db", default=DEFAULT_DATABASE)
+    args = parser.parse_args(argv)
+    try:
+        ConversionServer(args.workers, args.db).serve(args.socket, args.port)
+    except FileExistsError as error:
+        print("Can't serve: " + str(error))
+
+
+if __name__ == "__main__":
+    main()
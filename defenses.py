@@ -0,0 +1,130 @@
+import copy
+import uuid
+
+import jsons
+
+# region DEFENSE TABLES
+# GURPS names of the 5e damage types, used in the "Limited (...)" notes
+DAMAGE_TYPES = {
+    "acid": "Acid",
+    "bludgeoning": "Crushing",
+    "cold": "Cold",
+    "fire": "Fire",
+    "force": "Force",
+    "lightning": "Lightning",
+    "necrotic": "Necrotic",
+    "piercing": "Impaling and Piercing",
+    "poison": "Poison",
+    "psychic": "Psychic",
+    "radiant": "Radiant",
+    "slashing": "Cutting",
+    "thunder": "Thunder",
+}
+
+# Trait template for each 5etools defense list
+DEFENSE_TEMPLATES = {
+    "resist": jsons.damageResistanceTrait,
+    "immune": jsons.damageImmunityTrait,
+    "vulnerable": jsons.vulnerabilityTrait,
+    "conditionImmune": jsons.conditionImmunityTrait,
+}
+
+# Conditions that have their own GURPS trait instead of a limited Condition Immunity
+CONDITION_TEMPLATES = {
+    "charmed": jsons.indomitableTrait,
+    "frightened": jsons.unfazeableTrait,
+}
+
+# GURPS wording of the conditions 5etools puts on grouped entries, e.g. {"resist": [...], "note": "from nonmagical attacks", "cond": true}
+DEFENSE_NOTES = {
+    "from nonmagical attacks": "From Nonmagical Weapons",
+    "from nonmagical weapons": "From Nonmagical Weapons",
+    "from nonmagical attacks that aren't adamantine": "From Nonmagical, Non-Adamantine Weapons",
+    "from nonmagical attacks that aren't silvered": "From Nonmagical, Non-Silvered Weapons",
+    "from nonmagical attacks not made with adamantine weapons": "From Nonmagical, Non-Adamantine Weapons",
+    "from nonmagical attacks not made with silvered weapons": "From Nonmagical, Non-Silvered Weapons",
+}
+# endregion
+
+
+def defense_label(defenseType: str) -> str:
+    """
+    Returns the GURPS name of a 5e damage type or condition
+    """
+    return DAMAGE_TYPES.get(defenseType, defenseType.title())
+
+
+def defense_note(note: str) -> str:
+    return DEFENSE_NOTES.get(note.lower(), note.title())
+
+
+def iter_defenses(entries: list, key: str):
+    """
+    Yields (types, note) for every entry of a 5etools defense list (resist, immune, vulnerable or conditionImmune) in
+    a single pass. Strings yield one type, grouped objects yield all of their types with their note (nested groups add
+    their note to the outer one) and {"special": text} entries yield no types and the text as note
+    """
+    stack = [(iter(entries), "")]
+    while stack:
+        entry = next(stack[-1][0], None)
+        note = stack[-1][1]
+        if entry is None:
+            stack.pop()
+        elif type(entry) == str:
+            yield [entry], note
+        elif type(entry) == dict:
+            if "special" in entry:
+                yield [], entry["special"]
+                continue
+            groupNote = note
+            if entry.get("note"):
+                groupNote = (note + " " + defense_note(entry["note"])).strip()
+            types = [value for value in entry.get(key, []) if type(value) == str]
+            if types:
+                yield types, groupNote
+            nested = [value for value in entry.get(key, []) if type(value) == dict]
+            if nested:
+                stack.append((iter(nested), groupNote))
+
+
+def join_labels(labels: list) -> str:
+    if len(labels) <= 2:
+        return " and ".join(labels)
+    return ", ".join(labels[:-1]) + ", and " + labels[-1]
+
+
+def instantiate(template: dict, notes: str = None) -> dict:
+    """
+    Returns a copy of a trait template with a new id and, if given, new notes
+    """
+    trait = {"id": str(uuid.uuid4())}
+    trait.update(copy.deepcopy(template))
+    if notes is not None:
+        trait["notes"] = notes
+    return trait
+
+
+def build_defense_traits(input_data: dict) -> list:
+    """
+    Returns the GCS traits for the resistances, immunities, vulnerabilities and condition immunities of a statblock
+    """
+    traits = []
+    for key, template in DEFENSE_TEMPLATES.items():
+        for types, note in iter_defenses(input_data.get(key, []), key):
+            if key == "conditionImmune" and not note:
+                # Conditions with a trait of their own get it, the rest share one Condition Immunity each
+                for condition in types:
+                    if condition in CONDITION_TEMPLATES:
+                        traits.append(instantiate(CONDITION_TEMPLATES[condition]))
+                    else:
+                        traits.append(
+                            instantiate(
+                                template, "Limited (" + defense_label(condition) + ")"
+                            )
+                        )
+                continue
+            limitation = join_labels([defense_label(value) for value in types])
+            if note:
+                limitation = (limitation + " " + note).strip()
+            traits.append(instantiate(template, "Limited (" + limitation + ")"))
+    return traits
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import traceback
+from dataclasses import dataclass
+
+from outputs import write_atomic
+
+REPORT_NAME = "failures.json"
+# Innermost frames of a traceback that make up its signature
+SIGNATURE_FRAMES = 4
+# Monsters listed per signature in the report
+EXAMPLES_PER_SIGNATURE = 20
+
+
+@dataclass(slots=True)
+class Failure:
+    """
+    A statblock that couldn't be converted. signature identifies where it failed, so failures with the same cause
+    can be counted together
+    """
+
+    monster: str
+    source: str
+    stage: str
+    exception: str
+    message: str
+    signature: str
+
+
+def traceback_signature(error: BaseException) -> str:
+    """
+    Returns a short hash of an exception's type and the innermost frames of its traceback. Line numbers are left out,
+    so the hash stays the same when unrelated code above the failing line changes
+    """
+    frames = traceback.extract_tb(error.__traceback__)[-SIGNATURE_FRAMES:]
+    parts = [type(error).__name__]
+    for frame in frames:
+        parts.append(frame.name + ":" + (frame.line or ""))
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()[:12]
+
+
+def describe_failure(monster: dict, error: BaseException, stage: str = None) -> Failure:
+    """
+    Returns the Failure for an exception raised while converting a statblock. stage defaults to the one a StageError
+    names. Has to be called where the exception was raised, as tracebacks don't survive being sent between processes
+    """
+    if stage is None:
+        stage = getattr(error, "stage", "convert")
+    # StageError only names the stage, the original exception says what went wrong
+    cause = getattr(error, "error", error)
+    return Failure(
+        monster.get("name", "?"),
+        monster.get("source", ""),
+        stage,
+        type(cause).__name__,
+        str(cause),
+        stage + "-" + traceback_signature(cause),
+    )
+
+
+class FailureReport:
+    """
+    The failures of a batch run grouped by signature, most frequent first
+    """
+
+    def __init__(self):
+        self.groups = {}
+        self.count = 0
+
+    def add(self, failure: Failure):
+        self.count += 1
+        if failure.signature not in self.groups:
+            self.groups[failure.signature] = []
+        self.groups[failure.signature].append(failure)
+
+    def __len__(self):
+        return self.count
+
+    def to_dict(self) -> dict:
+        signatures = []
+        for signature, failures in sorted(
+            self.groups.items(), key=lambda item: -len(item[1])
+        ):
+            first = failures[0]
+            signatures.append(
+                {
+                    "signature": signature,
+                    "count": len(failures),
+                    "stage": first.stage,
+                    "exception": first.exception,
+                    "message": first.message,
+                    "monsters": [
+                        {
+                            "name": failure.monster,
+                            "source": failure.source,
+                            "message": failure.message,
+                        }
+                        for failure in failures[:EXAMPLES_PER_SIGNATURE]
+                    ],
+                }
+            )
+        return {"failures": self.count, "signatures": signatures}
+
+    def summary(self, limit: int = 5) -> str:
+        """
+        Returns a line per most frequent signature, e.g. "  12x attributes TypeError: unsupported operand ..."
+        """
+        lines = []
+        for group in self.to_dict()["signatures"][:limit]:
+            lines.append(
+                "  "
+                + str(group["count"])
+                + "x "
+                + group["stage"]
+                + " "
+                + group["exception"]
+                + ": "
+                + group["message"]
+                + " ("
+                + group["signature"]
+                + ")"
+            )
+        return "\n".join(lines)
+
+    def write(self, path: str):
+        write_atomic(path, json.dumps(self.to_dict(), indent=4, ensure_ascii=False))
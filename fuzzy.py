@@ -0,0 +1,75 @@
+import heapq
+import re
+from collections import Counter
+
+
+def normalize_name(name: str) -> str:
+    """
+    Lower cases a name and collapses punctuation and whitespace into single spaces
+    """
+    return " ".join(re.split(r"[^a-z0-9]+", name.lower())).strip()
+
+
+def trigrams(name: str) -> set:
+    """
+    Returns the set of 3 character substrings of a normalized name, padded so that word starts and ends count
+    """
+    padded = "  " + normalize_name(name) + " "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Inverted index from name trigrams to monsters for ranked fuzzy name lookup ("gibbering mouter", "young red dragn")
+    """
+
+    def __init__(self, entries=()):
+        # Monsters sharing a normalized name (e.g. reprints in other sources) share a key
+        self.keys = []
+        self.monsters = []
+        self._keyIds = {}
+        self._sizes = []
+        self._postings = {}
+        for name, source in entries:
+            self.add(name, source)
+
+    def add(self, name: str, source: str):
+        key = normalize_name(name)
+        if key in self._keyIds:
+            self.monsters[self._keyIds[key]].append((name, source))
+            return
+        keyId = len(self.keys)
+        self._keyIds[key] = keyId
+        self.keys.append(key)
+        self.monsters.append([(name, source)])
+        grams = trigrams(name)
+        self._sizes.append(len(grams))
+        for gram in grams:
+            if gram not in self._postings:
+                self._postings[gram] = []
+            self._postings[gram].append(keyId)
+
+    def search(self, query: str, limit: int = 5, min_score: float = 0.3) -> list:
+        """
+        Returns up to limit (score, name, source) candidates ranked by trigram similarity (Dice coefficient) to query.
+        A limit of None returns every candidate above min_score
+        """
+        grams = trigrams(query)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        scores = (
+            (2 * count / (len(grams) + self._sizes[keyId]), keyId)
+            for keyId, count in shared.items()
+        )
+        if limit is None:
+            ranked = sorted(scores, reverse=True)
+        else:
+            ranked = heapq.nlargest(limit, scores)
+        candidates = []
+        for score, keyId in ranked:
+            if score < min_score:
+                break
+            for name, source in self.monsters[keyId]:
+                candidates.append((score, name, source))
+        return candidates[:limit]
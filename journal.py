@@ -0,0 +1,62 @@
+import hashlib
+import json
+import os
+import threading
+
+JOURNAL_NAME = ".batch-journal.jsonl"
+
+
+def input_hash(monster: dict, options: dict = None) -> str:
+    """
+    Returns a hash of a statblock and the conversion options, which identifies one conversion in the journal
+    """
+    data = json.dumps([monster, options or {}], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+class Journal:
+    """
+    Append-only record of finished conversions, one {"hash": ..., "path": ...} line per written file. A restarted batch
+    skips every conversion in the journal whose output file still exists
+    """
+
+    def __init__(self, path: str, restart: bool = False):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries = {}
+        if restart and os.path.exists(path):
+            os.remove(path)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # The last line is cut off if the run was killed while writing it
+                        continue
+                    self.entries[entry["hash"]] = entry["path"]
+        self.file = open(path, "a", encoding="utf-8")
+
+    def done(self, inputHash: str):
+        """
+        Returns the output path of a finished conversion, or None if it has to be (re)done
+        """
+        path = self.entries.get(inputHash)
+        if path is not None and os.path.exists(path):
+            return path
+        return None
+
+    def record(self, inputHash: str, path: str):
+        with self.lock:
+            self.entries[inputHash] = path
+            self.file.write(json.dumps({"hash": inputHash, "path": path}) + "\n")
+            self.file.flush()
+
+    def close(self, fsync: bool = False):
+        with self.lock:
+            if fsync:
+                os.fsync(self.file.fileno())
+            self.file.close()
+
+    def __len__(self):
+        return len(self.entries)
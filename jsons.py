@@ -174,6 +174,252 @@ sharpTeethTrait = {
 }
 # endregion
 
+# region Damage Resistance Trait
+damageResistanceTrait = {
+    "type": "trait",
+    "name": "Damage Resistance (0.5x)",
+    "notes": "Limited (Fire)",
+    "userdesc": "Half All Damage That Passed DR",
+    "base_points": 20,
+    "calc": {"points": 20},
+}
+# endregion
+
+# region Damage Immunity Trait
+damageImmunityTrait = {
+    "type": "trait",
+    "name": "Damage Immunity",
+    "notes": "Limited (Fire)",
+    "base_points": 50,
+    "calc": {"points": 50},
+}
+# endregion
+
+# region Vulnerability Trait
+vulnerabilityTrait = {
+    "type": "trait",
+    "name": "Vulnerability (x2)",
+    "notes": "Limited (Fire)",
+    "userdesc": "Double All Damage That Passed DR",
+    "tags": ["Disadvantage", "Physical"],
+    "base_points": -20,
+    "calc": {"points": -20},
+}
+# endregion
+
+# region Condition Immunity Trait
+conditionImmunityTrait = {
+    "type": "trait",
+    "name": "Condition Immunity",
+    "notes": "Limited (Poisoned)",
+    "userdesc": "Can't be affected by the condition",
+    "base_points": 10,
+    "calc": {"points": 10},
+}
+# endregion
+
+# region Unfazeable Trait
+unfazeableTrait = {
+    "type": "trait",
+    "name": "Unfazeable",
+    "reference": "B95",
+    "notes": "Never makes Fright Checks",
+    "tags": ["Advantage", "Mental"],
+    "base_points": 15,
+    "calc": {"points": 15},
+}
+# endregion
+
+# region Indomitable Trait
+indomitableTrait = {
+    "type": "trait",
+    "name": "Indomitable",
+    "reference": "B60",
+    "notes": "Immune to Influence skills and charm",
+    "tags": ["Advantage", "Mental"],
+    "base_points": 15,
+    "calc": {"points": 15},
+}
+# endregion
+
+# region Dark Vision Trait
+darkVisionTrait = {
+    "type": "trait",
+    "name": "Dark Vision",
+    "reference": "B47,P46",
+    "tags": ["Advantage", "Exotic", "Physical"],
+    "modifiers": [
+        {
+            "id": "d8886d7f-b079-4e07-9f7a-749f509e1bc0",
+            "type": "modifier",
+            "name": "Can see colors in the dark",
+            "cost": 20,
+            "disabled": True,
+        },
+        {
+            "id": "f515b6a5-62d7-4105-9622-ffc131556f64",
+            "type": "modifier",
+            "name": "Hypersensory",
+            "reference": "P46",
+            "cost": 40,
+            "disabled": True,
+        },
+    ],
+    "base_points": 25,
+    "calc": {"points": 25},
+}
+# endregion
+
+# region Blindsight Trait
+blindsightTrait = {
+    "type": "trait",
+    "name": "Blindsight",
+    "userdesc": "Can perceive its surroundings without relying on sight, within 60 ft.",
+    "base_points": 40,
+    "calc": {"points": 40},
+}
+# endregion
+
+# region Tremorsense Trait
+tremorsenseTrait = {
+    "type": "trait",
+    "name": "Tremorsense",
+    "userdesc": "Can sense its surroundings via vibrations in the ground. Can automaticaly pinpoint the location of anything in contact with the ground within 60 ft.",
+    "base_points": 40,
+    "calc": {"points": 40},
+}
+# endregion
+
+# region True Sight Trait
+truesightTrait = {
+    "type": "trait",
+    "name": "True Sight",
+    "userdesc": "Can see normally in magical and nonmagical darkness, see invisible creatures and objects, automatically detect visual illusions and succeed on saving throws against them, and perceive the original form of a shapechanger or a creature that is transformed by magic. Within 120 ft.",
+    "base_points": 60,
+    "calc": {"points": 60},
+}
+# endregion
+
+# region Devil's Sight Trait
+devilsSightTrait = {
+    "type": "trait",
+    "name": "Devil's Sight",
+    "userdesc": "Can see normally in magical and nonmagical darkness, within 120 ft.",
+    "base_points": 30,
+    "calc": {"points": 30},
+}
+# endregion
+
+# region Language Trait
+languageTrait = {
+    "type": "trait",
+    "name": "Language: Any",
+    "reference": "B24",
+    "tags": ["Advantage", "Language", "Mental"],
+    "modifiers": [
+        {
+            "id": "ff972d9a-b925-4895-a489-f3d14999074d",
+            "type": "modifier",
+            "name": "Native",
+            "reference": "B23",
+            "cost": -6,
+            "cost_type": "points",
+            "disabled": True,
+        },
+        {
+            "id": "e9f38c71-c4bd-45ee-a5e2-b47a33029f96",
+            "type": "modifier",
+            "name": "Spoken",
+            "reference": "B24",
+            "notes": "None",
+            "cost_type": "points",
+            "disabled": True,
+        },
+        {
+            "id": "6cd10ab4-c4f9-4764-a47d-0e77d105d862",
+            "type": "modifier",
+            "name": "Spoken",
+            "reference": "B24",
+            "notes": "Broken",
+            "cost": 1,
+            "cost_type": "points",
+            "disabled": True,
+        },
+        {
+            "id": "3c7caa3c-055e-4422-ac8e-6a2d632b391c",
+            "type": "modifier",
+            "name": "Spoken",
+            "reference": "B24",
+            "notes": "Accented",
+            "cost": 2,
+            "cost_type": "points",
+            "disabled": True,
+        },
+        {
+            "id": "231ba28d-11ce-44e1-8d23-074d40ca57c6",
+            "type": "modifier",
+            "name": "Spoken",
+            "reference": "B24",
+            "notes": "Native",
+            "cost": 3,
+            "cost_type": "points",
+        },
+        {
+            "id": "152ad20b-dc58-4abb-b256-71da14dbb89c",
+            "type": "modifier",
+            "name": "Written",
+            "reference": "B24",
+            "notes": "None",
+            "cost_type": "points",
+            "disabled": True,
+        },
+        {
+            "id": "6304a0d6-80f3-4a5f-b3cc-3ba2ae0c8063",
+            "type": "modifier",
+            "name": "Written",
+            "reference": "B24",
+            "notes": "Broken",
+            "cost": 1,
+            "cost_type": "points",
+            "disabled": True,
+        },
+        {
+            "id": "5818ab4a-2c4b-4c3e-a711-c4b6332daaca",
+            "type": "modifier",
+            "name": "Written",
+            "reference": "B24",
+            "notes": "Accented",
+            "cost": 2,
+            "cost_type": "points",
+            "disabled": True,
+        },
+        {
+            "id": "1b77515e-5789-49a0-8238-7242900c8c2c",
+            "type": "modifier",
+            "name": "Written",
+            "reference": "B24",
+            "notes": "Native",
+            "cost": 3,
+            "cost_type": "points",
+        },
+    ],
+    "calc": {"points": 6},
+}
+# endregion
+
+# region Telesend Trait
+telesendTrait = {
+    "type": "trait",
+    "name": "Telesend",
+    "reference": "B91",
+    "notes": "Range 120 ft.",
+    "userdesc": "Can communicate telepathically with any creature within range that understands a language",
+    "tags": ["Advantage", "Mental"],
+    "base_points": 30,
+    "calc": {"points": 30},
+}
+# endregion
+
 # endregion
 
 # region Skills
@@ -0,0 +1,109 @@
+import re
+import uuid
+
+import jsons
+from defenses import instantiate
+from markup import render_tags
+
+# region LANGUAGE TABLES
+# Spoken and written comprehension of each kind of language trait
+LANGUAGE_LEVELS = {
+    "native": ("Native", "Native"),
+    # Creatures that understand a language but can't speak it
+    "understood": ("Broken", "None"),
+}
+
+# "understands Abyssal and Infernal but can't speak", "understands the languages of its creator but can't speak them"
+UNDERSTANDS = re.compile(
+    r"understands (?P<languages>.+?),? but (?:can't|cannot|can not|doesn't|does not) speak(?: (?:it|them))?",
+    re.IGNORECASE,
+)
+# "telepathy 120 ft."
+TELEPATHY = re.compile(
+    r"telepathy(?: (?P<range>\d{1,6}) ?(?:ft\.?|feet))?", re.IGNORECASE
+)
+# Separators between the languages of an "understands" entry
+LANGUAGE_SEPARATOR = re.compile(r",? and |, ")
+
+_languageModifiers = {}
+# endregion
+
+
+def language_modifiers(level: str) -> tuple:
+    """
+    Returns the modifiers and points of a language trait at a comprehension level, built from the template once per level.
+    The modifier list is shared by every trait at that level, so it must not be changed, build_language_trait copies
+    the modifiers (which only hold plain values) for each trait
+    """
+    if level not in _languageModifiers:
+        spoken, written = LANGUAGE_LEVELS[level]
+        modifiers = []
+        points = 0
+        for modifier in jsons.languageTrait["modifiers"]:
+            modifier = dict(modifier)
+            enabled = (
+                modifier["name"] == "Spoken" and modifier["notes"] == spoken
+            ) or (modifier["name"] == "Written" and modifier["notes"] == written)
+            modifier.pop("disabled", None)
+            if enabled:
+                points += modifier.get("cost", 0)
+            else:
+                modifier["disabled"] = True
+            modifiers.append(modifier)
+        _languageModifiers[level] = (modifiers, points)
+    return _languageModifiers[level]
+
+
+def build_language_trait(name: str, level: str = "native") -> dict:
+    """
+    Instantiates the language trait template with a new id, name and comprehension level. Only the lists of the
+    template are copied, its other fields are plain values
+    """
+    modifiers, points = language_modifiers(level)
+    trait = {"id": str(uuid.uuid4())}
+    trait.update(jsons.languageTrait)
+    trait["name"] = name
+    trait["tags"] = list(trait["tags"])
+    trait["modifiers"] = [dict(modifier) for modifier in modifiers]
+    trait["calc"] = {"points": points}
+    if level == "understood":
+        trait["notes"] = "Understands but can't speak"
+    return trait
+
+
+def normalize_language(language: str):
+    """
+    Splits a 5etools languages entry into (kind, value) pairs: ("native", name), ("understood", name) and
+    ("telepathy", range in feet or None). Whatever isn't telepathy or an "understands" clause is one language name
+    """
+    language = render_tags(language)
+    for match in TELEPATHY.finditer(language):
+        yield "telepathy", int(match.group("range")) if match.group("range") else None
+    language = TELEPATHY.sub("", language)
+    for match in UNDERSTANDS.finditer(language):
+        for name in LANGUAGE_SEPARATOR.split(match.group("languages")):
+            if name.strip():
+                yield "understood", name.strip()
+    language = UNDERSTANDS.sub("", language).strip(" ,;")
+    # "—" marks a creature without languages
+    if language and language not in ("-", "—"):
+        yield "native", language
+
+
+def build_language_traits(languages: list) -> list:
+    """
+    Returns the GCS traits for a statblock's languages list
+    """
+    traits = []
+    for language in languages or []:
+        if type(language) != str:
+            continue
+        for kind, value in normalize_language(language):
+            if kind == "telepathy":
+                trait = instantiate(jsons.telesendTrait)
+                if value is not None:
+                    trait["notes"] = "Range " + str(value) + " ft."
+                traits.append(trait)
+            else:
+                traits.append(build_language_trait(value, kind))
+    return traits
@@ -0,0 +1,282 @@
+import re
+import time
+
+# Matches the start ("{@") and end ("}") of 5etools tags
+TAG_TOKENS = re.compile(r"\{@|\}")
+# Matches the opening of a tag including its name, used when tags are stripped without parsing
+TAG_OPENING = re.compile(r"\{@\w*\s?")
+
+# The time budget is checked once per this many tags
+BUDGET_CHECK_INTERVAL = 256
+# trim_output only looks at this many characters before a tag
+TRIM_WINDOW = 64
+
+
+class MarkupBudgetExceeded(Exception):
+    pass
+
+
+# region DISPLAY TEXT
+# Position of the display text in the "|" separated arguments of each tag that is shown as plain text
+DISPLAY_INDEX = {
+    "action": 2,
+    "background": 2,
+    "boon": 2,
+    "card": 2,
+    "charoption": 2,
+    "class": 2,
+    "classFeature": 2,
+    "condition": 2,
+    "creature": 2,
+    "cult": 2,
+    "deck": 2,
+    "deity": 2,
+    "disease": 2,
+    "facility": 2,
+    "feat": 2,
+    "hazard": 2,
+    "item": 2,
+    "itemMastery": 2,
+    "itemProperty": 2,
+    "language": 2,
+    "legroup": 2,
+    "object": 2,
+    "optfeature": 2,
+    "psionic": 2,
+    "race": 2,
+    "recipe": 2,
+    "reward": 2,
+    "scaledamage": 2,
+    "scaledice": 2,
+    "sense": 2,
+    "skill": 2,
+    "spell": 2,
+    "status": 2,
+    "subclass": 2,
+    "subclassFeature": 2,
+    "table": 2,
+    "trap": 2,
+    "variantrule": 2,
+    "vehicle": 2,
+    "quickref": 4,
+    "dice": 1,
+    "d20": 1,
+    "chance": 1,
+    "filter": 0,
+    "area": 0,
+    "book": 0,
+    "adventure": 0,
+    "link": 0,
+    "5etools": 0,
+    "footnote": 0,
+    "color": 0,
+    "highlight": 0,
+    "help": 0,
+    "b": 0,
+    "bold": 0,
+    "i": 0,
+    "italic": 0,
+    "u": 0,
+    "underline": 0,
+    "s": 0,
+    "strike": 0,
+    "sup": 0,
+    "sub": 0,
+    "code": 0,
+    "kbd": 0,
+    "style": 0,
+    "font": 0,
+    "note": 0,
+    "tip": 0,
+}
+
+
+def display_text(tag: str, parts: list) -> str:
+    """
+    Returns the text a tag shows, i.e. its display text argument if there is one and its first argument otherwise
+    """
+    index = DISPLAY_INDEX.get(tag, 2)
+    if index < len(parts) and parts[index]:
+        return parts[index]
+    return parts[0]
+
+
+# endregion
+
+
+class TagParser:
+    """
+    Replaces 5etools {@tag args|...} markup in a single left to right scan.
+
+    handlers maps tag names to functions handler(parser, tag, parts) returning the replacement text, where
+    parts are the "|" separated arguments of the tag with any nested tags already replaced. Tags without a
+    handler are replaced with their display text. Handlers can look at the text before the tag with
+    trim_output and after it with consume, for tags whose replacement also swallows surrounding text.
+    Unclosed tags are left in the text as they are. If a time budget (in seconds) is given, parse raises
+    MarkupBudgetExceeded once it is used up.
+    """
+
+    def __init__(self, handlers: dict, time_budget: float = None):
+        self.handlers = handlers
+        self.time_budget = time_budget
+        self.unhandled = []
+
+    def parse(self, text: str) -> str:
+        self.text = text
+        self.pos = 0
+        # One list of output pieces per open tag, the first holds the result
+        self.stack = [[]]
+        if self.time_budget is not None:
+            deadline = time.perf_counter() + self.time_budget
+        for count, token in enumerate(TAG_TOKENS.finditer(text)):
+            if (
+                self.time_budget is not None
+                and count % BUDGET_CHECK_INTERVAL == 0
+                and time.perf_counter() > deadline
+            ):
+                raise MarkupBudgetExceeded(
+                    "Markup took longer than " + str(self.time_budget) + "s"
+                )
+            start = token.start()
+            if start < self.pos:
+                # Already consumed by a handler
+                continue
+            self.stack[-1].append(text[self.pos : start])
+            self.pos = token.end()
+            if token.group() == "{@":
+                self.stack.append([])
+            elif len(self.stack) == 1:
+                # A closing brace outside of any tag
+                self.stack[-1].append("}")
+            else:
+                content = "".join(self.stack.pop())
+                self.stack[-1].append(self.render(content))
+        self.stack[-1].append(text[self.pos :])
+        # Unclosed tags are put back as they were written
+        output = self.stack[0]
+        for pieces in self.stack[1:]:
+            output.append("{@")
+            output.extend(pieces)
+        return "".join(output)
+
+    def render(self, content: str) -> str:
+        tag, _, arguments = content.partition(" ")
+        parts = arguments.split("|")
+        if tag in self.handlers:
+            return self.handlers[tag](self, tag, parts)
+        if tag not in DISPLAY_INDEX:
+            self.unhandled.append(tag)
+        return display_text(tag, parts)
+
+    def trim_output(self, pattern) -> bool:
+        """
+        Removes text matching pattern (which should end with $) from the end of the output before the current tag.
+        Only the last TRIM_WINDOW characters are searched, so long runs of text can't make the search quadratic
+        """
+        output = self.stack[-1]
+        if not output:
+            return False
+        windowStart = max(len(output[-1]) - TRIM_WINDOW, 0)
+        match = pattern.search(output[-1], windowStart)
+        if match is None:
+            return False
+        output[-1] = output[-1][: match.start()]
+        return True
+
+    def peek(self, pattern):
+        """
+        Matches pattern against the text right after the current tag without skipping over it
+        """
+        return pattern.match(self.text, self.pos)
+
+    def consume(self, pattern):
+        """
+        Matches pattern against the text right after the current tag and skips over it if it matches
+        """
+        match = pattern.match(self.text, self.pos)
+        if match is not None:
+            self.pos = match.end()
+        return match
+
+
+def render_tags(text: str, handlers: dict = None, time_budget: float = None) -> str:
+    """
+    Replaces every 5etools tag in text, using handlers for special tags and display text for the rest
+    """
+    return TagParser(handlers or {}, time_budget).parse(text)
+
+
+def strip_tags(text: str) -> str:
+    """
+    Removes tag markup without interpreting it ("{@condition prone}" becomes "prone"). Used as a cheap fallback
+    for descriptions that are too large or too slow to render
+    """
+    return TAG_OPENING.sub("", text).replace("}", "")
+
+
+# region ENTRIES
+# Keys of 5etools entry objects that hold nested entries, in reading order
+CHILD_KEYS = ["headerEntries", "entry", "entries", "items", "footerEntries"]
+
+_END = object()
+
+
+def table_cell_text(cell) -> str:
+    if type(cell) == dict:
+        if "roll" in cell:
+            roll = cell["roll"]
+            if "exact" in roll:
+                return str(roll["exact"])
+            return str(roll.get("min", "")) + "-" + str(roll.get("max", ""))
+        return " ".join(iter_entry_text(cell))
+    return str(cell)
+
+
+def iter_table_text(table: dict):
+    if "caption" in table:
+        yield table["caption"]
+    if "colLabels" in table:
+        yield " | ".join(table["colLabels"])
+    for row in table.get("rows", []):
+        if type(row) == dict:
+            row = row.get("row", [])
+        yield " | ".join(table_cell_text(cell) for cell in row)
+
+
+def iter_entry_text(entries):
+    """
+    Yields every line of text in a 5etools entries structure (strings, lists, entries/inset/list/item objects and
+    tables) in reading order. Nesting is walked with an explicit stack, so arbitrarily deep entries are safe
+    """
+    stack = [iter([entries])]
+    while stack:
+        entry = next(stack[-1], _END)
+        if entry is _END:
+            stack.pop()
+        elif type(entry) == str:
+            yield entry
+        elif type(entry) == list:
+            stack.append(iter(entry))
+        elif type(entry) == dict:
+            if entry.get("type") == "table":
+                yield from iter_table_text(entry)
+                continue
+            if "name" in entry:
+                # List items read as "Name. Text"
+                if type(entry.get("entry")) == str:
+                    yield entry["name"] + " " + entry["entry"]
+                    continue
+                yield entry["name"]
+            stack.append(iter([entry[key] for key in CHILD_KEYS if key in entry]))
+        elif entry is not None:
+            yield str(entry)
+
+
+def flatten_entries(entries) -> str:
+    """
+    Joins all the text of a 5etools entries structure into one description, one line per paragraph
+    """
+    return "\n".join(iter_entry_text(entries))
+
+
+# endregion
@@ -0,0 +1,270 @@
+import hashlib
+import json
+import re
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+
+from pipeline import SHEET_LISTS
+
+# Namespace of the ids given to converted entries, see stable_id
+ID_NAMESPACE = uuid.UUID("b04572c2-13f7-4a94-a387-8390f448083d")
+# Key of the converter's data in a character's "third_party" field, which GCS keeps when it saves the sheet
+THIRD_PARTY_KEY = "dndGurpsConverter"
+# Ids (random for modifiers) and "calc" values (recalculated by GCS whenever it saves) in JSON written with sort_keys.
+# They are left out of content hashes, as changes to them aren't edits
+UNHASHED_FIELDS = re.compile(r'"(?:calc|id)": (?:"[^"]*"|\{[^{}]*\})(?:, )?')
+
+
+# region STABLE IDS
+def stable_id(key: str) -> str:
+    """
+    Returns str(uuid.uuid5(ID_NAMESPACE, key)), formatted directly from the hash since building UUID objects is a
+    noticeable part of a conversion
+    """
+    digest = hashlib.sha1(ID_NAMESPACE.bytes + key.encode()).hexdigest()
+    return (
+        digest[:8]
+        + "-"
+        + digest[8:12]
+        + "-5"
+        + digest[13:16]
+        + "-"
+        + "89ab"[int(digest[16], 16) & 3]
+        + digest[17:20]
+        + "-"
+        + digest[20:32]
+    )
+
+
+def entry_key(entry: dict) -> str:
+    """
+    Returns what identifies an entry among its siblings, e.g. "skill:Survival:Desert"
+    """
+    return (
+        str(entry.get("type", ""))
+        + ":"
+        + str(entry.get("name", entry.get("description", "")))
+        + ":"
+        + str(entry.get("specialization", ""))
+    )
+
+
+def entry_detail(entry: dict) -> str:
+    """
+    Returns what tells apart entries with the same entry_key, e.g. the notes and enabled modifiers of two "Damage
+    Immunity" traits or the damage and usage of two weapons
+    """
+    parts = [str(entry.get("notes", "")), str(entry.get("levels", ""))]
+    for modifier in entry.get("modifiers", []):
+        if not modifier.get("disabled"):
+            parts.append(
+                str(modifier.get("name", ""))
+                + ":"
+                + str(modifier.get("notes", ""))
+                + ":"
+                + str(modifier.get("levels", ""))
+            )
+    for weapon in entry.get("weapons", []):
+        parts.append(
+            json.dumps(weapon.get("damage", {}), sort_keys=True)
+            + ":"
+            + str(weapon.get("usage", ""))
+        )
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()[:12]
+
+
+def stable_list(entries: list, prefix: str) -> list:
+    """
+    Returns copies of entries with ids derived from prefix, and the same for the entries of containers. The entries
+    themselves are left unchanged. Entries whose entry_key is repeated in the list are also keyed on their
+    entry_detail, so adding or reordering one of them doesn't change the ids of the others
+    """
+    repeated = Counter(entry_key(entry) for entry in entries)
+    occurrences = Counter()
+    result = []
+    for entry in entries:
+        key = entry_key(entry)
+        if repeated[key] > 1:
+            key += ":" + entry_detail(entry)
+        occurrences[key] += 1
+        entry = dict(entry)
+        entry["id"] = stable_id(prefix + "/" + key + "#" + str(occurrences[key]))
+        if "children" in entry:
+            entry["children"] = stable_list(entry["children"], entry["id"])
+        result.append(entry)
+    return result
+
+
+def assign_stable_ids(character: dict, name: str, source: str = ""):
+    """
+    Gives a converted character and every entry in it an id that only depends on the monster and the entry, so the
+    same monster gets the same ids in every conversion and merge_character can match them up
+    """
+    prefix = name + "|" + source
+    character["id"] = stable_id(prefix)
+    for key in SHEET_LISTS:
+        if key in character:
+            character[key] = stable_list(character[key], prefix + "/" + key)
+
+
+# endregion
+
+
+# region MERGING
+def content_hash(value) -> str:
+    text = UNHASHED_FIELDS.sub(
+        "", json.dumps(value, sort_keys=True, ensure_ascii=False)
+    )
+    return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+
+def generated_record(character: dict) -> dict:
+    """
+    Returns what the converter set in a character: each profile field ("profile/name") and attribute adjustment
+    ("attributes/st") as it is, and the content_hash of each entry of the sheet lists by id
+    """
+    record = {}
+    for field, value in character.get("profile", {}).items():
+        record["profile/" + field] = value
+    for attribute in character.get("attributes", []):
+        record["attributes/" + attribute["attr_id"]] = attribute.get("adj", 0)
+    for key in SHEET_LISTS:
+        for entry in character.get(key, []):
+            record[entry["id"]] = content_hash(entry)
+    return record
+
+
+def mark_generated(character: dict):
+    """
+    Records what the converter generated in the character, so a later merge can tell which parts were edited
+    """
+    character.setdefault("third_party", {})[THIRD_PARTY_KEY] = {
+        "generated": generated_record(character)
+    }
+
+
+@dataclass(slots=True)
+class MergeStats:
+    updated: int = 0
+    added: int = 0
+    removed: int = 0
+    kept: int = 0
+
+    def changed(self) -> bool:
+        return bool(self.updated or self.added or self.removed)
+
+    def report(self) -> str:
+        return (
+            str(self.updated)
+            + " updated, "
+            + str(self.added)
+            + " added, "
+            + str(self.removed)
+            + " removed, "
+            + str(self.kept)
+            + " edited entries kept"
+        )
+
+
+def merge_character(existing: dict, generated: dict) -> tuple:
+    """
+    Patches a character sheet written by an earlier conversion (and maybe edited since) with a new conversion of the
+    same monster and returns it with MergeStats. Parts the user hasn't touched are replaced by the new conversion,
+    parts that were edited, deleted or added by the user are kept as they are. Everything else in the sheet (notes,
+    settings, points) is left alone
+    """
+    previous = existing.get("third_party", {}).get(THIRD_PARTY_KEY, {}).get("generated")
+    if previous is None:
+        raise ValueError(
+            "The character sheet wasn't written by a version of the converter that supports merging"
+        )
+    current = generated["third_party"][THIRD_PARTY_KEY]["generated"]
+    merged = dict(existing)
+    stats = MergeStats()
+
+    def untouched(key: str, value) -> bool:
+        if key.startswith("profile/") or key.startswith("attributes/"):
+            return key in previous and previous[key] == value
+        return previous.get(key) == content_hash(value)
+
+    profile = dict(existing.get("profile", {}))
+    for field, value in generated.get("profile", {}).items():
+        key = "profile/" + field
+        if field not in profile:
+            if key not in previous:
+                profile[field] = value
+                stats.added += 1
+        elif previous.get(key) != current[key]:
+            if untouched(key, profile[field]):
+                profile[field] = value
+                stats.updated += 1
+            else:
+                stats.kept += 1
+    merged["profile"] = profile
+
+    generatedAttributes = {
+        attribute["attr_id"]: attribute for attribute in generated.get("attributes", [])
+    }
+    attributes = []
+    for attribute in existing.get("attributes", []):
+        key = "attributes/" + attribute["attr_id"]
+        if attribute["attr_id"] in generatedAttributes and previous.get(
+            key
+        ) != current.get(key):
+            if untouched(key, attribute.get("adj", 0)):
+                attribute = dict(attribute)
+                attribute["adj"] = generatedAttributes[attribute["attr_id"]]["adj"]
+                stats.updated += 1
+            else:
+                stats.kept += 1
+        attributes.append(attribute)
+    merged["attributes"] = attributes
+
+    for listKey in SHEET_LISTS:
+        generatedEntries = {entry["id"]: entry for entry in generated.get(listKey, [])}
+        entries = []
+        present = set()
+        for entry in existing.get(listKey, []):
+            entryId = entry.get("id")
+            present.add(entryId)
+            if entryId in generatedEntries:
+                if untouched(entryId, entry):
+                    if previous[entryId] != current[entryId]:
+                        entry = generatedEntries[entryId]
+                        stats.updated += 1
+                elif previous.get(entryId) != current[entryId]:
+                    stats.kept += 1
+            elif entryId in previous and untouched(entryId, entry):
+                # The conversion no longer generates it
+                stats.removed += 1
+                continue
+            entries.append(entry)
+        for entryId, entry in generatedEntries.items():
+            # Entries the user deleted stay deleted
+            if entryId not in present and entryId not in previous:
+                entries.append(entry)
+                stats.added += 1
+        merged[listKey] = entries
+
+    thirdParty = dict(existing.get("third_party", {}))
+    # Entries the user deleted are still recorded, so the next merge doesn't add them back either
+    thirdParty[THIRD_PARTY_KEY] = {"generated": current}
+    merged["third_party"] = thirdParty
+    return merged, stats
+
+
+def merge_with_file(path: str, character: dict) -> tuple:
+    """
+    Merges a new conversion into the character sheet saved at path. Returns the merged sheet, or None if nothing
+    changed and the file can be left as it is, and the MergeStats
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        existing = json.load(f)
+    merged, stats = merge_character(existing, character)
+    if not stats.changed():
+        return None, stats
+    return merged, stats
+
+
+# endregion
@@ -0,0 +1,150 @@
+import os
+import re
+import tempfile
+import threading
+
+# Characters that can't be used in file names
+UNSAFE_FILENAME = re.compile(r'[\\/:*?"<>|\x00-\x1f]+')
+# Longest file name stem, leaving room for collision suffixes and the extension
+MAX_STEM_LENGTH = 120
+
+# When written files are flushed to disk: after each file, once at the end of the run, or left to the OS
+FSYNC_MODES = ["file", "batch", "none"]
+
+# Temporary files are created private, written files get the permissions a plain open() would give them
+_umask = os.umask(0)
+os.umask(_umask)
+FILE_MODE = 0o666 & ~_umask
+
+
+def output_stem(name: str, source: str = "") -> str:
+    """
+    Returns the file name (without extension) for a monster's character sheet, e.g. "Goblin (MM)"
+    """
+    stem = UNSAFE_FILENAME.sub("_", name).strip(" .") or "monster"
+    source = UNSAFE_FILENAME.sub("_", source or "").strip(" .")
+    if source:
+        stem = stem + " (" + source + ")"
+    return stem[:MAX_STEM_LENGTH]
+
+
+def write_atomic(path: str, text: str, fsync: bool = True):
+    """
+    Writes text to path through a temporary file in the same directory that replaces path once it is complete, so
+    readers (and a crash) never see a half-written file
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporaryPath = tempfile.mkstemp(
+        dir=directory, prefix="." + os.path.basename(path) + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as f:
+            f.write(text)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(temporaryPath, FILE_MODE)
+        os.replace(temporaryPath, path)
+    except BaseException:
+        if os.path.exists(temporaryPath):
+            os.remove(temporaryPath)
+        raise
+
+
+def fsync_paths(paths):
+    """
+    Flushes written files, and the directories they are in, to disk
+    """
+    directories = set()
+    for path in paths:
+        descriptor = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+        directories.add(os.path.dirname(os.path.abspath(path)))
+    for directory in directories:
+        try:
+            descriptor = os.open(directory, os.O_RDONLY)
+        except OSError:
+            # Directories can't be opened on some platforms
+            continue
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+
+class OutputWriter:
+    """
+    Writes character sheets to a directory, one file per monster named after its name and source. Monsters that map
+    to the same file name in one run get a " 2", " 3", ... suffix instead of overwriting each other. Safe to use from
+    several threads
+    """
+
+    def __init__(
+        self, directory: str = ".", fsync: str = "batch", extension: str = ".gcs"
+    ):
+        if fsync not in FSYNC_MODES:
+            raise ValueError("fsync must be one of " + ", ".join(FSYNC_MODES))
+        self.directory = directory
+        self.fsync = fsync
+        self.extension = extension
+        self.lock = threading.Lock()
+        # Lower case, as file names on Windows and macOS are case-insensitive
+        self._reserved = set()
+        self.written = []
+        os.makedirs(directory, exist_ok=True)
+
+    def reserve(self, name: str, source: str = "") -> str:
+        """
+        Returns a path for a monster that no other monster in this run has been given
+        """
+        stem = output_stem(name, source)
+        with self.lock:
+            candidate = stem
+            number = 1
+            while candidate.lower() in self._reserved:
+                number += 1
+                candidate = stem + " " + str(number)
+            self._reserved.add(candidate.lower())
+        return os.path.join(self.directory, candidate + self.extension)
+
+    def claim(self, path: str):
+        """
+        Marks a path written by an earlier run as taken, so no other monster is given it
+        """
+        stem = os.path.splitext(os.path.basename(path))[0]
+        with self.lock:
+            self._reserved.add(stem.lower())
+
+    def write_to(self, path: str, text: str):
+        """
+        Atomically writes a character sheet to a reserved path
+        """
+        write_atomic(path, text, self.fsync == "file")
+        with self.lock:
+            self.written.append(path)
+
+    def write(self, name: str, source: str, text: str) -> str:
+        """
+        Atomically writes a monster's character sheet and returns its path
+        """
+        path = self.reserve(name, source)
+        self.write_to(path, text)
+        return path
+
+    def close(self):
+        """
+        Flushes every file written in this run to disk if fsync is "batch"
+        """
+        if self.fsync == "batch":
+            with self.lock:
+                written = list(self.written)
+            fsync_paths(written)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
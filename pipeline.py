@@ -0,0 +1,364 @@
+import hashlib
+import inspect
+import json
+import os
+import re
+import sqlite3
+import sys
+from dataclasses import dataclass, field
+
+# Bump to invalidate every cached stage result, e.g. after changing the format of fragments
+PIPELINE_VERSION = "1"
+
+# The lists of a character sheet that stages add entries to
+SHEET_LISTS = ["traits", "skills", "spells", "equipment"]
+
+# Stage results written to the database between commits, so a crash only loses the last few
+COMMIT_INTERVAL = 500
+
+# The directory of the converter's modules. Only code and tables from it are part of a stage's fingerprint
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Hash of each dependency file, read once per process
+_fileHashes = {}
+# Source of each function and class fingerprinted, as stages share most of their helpers
+_sources = {}
+
+
+def file_hash(path: str) -> str:
+    if path not in _fileHashes:
+        with open(path, "rb") as f:
+            _fileHashes[path] = hashlib.sha256(f.read()).hexdigest()
+    return _fileHashes[path]
+
+
+# region FINGERPRINTS
+def is_local(value) -> bool:
+    """
+    Returns whether a module, class or function is part of the converter rather than of Python or a library
+    """
+    if inspect.ismodule(value):
+        path = getattr(value, "__file__", None)
+    else:
+        path = getattr(sys.modules.get(value.__module__), "__file__", None)
+    return path is not None and os.path.dirname(os.path.abspath(path)) == SOURCE_DIR
+
+
+def code_names(code) -> set:
+    """
+    Returns the global and attribute names used by a code object and the lambdas and comprehensions in it
+    """
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if inspect.iscode(constant):
+            names |= code_names(constant)
+    return names
+
+
+def describe_value(value, parts: list, seen: set) -> str:
+    """
+    Returns text that only changes when the contents of a table change. Functions in the table are added to parts
+    """
+    if inspect.isfunction(value) or inspect.isclass(value):
+        add_code(value, parts, seen)
+        return value.__qualname__
+    if type(value) == dict:
+        items = [
+            describe_value(key, parts, seen) + ": " + describe_value(item, parts, seen)
+            for key, item in value.items()
+        ]
+        return "{" + ", ".join(sorted(items)) + "}"
+    if type(value) in (list, tuple):
+        return (
+            "[" + ", ".join(describe_value(item, parts, seen) for item in value) + "]"
+        )
+    if type(value) in (set, frozenset):
+        return (
+            "{"
+            + ", ".join(sorted(describe_value(item, parts, seen) for item in value))
+            + "}"
+        )
+    if isinstance(value, re.Pattern):
+        return "re.compile(" + repr(value.pattern) + ", " + str(int(value.flags)) + ")"
+    text = repr(value)
+    # Objects without a repr of their own show their address, which changes with every run
+    if " at 0x" in text:
+        return type(value).__name__
+    return text
+
+
+def add_globals(function, parts: list, seen: set):
+    """
+    Adds the converter's functions, classes and tables that a function refers to. Names starting with "_" are caches
+    and other state, so only functions are followed for them
+    """
+    names = code_names(function.__code__)
+    for name in sorted(names):
+        if name not in function.__globals__:
+            continue
+        value = function.__globals__[name]
+        if inspect.ismodule(value):
+            # e.g. jsons.trident, only the attributes used are added
+            if is_local(value):
+                for attribute in sorted(names):
+                    if hasattr(value, attribute):
+                        add_value(
+                            value.__name__,
+                            attribute,
+                            getattr(value, attribute),
+                            parts,
+                            seen,
+                        )
+        else:
+            add_value(function.__module__, name, value, parts, seen)
+
+
+def add_value(module: str, name: str, value, parts: list, seen: set):
+    if inspect.isfunction(value) or inspect.isclass(value):
+        add_code(value, parts, seen)
+    elif (
+        not inspect.ismodule(value)
+        and not name.startswith("_")
+        and (module, name) not in seen
+    ):
+        seen.add((module, name))
+        parts.append((name, describe_value(value, parts, seen)))
+
+
+def add_code(value, parts: list, seen: set):
+    """
+    Adds the source of a function or class of the converter to parts, with everything it refers to
+    """
+    if id(value) in seen or not is_local(value):
+        return
+    seen.add(id(value))
+    if value not in _sources:
+        try:
+            _sources[value] = inspect.getsource(value)
+        except (OSError, TypeError):
+            _sources[value] = ""
+    parts.append((value.__qualname__, _sources[value]))
+    if inspect.isclass(value):
+        for member in vars(value).values():
+            if isinstance(member, (staticmethod, classmethod)):
+                member = member.__func__
+            elif isinstance(member, property):
+                member = member.fget
+            if inspect.isfunction(member):
+                add_globals(member, parts, seen)
+    else:
+        add_globals(value, parts, seen)
+
+
+def code_fingerprint(value) -> str:
+    """
+    Returns a hash of the source of a function or class, of the converter's functions and classes it calls into and
+    of the tables they read (e.g. a stage, convert_to_gurps and ARMOR_KITS), so it changes whenever any of them does
+    """
+    parts = []
+    add_code(value, parts, set())
+    return hashlib.sha256(json.dumps(sorted(parts)).encode()).hexdigest()
+
+
+# endregion
+
+
+class StageError(Exception):
+    """
+    Raised when a stage fails on a statblock. stage is the name of the stage, the original exception is __cause__
+    """
+
+    def __init__(self, stage: str, error: Exception):
+        super().__init__(stage + ": " + type(error).__name__ + ": " + str(error))
+        self.stage = stage
+        self.error = error
+
+
+@dataclass(slots=True)
+class Stage:
+    """
+    One step of a conversion. function(monster, fragment, options) adds its part of the character to an empty
+    fragment (see new_fragment) using only the statblock keys and options it declares, so its result can be cached.
+    dependencies are what its result depends on besides the code it calls into: functions or classes that aren't
+    called from it (e.g. the parser that builds monster) and paths of data files
+    """
+
+    name: str
+    function: object
+    inputs: list = field(default_factory=list)
+    options: list = field(default_factory=list)
+    dependencies: list = field(default_factory=list)
+    _fingerprint: str = None
+
+    def fingerprint(self) -> str:
+        """
+        Returns a hash of the code the stage runs, the tables it reads and its dependencies (see code_fingerprint), so
+        changing any of them invalidates its cached results and changing another stage doesn't
+        """
+        if self._fingerprint is None:
+            hashes = [code_fingerprint(self.function)]
+            for dependency in self.dependencies:
+                if type(dependency) == str:
+                    hashes.append(file_hash(dependency))
+                else:
+                    hashes.append(code_fingerprint(dependency))
+            self._fingerprint = hashlib.sha256("".join(hashes).encode()).hexdigest()
+        return self._fingerprint
+
+    def cache_key(self, input_data: dict, options: dict) -> str:
+        """
+        Returns the hash of everything the stage's result depends on: its code and its declared inputs
+        """
+        dependencies = [
+            PIPELINE_VERSION,
+            self.name,
+            self.fingerprint(),
+            [input_data.get(key) for key in self.inputs],
+            [options.get(option) for option in self.options],
+        ]
+        return hashlib.sha256(
+            json.dumps(dependencies, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+
+# region FRAGMENTS
+def new_fragment() -> dict:
+    """
+    Returns an empty character fragment: profile fields, attribute changes by attr_id and the entries of each sheet list
+    """
+    fragment = {"profile": {}, "attributes": {}}
+    for key in SHEET_LISTS:
+        fragment[key] = []
+    return fragment
+
+
+def fragment_attribute(fragment: dict, attrId: str) -> dict:
+    """
+    Returns the change a fragment makes to an attribute. "adj" is added to the attribute, "calc" values replace its own
+    """
+    if attrId not in fragment["attributes"]:
+        fragment["attributes"][attrId] = {"adj": 0, "calc": {}}
+    return fragment["attributes"][attrId]
+
+
+def merge_fragment(sheet: dict, attrIndex: dict, fragment: dict):
+    """
+    Applies a stage's fragment to a character sheet
+    """
+    sheet["profile"].update(fragment["profile"])
+    for attrId, change in fragment["attributes"].items():
+        attribute = sheet["attributes"][attrIndex[attrId]]
+        attribute["adj"] = attribute["adj"] + change["adj"]
+        attribute["calc"].update(change["calc"])
+    for key in SHEET_LISTS:
+        if fragment[key]:
+            sheet.setdefault(key, []).extend(fragment[key])
+
+
+# endregion
+
+
+class StageCache:
+    """
+    Stage results keyed by Stage.cache_key. Results are kept in memory and, if a path is given, in a SQLite database so
+    that they survive between runs. Every lookup returns a new copy, so callers can change it. With a limit, the
+    in-memory results are dropped whenever that many are held
+    """
+
+    def __init__(self, path: str = None, limit: int = None):
+        self.results = {}
+        self.limit = limit
+        self.hits = 0
+        self.misses = 0
+        # Results written since the last commit
+        self.uncommitted = 0
+        self.connection = None
+        if path is not None:
+            self.connection = sqlite3.connect(path)
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS stages (key TEXT PRIMARY KEY, stage TEXT NOT NULL, fragment TEXT NOT NULL)"
+            )
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.commit()
+            self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get(self, key: str):
+        """
+        Returns a new copy of the cached fragment for key, or None
+        """
+        if key not in self.results and self.connection is not None:
+            row = self.connection.execute(
+                "SELECT fragment FROM stages WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                # Kept in memory, so the database is only asked once per key
+                self.remember(key, row[0])
+        if key in self.results:
+            return json.loads(self.results[key])
+        return None
+
+    def remember(self, key: str, text: str):
+        if self.limit is not None and len(self.results) >= self.limit:
+            self.results.clear()
+        self.results[key] = text
+
+    def put(self, key: str, stage: str, fragment: dict):
+        # Fragments are kept as JSON, decoding a copy is much cheaper than deepcopy
+        text = json.dumps(fragment)
+        self.remember(key, text)
+        if self.connection is not None:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO stages VALUES (?, ?, ?)", (key, stage, text)
+            )
+            self.uncommitted += 1
+            if self.uncommitted >= COMMIT_INTERVAL:
+                self.connection.commit()
+                self.uncommitted = 0
+
+    def run(self, stage: Stage, monster, input_data: dict, options: dict) -> dict:
+        """
+        Returns the stage's fragment for a statblock, from the cache if its inputs were seen before
+        """
+        key = stage.cache_key(input_data, options)
+        fragment = self.get(key)
+        if fragment is None:
+            self.misses += 1
+            fragment = new_fragment()
+            stage.function(monster, fragment, options)
+            self.put(key, stage.name, fragment)
+        else:
+            self.hits += 1
+        return fragment
+
+
+def run_stages(
+    stages: list,
+    sheet: dict,
+    attrIndex: dict,
+    monster,
+    input_data: dict,
+    options: dict,
+    cache: StageCache = None,
+):
+    """
+    Runs every stage in order and merges their fragments into sheet. With a cache, stages whose inputs haven't changed
+    reuse their earlier result. A failing stage raises StageError
+    """
+    for stage in stages:
+        try:
+            if cache is None:
+                fragment = new_fragment()
+                stage.function(monster, fragment, options)
+            else:
+                fragment = cache.run(stage, monster, input_data, options)
+            merge_fragment(sheet, attrIndex, fragment)
+        except Exception as error:
+            raise StageError(stage.name, error) from error
@@ -0,0 +1,84 @@
+import re
+
+import jsons
+from defenses import instantiate
+from markup import render_tags
+
+# region SENSE TABLE
+# GURPS trait for each 5e sense and the range its description is written for
+SENSES = {
+    "darkvision": (jsons.darkVisionTrait, None),
+    "blindsight": (jsons.blindsightTrait, 60),
+    "tremorsense": (jsons.tremorsenseTrait, 60),
+    "truesight": (jsons.truesightTrait, 120),
+    "devilssight": (jsons.devilsSightTrait, 120),
+}
+
+# One sense of a senses entry: its kind, then optionally its range and a parenthesized qualifier, e.g.
+# "blindsight 30 ft. (blind beyond this radius)". An entry can list several senses
+SENSE_GRAMMAR = re.compile(
+    r"(?P<kind>dark ?vision|blind ?sight|tremor ?sense|true ?sight|devil'?s ?sight)"
+    r"(?:\s+(?P<range>\d{1,6})\s*(?:ft\.?|feet))?"
+    r"(?:\s*\((?P<qualifiers>[^()]{0,200})\))?",
+    re.IGNORECASE,
+)
+
+# Parsed senses entries, most statblocks share the same few strings ("darkvision 60 ft.")
+SENSE_CACHE_SIZE = 4096
+_senseCache = {}
+# endregion
+
+
+def sense_kind(kind: str) -> str:
+    return kind.lower().replace(" ", "").replace("'", "")
+
+
+def parse_senses(sense: str) -> tuple:
+    """
+    Parses a 5etools senses entry into a tuple of (kind, range in feet or None, qualifiers or None), one per sense it lists
+    """
+    if sense not in _senseCache:
+        if len(_senseCache) >= SENSE_CACHE_SIZE:
+            _senseCache.clear()
+        _senseCache[sense] = tuple(
+            (
+                sense_kind(match.group("kind")),
+                int(match.group("range")) if match.group("range") else None,
+                match.group("qualifiers"),
+            )
+            for match in SENSE_GRAMMAR.finditer(render_tags(sense))
+        )
+    return _senseCache[sense]
+
+
+def build_sense_trait(kind: str, senseRange: int, qualifiers: str) -> dict:
+    """
+    Instantiates the GURPS trait for a parsed sense, with its range in the description and notes
+    """
+    template, defaultRange = SENSES[kind]
+    trait = instantiate(template)
+    if senseRange is not None and defaultRange is not None and "userdesc" in trait:
+        trait["userdesc"] = trait["userdesc"].replace(
+            str(defaultRange) + " ft.", str(senseRange) + " ft."
+        )
+    notes = []
+    if senseRange is not None:
+        notes.append(str(senseRange) + " ft.")
+    if qualifiers:
+        notes.append(qualifiers[0].upper() + qualifiers[1:])
+    if notes:
+        trait["notes"] = "; ".join(notes)
+    return trait
+
+
+def build_sense_traits(senses: list) -> list:
+    """
+    Returns the GCS traits for every sense in a statblock's senses list
+    """
+    traits = []
+    for sense in senses or []:
+        if type(sense) != str:
+            continue
+        for kind, senseRange, qualifiers in parse_senses(sense):
+            traits.append(build_sense_trait(kind, senseRange, qualifiers))
+    return traits
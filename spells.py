@@ -0,0 +1,129 @@
+import copy
+import json
+import os
+import re
+import uuid
+
+from markup import render_tags
+
+# Next to this file, so the converter can be run from any directory
+SPELL_CATALOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "spells.json")
+
+# Matches the spell name in "{@spell fireball|phb} (self only)"
+SPELL_TAG = re.compile(r"\{@spell ([^}|]{1,100})")
+
+# Labels of the spell frequency groups, "e" marks spells that can each be cast that often
+FREQUENCY_LABELS = {"daily": "/day", "rest": "/rest", "weekly": "/week"}
+
+LEVEL_LABELS = {
+    "0": "Cantrips",
+    "1": "1st level",
+    "2": "2nd level",
+    "3": "3rd level",
+}
+
+_spellIndexes = {}
+_spellTemplates = {}
+
+
+def load_spell_index(path: str = SPELL_CATALOG) -> dict:
+    """
+    Returns the 5e spell name -> GURPS spell index for the catalog at path. The catalog is only read and indexed the first time it is requested
+    """
+    if path not in _spellIndexes:
+        with open(path, "r") as f:
+            catalog = json.load(f)
+        index = {}
+        for name, gurpsName in catalog["index"].items():
+            gurpsSpell = dict(catalog["spells"][gurpsName])
+            gurpsSpell["name"] = gurpsName
+            index[name] = gurpsSpell
+        _spellIndexes[path] = index
+    return _spellIndexes[path]
+
+
+def spell_name(spell: str) -> str:
+    """
+    Returns the lower case 5e spell name of a spell list entry
+    """
+    match = SPELL_TAG.search(spell)
+    if match is not None:
+        return match.group(1).strip().lower()
+    return render_tags(spell).strip().lower()
+
+
+def lookup_spell(spell: str, path: str = SPELL_CATALOG):
+    """
+    Returns the GURPS spell a 5e spell list entry maps to, or None
+    """
+    return load_spell_index(path).get(spell_name(spell))
+
+
+def spell_template(gurpsSpell: dict) -> dict:
+    """
+    Returns the GCS spell entry for a catalog spell, without id or points. Each template is only built once
+    """
+    name = gurpsSpell["name"]
+    if name not in _spellTemplates:
+        template = {
+            "type": "spell",
+            "name": name,
+            "reference": gurpsSpell.get("reference", ""),
+            "tags": ["Magical"],
+            "difficulty": gurpsSpell["difficulty"],
+            "college": gurpsSpell["college"],
+            "power_source": "Arcane",
+            "spell_class": gurpsSpell["spell_class"],
+            "resist": gurpsSpell.get("resist", ""),
+            "casting_cost": gurpsSpell["casting_cost"],
+            "maintenance_cost": gurpsSpell.get("maintenance_cost", ""),
+            "casting_time": gurpsSpell["casting_time"],
+            "duration": gurpsSpell["duration"],
+        }
+        # Leave out fields the catalog doesn't fill in
+        _spellTemplates[name] = {
+            key: value for key, value in template.items() if value != ""
+        }
+    return _spellTemplates[name]
+
+
+def build_spell(gurpsSpell: dict, points: int) -> dict:
+    """
+    Instantiates the GCS spell entry for a catalog spell with a new id
+    """
+    spell = {"id": str(uuid.uuid4())}
+    spell.update(copy.deepcopy(spell_template(gurpsSpell)))
+    spell["points"] = points
+    return spell
+
+
+def level_label(level: str) -> str:
+    if level in LEVEL_LABELS:
+        return LEVEL_LABELS[level]
+    return level + "th level"
+
+
+def spell_entries(spells: list) -> list:
+    # Spells can also be objects like {"entry": "{@spell fly}", "hidden": true}
+    return [spell["entry"] if type(spell) == dict else spell for spell in spells]
+
+
+def iter_spell_groups(spellcasting: dict):
+    """
+    Yields (label, spells) for every group of spells in a spellcasting entry: at will, daily, per rest, weekly and each spell level
+    """
+    if "will" in spellcasting:
+        yield "At will", spell_entries(spellcasting["will"])
+    for frequency, suffix in FREQUENCY_LABELS.items():
+        for uses, spells in spellcasting.get(frequency, {}).items():
+            if uses.endswith("e"):
+                yield uses[:-1] + suffix + " each", spell_entries(spells)
+            else:
+                yield uses + suffix, spell_entries(spells)
+    for level, group in spellcasting.get("spells", {}).items():
+        label = level_label(level)
+        if group.get("slots") == 1:
+            label = label + " (1 slot)"
+        elif "slots" in group:
+            label = label + " (" + str(group["slots"]) + " slots)"
+        yield label, spell_entries(group.get("spells", []))
@@ -0,0 +1,189 @@
+import math
+import re
+from dataclasses import dataclass, field
+
+from crtable import lookup_cr
+from spells import iter_spell_groups
+
+# The bonus in a 5etools skill entry, e.g. "+5" or "+5 plus PB"
+SKILL_BONUS = re.compile(r"[+-]?\s?\d+")
+
+
+def ability_modifier(score: int) -> int:
+    """
+    Returns the 5e modifier of an ability score
+    """
+    return math.floor((score - 10) / 2)
+
+
+# region STATBLOCK RECORDS
+@dataclass(slots=True)
+class Abilities:
+    strength: int = 10
+    dexterity: int = 10
+    constitution: int = 10
+    intelligence: int = 10
+    wisdom: int = 10
+    charisma: int = 10
+
+
+@dataclass(slots=True)
+class AcEntry:
+    ac: int
+    # Where the AC comes from, e.g. ["{@item leather armor|phb}", "shield"]
+    sources: tuple = ()
+    condition: str = None
+
+
+@dataclass(slots=True)
+class Action:
+    """
+    A trait, action, legendary action, bonus action or reaction
+    """
+
+    name: str
+    entries: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Spellcasting:
+    name: str
+    headerEntries: list = field(default_factory=list)
+    footerEntries: list = field(default_factory=list)
+    # (label, spells) for every spell list, see spells.iter_spell_groups
+    groups: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Statblock:
+    """
+    A 5etools statblock normalized for conversion. Every key the converter reads is looked up and parsed once here
+    """
+
+    name: str
+    source: str = ""
+    cr: object = None
+    profBonus: int = 2
+    # First letter of the 5e size (T, S, M, L, H or G), or None
+    size: str = None
+    abilities: Abilities = field(default_factory=Abilities)
+    # Lower case 5e skill name -> bonus
+    skills: dict = field(default_factory=dict)
+    ac: list = field(default_factory=list)
+    traits: list = field(default_factory=list)
+    actions: list = field(default_factory=list)
+    legendary: list = field(default_factory=list)
+    bonus: list = field(default_factory=list)
+    reactions: list = field(default_factory=list)
+    spellcasting: list = field(default_factory=list)
+    # 5etools defense lists, see defenses.build_defense_traits
+    resist: list = field(default_factory=list)
+    immune: list = field(default_factory=list)
+    vulnerable: list = field(default_factory=list)
+    conditionImmune: list = field(default_factory=list)
+    senses: list = field(default_factory=list)
+    languages: list = field(default_factory=list)
+
+    def defenses(self) -> dict:
+        """
+        Returns the defense lists keyed like the 5etools statblock, for defenses.build_defense_traits
+        """
+        return {
+            "resist": self.resist,
+            "immune": self.immune,
+            "vulnerable": self.vulnerable,
+            "conditionImmune": self.conditionImmune,
+        }
+
+
+# endregion
+
+
+# region PARSING
+def parse_skills(skills: dict) -> dict:
+    parsed = {}
+    for skill, bonus in (skills or {}).items():
+        if type(bonus) == int:
+            parsed[skill] = bonus
+            continue
+        # Skill bonuses are strings, other keys ("other") hold objects
+        match = SKILL_BONUS.match(bonus) if type(bonus) == str else None
+        if match is not None:
+            parsed[skill] = int(match.group().replace(" ", "").replace("+", ""))
+    return parsed
+
+
+def parse_ac(ac: list) -> list:
+    entries = []
+    for item in ac or []:
+        # Plain numbers only give the AC
+        if type(item) == dict:
+            entries.append(
+                AcEntry(
+                    item.get("ac", 10),
+                    tuple(item.get("from", ())),
+                    item.get("condition"),
+                )
+            )
+        elif type(item) == int:
+            entries.append(AcEntry(item))
+    return entries
+
+
+def parse_actions(actions: list) -> list:
+    return [
+        Action(action.get("name", ""), action.get("entries", []))
+        for action in actions or []
+        if type(action) == dict
+    ]
+
+
+def parse_spellcasting(spellcasting: dict) -> Spellcasting:
+    return Spellcasting(
+        spellcasting.get("name", "Spellcasting"),
+        spellcasting.get("headerEntries", []),
+        spellcasting.get("footerEntries", []),
+        list(iter_spell_groups(spellcasting)),
+    )
+
+
+def parse_statblock(input_data: dict) -> Statblock:
+    """
+    Normalizes a 5etools statblock (with any _copy already expanded) into a Statblock
+    """
+    size = input_data.get("size")
+    return Statblock(
+        name=input_data["name"],
+        source=input_data.get("source", ""),
+        cr=input_data.get("cr"),
+        profBonus=lookup_cr(input_data.get("cr"))["prof_bonus"],
+        size=size[0] if size else None,
+        abilities=Abilities(
+            input_data.get("str", 10),
+            input_data.get("dex", 10),
+            input_data.get("con", 10),
+            input_data.get("int", 10),
+            input_data.get("wis", 10),
+            input_data.get("cha", 10),
+        ),
+        skills=parse_skills(input_data.get("skill")),
+        ac=parse_ac(input_data.get("ac")),
+        traits=parse_actions(input_data.get("trait")),
+        actions=parse_actions(input_data.get("action")),
+        legendary=parse_actions(input_data.get("legendary")),
+        bonus=parse_actions(input_data.get("bonus")),
+        reactions=parse_actions(input_data.get("reaction")),
+        spellcasting=[
+            parse_spellcasting(spellcasting)
+            for spellcasting in input_data.get("spellcasting") or []
+        ],
+        resist=input_data.get("resist") or [],
+        immune=input_data.get("immune") or [],
+        vulnerable=input_data.get("vulnerable") or [],
+        conditionImmune=input_data.get("conditionImmune") or [],
+        senses=input_data.get("senses") or [],
+        languages=input_data.get("languages") or [],
+    )
+
+
+# endregion
@@ -0,0 +1,147 @@
+import json
+import sqlite3
+
+from bestiary import load_bestiaries, monster_type
+from copies import CopyResolver, resolve_copies
+from crtable import lookup_cr
+from fuzzy import TrigramIndex
+
+DEFAULT_DATABASE = "bestiary.db"
+
+
+class BestiaryStore:
+    """
+    Local SQLite database of 5etools statblocks keyed by name and source, with indexes on CR and type
+    """
+
+    def __init__(self, path: str = DEFAULT_DATABASE):
+        self.connection = sqlite3.connect(path)
+        self._nameIndex = None
+        self._resolver = None
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS monsters (
+                name TEXT NOT NULL,
+                source TEXT NOT NULL,
+                name_key TEXT NOT NULL,
+                source_key TEXT NOT NULL,
+                cr REAL,
+                type TEXT,
+                size TEXT,
+                data TEXT NOT NULL,
+                PRIMARY KEY (name_key, source_key)
+            );
+            CREATE INDEX IF NOT EXISTS monsters_cr ON monsters (cr);
+            CREATE INDEX IF NOT EXISTS monsters_type ON monsters (type);
+            """)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def import_monsters(self, monsters) -> int:
+        """
+        Adds statblocks to the store, replacing any with the same name and source. Returns the number imported.
+        Statblocks are stored as given, while the CR, type and size columns come from their expanded _copy
+        """
+        monsters = [monster for monster in monsters if "name" in monster]
+        rows = []
+        for monster, resolved in zip(monsters, resolve_copies(monsters, self.get)):
+            name = monster["name"]
+            source = monster.get("source", "")
+            rows.append(
+                (
+                    name,
+                    source,
+                    name.lower(),
+                    source.lower(),
+                    lookup_cr(resolved.get("cr"))["value"],
+                    monster_type(resolved),
+                    "".join(resolved.get("size", [])),
+                    json.dumps(monster),
+                )
+            )
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO monsters VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+        self._nameIndex = None
+        self._resolver = None
+        return len(rows)
+
+    def import_files(self, paths) -> int:
+        """
+        Imports every statblock from a list of bestiary files and directories
+        """
+        return self.import_monsters(load_bestiaries(paths))
+
+    def get(self, name: str, source: str = None):
+        """
+        Returns the statblock with the given name (and source, if given), or None. Names and sources are case-insensitive
+        """
+        if source is None:
+            row = self.connection.execute(
+                "SELECT data FROM monsters WHERE name_key = ? ORDER BY rowid LIMIT 1",
+                (name.lower(),),
+            ).fetchone()
+        else:
+            row = self.connection.execute(
+                "SELECT data FROM monsters WHERE name_key = ? AND source_key = ?",
+                (name.lower(), source.lower()),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def resolver(self) -> CopyResolver:
+        """
+        Returns the _copy resolver for this store. It memoizes every statblock it expands until new monsters are imported
+        """
+        if self._resolver is None:
+            self._resolver = CopyResolver(self.get)
+        return self._resolver
+
+    def get_resolved(self, name: str, source: str = None):
+        """
+        Returns the statblock like get, with its _copy chain expanded
+        """
+        monster = self.get(name, source)
+        if monster is None:
+            return None
+        return self.resolver().resolve(monster)
+
+    def name_index(self) -> TrigramIndex:
+        """
+        Returns the trigram index over every name in the store, building it on first use
+        """
+        if self._nameIndex is None:
+            self._nameIndex = TrigramIndex(self.names())
+        return self._nameIndex
+
+    def search(self, name: str, source: str = None, limit: int = 5) -> list:
+        """
+        Returns up to limit (score, name, source) candidates for a possibly misspelled name, best first
+        """
+        if source is None:
+            return self.name_index().search(name, limit=limit)
+        candidates = self.name_index().search(name, limit=None)
+        return [
+            candidate
+            for candidate in candidates
+            if candidate[2].lower() == source.lower()
+        ][:limit]
+
+    def names(self) -> list:
+        """
+        Returns the (name, source) of every statblock in the store
+        """
+        return self.connection.execute(
+            "SELECT name, source FROM monsters ORDER BY rowid"
+        ).fetchall()
+
+    def count(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM monsters").fetchone()[0]
@@ -0,0 +1,74 @@
+"""
+Times description conversion on adversarial (malformed homebrew style) inputs.
+Run with: python stress_markup.py
+"""
+
+import re
+import time
+
+from converter import DESCRIPTION_TIME_BUDGET, convert_to_gurps
+from markup import render_tags
+
+# The lazy, unanchored patterns convert_to_gurps used before the tag parser, for comparison
+OLD_PATTERNS = [
+    r"\{@condition (.+?)\}",
+    r"\{@spell (.+?)\}",
+    r"\d+\s\({@damage (.+?)\}\)",
+    r"\{@hit (.+?)\}",
+    r"\{@dc (\d+)\} (\w{2}) roll",
+]
+
+
+# Tags from 5etools data and the text they should show
+DISPLAY_SAMPLES = [
+    ("{@area the kitchen|017|x}", "the kitchen"),
+    ("{@area Ground Floor|0a1}", "Ground Floor"),
+    ("{@spell fireball}", "fireball"),
+    ("{@item longsword|phb|longswords}", "longswords"),
+    ("{@creature goblin|mm|goblins}", "goblins"),
+]
+
+
+def check_display_text():
+    for tag, expected in DISPLAY_SAMPLES:
+        rendered = render_tags(tag)
+        assert rendered == expected, tag + " rendered as " + repr(rendered)
+
+
+def adversarial_inputs(size: int) -> dict:
+    return {
+        "unclosed conditions": "{@condition " * (size // 12),
+        "unclosed spells": "{@spell fireball " * (size // 17),
+        "unclosed damage": "1 ({@damage 1d6 " * (size // 16),
+        "deep nesting": "{@b " * (size // 4) + "x" + "}" * (size // 4),
+        "unclosed nesting": "{@b " * (size // 4),
+        "digits before damage": "1" * size + " ({@damage 2d6})",
+        "spaces in damage": "{@damage 1d6" + " " * size + "}",
+        "stray braces": "}" * size,
+        "well formed": "{@atk mw} {@hit 5} to hit. {@h}7 ({@damage 1d8 + 3}) damage. "
+        * (size // 60),
+    }
+
+
+def time_call(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def run_old_patterns(text: str):
+    for pattern in OLD_PATTERNS:
+        re.sub(pattern, "", text)
+
+
+if __name__ == "__main__":
+    check_display_text()
+    print("Time budget per description: " + str(DESCRIPTION_TIME_BUDGET) + "s")
+    for size in [1000, 10000, 40000]:
+        print("\nInput size " + str(size))
+        for name, text in adversarial_inputs(size).items():
+            new = time_call(convert_to_gurps, text)
+            old = time_call(run_old_patterns, text)
+            print(
+                "  {:<22} parser {:8.4f}s   old regexes {:8.4f}s".format(name, new, old)
+            )
@@ -0,0 +1,106 @@
+from collections import Counter
+
+# Monsters kept as examples of each unmapped construct
+EXAMPLES_PER_VALUE = 3
+
+# The recorder stages report to while a corpus is analyzed, None otherwise
+_recorder = None
+
+
+def record_unmapped(kind: str, value: str):
+    """
+    Notes that the statblock being converted has something the converter has no GURPS mapping for, e.g.
+    record_unmapped("action", "Tentacles"). Does nothing unless a CoverageRecorder is recording
+    """
+    if _recorder is not None:
+        _recorder.add(kind, value)
+
+
+class CoverageRecorder:
+    """
+    Counts, for each kind of construct (action, armor, skill, tag), how many monsters of a corpus have each value the
+    converter doesn't map, with a few of them as examples
+    """
+
+    def __init__(self):
+        self.counters = {}
+        self.examples = {}
+        self.monsters = 0
+        self.failed = 0
+        self.monster = None
+        self._seen = set()
+
+    def start(self, name: str, source: str = ""):
+        """
+        Starts recording the constructs of a monster. Each value is counted once per monster
+        """
+        self.monsters += 1
+        self.monster = name + (" (" + source + ")" if source else "")
+        self._seen = set()
+
+    def add(self, kind: str, value: str):
+        if (kind, value) in self._seen:
+            return
+        self._seen.add((kind, value))
+        if kind not in self.counters:
+            self.counters[kind] = Counter()
+            self.examples[kind] = {}
+        self.counters[kind][value] += 1
+        examples = self.examples[kind].setdefault(value, [])
+        if len(examples) < EXAMPLES_PER_VALUE:
+            examples.append(self.monster)
+
+    def __enter__(self):
+        global _recorder
+        _recorder = self
+        return self
+
+    def __exit__(self, *exc_info):
+        global _recorder
+        _recorder = None
+
+    def to_dict(self, limit: int = None) -> dict:
+        """
+        Returns the counts of each kind, most common first: {"action": [{"value": ..., "monsters": 12, "examples": [...]}]}
+        """
+        result = {"monsters": self.monsters, "failed": self.failed}
+        for kind in sorted(self.counters):
+            result[kind] = [
+                {
+                    "value": value,
+                    "monsters": count,
+                    "examples": self.examples[kind][value],
+                }
+                for value, count in self.counters[kind].most_common(limit)
+            ]
+        return result
+
+    def summary(self, limit: int = 10) -> str:
+        lines = [
+            "Analyzed "
+            + str(self.monsters)
+            + " monsters, "
+            + str(self.failed)
+            + " failed to convert"
+        ]
+        for kind in sorted(self.counters):
+            counter = self.counters[kind]
+            lines.append(
+                kind
+                + ": "
+                + str(len(counter))
+                + " unmapped, "
+                + str(sum(counter.values()))
+                + " uses"
+            )
+            for value, count in counter.most_common(limit):
+                lines.append(
+                    "  "
+                    + str(count)
+                    + "  "
+                    + value
+                    + "  (e.g. "
+                    + ", ".join(self.examples[kind][value])
+                    + ")"
+                )
+        return "\n".join(lines)
@@ -0,0 +1,250 @@
+import argparse
+import os
+import time
+from collections import Counter
+
+from bestiary import find_bestiary_files, load_bestiary_file
+from converter import convert, load_template, serialize
+from copies import resolve_copies
+from journal import input_hash
+from merge import merge_with_file
+from outputs import OutputWriter
+from pipeline import StageCache
+from spells import load_spell_index
+from store import DEFAULT_DATABASE, BestiaryStore
+
+DEFAULT_INPUT = "input.json"
+# Seconds between checks for changed files
+POLL_INTERVAL = 0.5
+# A changed file is converted once it has stayed the same for this many seconds, so a save that writes the file in
+# several steps is only converted once
+DEBOUNCE = 0.3
+# Stage results kept in memory during a session
+CACHE_SIZE = 20000
+
+
+def report_failure(monster: dict, error: BaseException):
+    print(
+        "Failed to convert "
+        + monster.get("name", "?")
+        + ": "
+        + type(error).__name__
+        + ": "
+        + str(error)
+    )
+
+
+def file_signature(path: str):
+    """
+    Returns what tells whether a file has changed (its modification time and size), or None if it doesn't exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class Watcher:
+    """
+    Polls statblock files (or directories of them) and reconverts each file that changes. The template, spell catalog
+    and stage cache stay loaded between conversions, and monsters whose statblock didn't change are not written again
+    """
+
+    def __init__(
+        self,
+        paths,
+        outputDir: str = ".",
+        options: dict = None,
+        databasePath: str = DEFAULT_DATABASE,
+        cache: StageCache = None,
+        merge: bool = False,
+    ):
+        self.paths = paths
+        self.merge = merge
+        self.outputDir = outputDir
+        self.options = options or {}
+        self.databasePath = databasePath
+        self.cache = cache if cache is not None else StageCache(limit=CACHE_SIZE)
+        # Signature of each file when it was last converted
+        self.seen = {}
+        # Changed files waiting for the debounce: path -> (signature, time it was first seen)
+        self.pending = {}
+        # Output path of each statblock already converted, by input_hash, for every file
+        self.outputs = {}
+        # One writer for the whole session, so monsters with the same name in different files get different paths
+        self.writer = OutputWriter(outputDir, fsync="file")
+        # Path given to each monster, by (file, name, source, occurrence in the file), so a monster keeps writing to
+        # the same .gcs file while the session lasts
+        self.outputPaths = {}
+        load_template()
+        load_spell_index()
+
+    def poll(self, now: float = None) -> list:
+        """
+        Returns the files that changed since they were last converted and have stayed the same for DEBOUNCE seconds,
+        with their signature. Set self.seen[path] to it once the file has been converted
+        """
+        now = time.monotonic() if now is None else now
+        ready = []
+        present = set()
+        for path in find_bestiary_files(self.paths):
+            signature = file_signature(path)
+            if signature is None:
+                continue
+            present.add(path)
+            if signature == self.seen.get(path):
+                self.pending.pop(path, None)
+                continue
+            if path in self.pending and self.pending[path][0] == signature:
+                if now - self.pending[path][1] >= DEBOUNCE:
+                    del self.pending[path]
+                    ready.append((path, signature))
+            else:
+                self.pending[path] = (signature, now)
+        for path in list(self.seen):
+            if path not in present:
+                del self.seen[path]
+                self.outputs.pop(path, None)
+        return ready
+
+    def read_file(self, path: str) -> list:
+        monsters = [
+            monster for monster in load_bestiary_file(path) if "name" in monster
+        ]
+        if os.path.exists(self.databasePath):
+            with BestiaryStore(self.databasePath) as store:
+                return resolve_copies(monsters, store.get, report_failure)
+        return resolve_copies(monsters, onError=report_failure)
+
+    def output_path(self, path: str, monster: dict, occurrences: Counter) -> str:
+        """
+        Returns the path a monster of a file is written to, reserving one the first time the monster is converted
+        """
+        name, source = monster["name"], monster.get("source", "")
+        occurrences[(name, source)] += 1
+        key = (path, name, source, occurrences[(name, source)])
+        if key not in self.outputPaths:
+            self.outputPaths[key] = self.writer.reserve(name, source)
+        return self.outputPaths[key]
+
+    def convert_file(self, path: str) -> int:
+        """
+        Converts the statblocks of a file that changed and returns how many were written. A statblock that fails to
+        convert is reported and skipped, and converted again the next time the file changes
+        """
+        previous = self.outputs.get(path, {})
+        outputs = {}
+        occurrences = Counter()
+        written = 0
+        for monster in self.read_file(path):
+            inputHash = input_hash(monster, self.options)
+            outputPath = self.output_path(path, monster, occurrences)
+            if previous.get(inputHash) == outputPath and os.path.exists(outputPath):
+                outputs[inputHash] = outputPath
+                continue
+            try:
+                character = convert(monster, self.options, self.cache)
+                if self.merge and os.path.exists(outputPath):
+                    character, stats = merge_with_file(outputPath, character)
+                    if character is None:
+                        outputs[inputHash] = outputPath
+                        continue
+                    print("Merged into " + outputPath + ": " + stats.report())
+                self.writer.write_to(outputPath, serialize(character))
+            except Exception as error:
+                report_failure(monster, error)
+                continue
+            outputs[inputHash] = outputPath
+            print("Wrote " + outputPath)
+            written += 1
+        self.outputs[path] = outputs
+        return written
+
+    def run(self, interval: float = POLL_INTERVAL):
+        """
+        Converts every file once, then each file that changes, until interrupted
+        """
+        print("Watching " + ", ".join(self.paths) + " (Ctrl+C to stop)")
+        try:
+            while True:
+                for path, signature in self.poll():
+                    start = time.perf_counter()
+                    try:
+                        written = self.convert_file(path)
+                    except Exception as error:
+                        # Usually a file saved halfway, it is read again on the next save
+                        print(
+                            "Failed to read "
+                            + path
+                            + ": "
+                            + type(error).__name__
+                            + ": "
+                            + str(error)
+                        )
+                        self.seen[path] = signature
+                        continue
+                    self.seen[path] = signature
+                    print(
+                        "Converted "
+                        + path
+                        + ": "
+                        + str(written)
+                        + " changed in "
+                        + str(round((time.perf_counter() - start) * 1000))
+                        + "ms"
+                    )
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Converts statblock files to .gcs files again whenever they change"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=[DEFAULT_INPUT],
+        help="Statblock files or directories of them (default: input.json)",
+    )
+    parser.add_argument(
+        "--output", default=".", help="Directory to write the .gcs files to"
+    )
+    parser.add_argument(
+        "--db", default=DEFAULT_DATABASE, help="Database to look up _copy bases in"
+    )
+    parser.add_argument(
+        "--combat-reflexes",
+        action="store_true",
+        help="The monsters are battle-hardened and get Combat Reflexes",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=POLL_INTERVAL,
+        help="Seconds between checks for changes",
+    )
+    parser.add_argument(
+        "--stage-cache", help="Keep stage results in this database between runs"
+    )
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="Update existing .gcs files instead of replacing them, keeping the changes made to them by hand",
+    )
+    args = parser.parse_args(argv)
+    with StageCache(args.stage_cache, CACHE_SIZE) as cache:
+        Watcher(
+            args.paths,
+            args.output,
+            {"combatReflexes": args.combat_reflexes},
+            args.db,
+            cache,
+            args.merge,
+        ).run(args.interval)
+
+
+if __name__ == "__main__":
+    main()